@@ -1,5 +1,5 @@
-import base64, os, re, datetime as dt
-from typing import List, Dict, Optional
+import base64, os, re, threading, datetime as dt
+from typing import List, Dict, Optional, Tuple
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
@@ -151,8 +151,18 @@ def _authenticate_with_cursor_browser(cred_path: str, token_path: str) -> Creden
         return _authenticate_with_system_browser(cred_path, token_path)
 
 
+# One Gmail service per thread (httplib2 connections are not thread-safe);
+# built once instead of per call, so long-lived MCP hosts reuse it
+_local = threading.local()
+
+
 def _svc():
-    return build("gmail", "v1", credentials=_creds(), cache_discovery=False)
+    svc = getattr(_local, "svc", None)
+    if svc is None:
+        svc = _local.svc = build(
+            "gmail", "v1", credentials=_creds(), cache_discovery=False
+        )
+    return svc
 
 
 def list_messages(
@@ -174,6 +184,31 @@ def list_messages(
     return resp.get("messages", [])
 
 
+def list_message_page(
+    query: str = "",
+    page_size: int = 20,
+    newer_than_days: Optional[int] = None,
+    page_token: Optional[str] = None,
+) -> Tuple[List[Dict], Optional[str]]:
+    """
+    One page of message ids for a query.
+
+    Returns:
+        tuple: (messages, next_page_token or None)
+    """
+    svc = _svc()
+    q = query or ""
+    if newer_than_days:
+        q = (q + f" newer_than:{newer_than_days}d").strip()
+    resp = (
+        svc.users()
+        .messages()
+        .list(userId="me", q=q, maxResults=page_size, pageToken=page_token or None)
+        .execute()
+    )
+    return resp.get("messages", []), resp.get("nextPageToken")
+
+
 def get_message(message_id: str) -> Dict:
     svc = _svc()
     return (
@@ -0,0 +1,312 @@
+"""
+Async Notion operations built on notion_client.AsyncClient.
+Lets MCP servers and workflows await Notion calls without blocking their
+event loop, and runs independent upserts concurrently under a semaphore.
+"""
+
+import asyncio
+import contextlib
+import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from shared.config import (
+    NOTION_TOKEN,
+    NOTION_BASE_URL,
+    NOTION_DATABASE_ID,
+    NOTION_PAGE_SIZE,
+    NOTION_UPSERT_CONCURRENCY,
+)
+from agent.notion_index import normalize_key
+from agent.notion_rate_limit import RateLimitedAsyncClient
+from agent.notion_utils import (
+    build_create_properties,
+    build_status_update,
+    build_update_properties,
+    get_filter_property_ids,
+    get_local_store,
+    get_match_index,
+    get_run_index,
+    outbox_ack,
+    outbox_append,
+    record_written_page,
+)
+from shared.notion_schema import decode_job_page
+
+# === INITIALIZE CLIENT ===
+# Shares the process-wide limiter with the sync client in notion_utils
+async_notion = RateLimitedAsyncClient(auth=NOTION_TOKEN, base_url=NOTION_BASE_URL)
+
+
+# === PAGINATED QUERIES ===
+async def aiter_query_pages(page_size: int = NOTION_PAGE_SIZE, **query):
+    """
+    Yield each result page of a databases.query, following next_cursor.
+
+    Args:
+        page_size: Entries per request (max 100)
+        **query: Extra databases.query arguments (filter, sorts, ...)
+
+    Yields:
+        list: Page objects of one response, as soon as it arrives
+    """
+    if "filter_properties" not in query:
+        property_ids = await asyncio.to_thread(get_filter_property_ids)
+        if property_ids:
+            query["filter_properties"] = property_ids
+
+    cursor = None
+    while True:
+        if cursor:
+            query["start_cursor"] = cursor
+        resp = await async_notion.databases.query(
+            database_id=NOTION_DATABASE_ID, page_size=page_size, **query
+        )
+        yield resp.get("results", [])
+        cursor = resp.get("next_cursor")
+        if not resp.get("has_more") or not cursor:
+            return
+
+
+async def aiter_recent_entries(days: int = 30, limit: int = 0):
+    """
+    Yield entries applied within the last `days` days, most recent first.
+
+    The Applied On filter and sort run in Notion, and no further page is
+    requested once `limit` entries have been yielded.
+
+    Args:
+        days: Look-back window in days
+        limit: Maximum entries to yield (0 = all in the window)
+
+    Yields:
+        list: Page objects of one response, as soon as it arrives
+    """
+    cutoff = (
+        (datetime.datetime.utcnow() - datetime.timedelta(days=days)).date().isoformat()
+    )
+    page_size = min(limit, NOTION_PAGE_SIZE) if limit > 0 else NOTION_PAGE_SIZE
+    remaining = limit
+    batches = aiter_query_pages(
+        page_size=page_size,
+        filter={"property": "Applied On", "date": {"on_or_after": cutoff}},
+        sorts=[{"property": "Applied On", "direction": "descending"}],
+    )
+    async with contextlib.aclosing(batches):
+        async for batch in batches:
+            if limit > 0:
+                batch = batch[:remaining]
+                remaining -= len(batch)
+            if batch:
+                yield batch
+            if limit > 0 and remaining <= 0:
+                return
+
+
+# === FIND EXISTING ENTRIES ===
+async def afind_entry_by_app_id(app_id: str):
+    """Async counterpart of notion_utils.find_entry_by_app_id."""
+    if not app_id:
+        return None
+
+    index = get_run_index()
+    if index is not None:
+        return index.find_by_app_id(app_id)
+
+    store = await asyncio.to_thread(get_local_store)
+    if store is not None:
+        return await asyncio.to_thread(store.find_by_app_id, app_id)
+
+    try:
+        resp = await async_notion.databases.query(
+            database_id=NOTION_DATABASE_ID,
+            filter={"property": "Application ID", "rich_text": {"equals": app_id}},
+            page_size=1,
+        )
+        results = resp.get("results", [])
+        return results[0] if results else None
+    except Exception as e:
+        print(f"[WARN] Query by Application ID failed: {e}")
+        return None
+
+
+async def afind_entry_by_company_title(company: str, job_title: str):
+    """Async counterpart of notion_utils.find_entry_by_company_title."""
+    index = get_run_index()
+    if index is None:
+        index = await asyncio.to_thread(get_match_index)
+    if index is not None:
+        return index.find_by_company_title(company, job_title)
+
+    try:
+        async for batch in aiter_query_pages(
+            filter={"property": "Company", "rich_text": {"equals": company}}
+        ):
+            for page in batch:
+                if decode_job_page(page).job_title == job_title:
+                    return page
+        return None
+    except Exception as e:
+        print(f"[WARN] Query by company/title failed: {e}")
+        return None
+
+
+# === CREATE OR UPDATE ENTRY ===
+async def acreate_or_update_entry(
+    company: str,
+    job_title: str,
+    status: str,
+    applied_on: str,
+    notes: str = "",
+    app_id: str = None,
+):
+    """
+    Async counterpart of notion_utils.create_or_update_entry.
+
+    Returns:
+        tuple: (page_result, was_updated: bool)
+    """
+    if not company or not job_title:
+        print(
+            f"[ERROR] Missing required fields: company='{company}', job_title='{job_title}'"
+        )
+        return None, False
+
+    # The outbox locks and fsyncs its file, so it runs off the event loop
+    outbox_id = await asyncio.to_thread(
+        outbox_append,
+        "create_or_update_entry",
+        company=company,
+        job_title=job_title,
+        status=status,
+        applied_on=applied_on,
+        notes=notes,
+        app_id=app_id,
+    )
+    existing_page = await afind_entry_by_app_id(app_id) if app_id else None
+    if not existing_page:
+        existing_page = await afind_entry_by_company_title(company, job_title)
+
+    try:
+        if existing_page:
+            result = await async_notion.pages.update(
+                page_id=existing_page["id"],
+                properties=build_update_properties(
+                    existing_page, status, applied_on, notes, app_id
+                ),
+            )
+            was_updated = True
+        else:
+            result = await async_notion.pages.create(
+                parent={"database_id": NOTION_DATABASE_ID},
+                properties=build_create_properties(
+                    company, job_title, status, applied_on, notes, app_id
+                ),
+            )
+            was_updated = False
+    except Exception as e:
+        action = "Update" if existing_page else "Create"
+        print(f"[ERROR] {action} failed for {company} - {job_title}: {e}")
+        return None, False
+
+    await asyncio.to_thread(record_written_page, result)
+    await asyncio.to_thread(outbox_ack, outbox_id)
+    return result, was_updated
+
+
+async def aupsert_entries(
+    applications: List[Dict[str, Any]],
+    concurrency: int = NOTION_UPSERT_CONCURRENCY,
+    timeout: Optional[float] = None,
+) -> List[Optional[Tuple[Optional[Dict[str, Any]], bool]]]:
+    """
+    Create or update many applications concurrently.
+
+    Applications sharing an Application ID or a normalized (company, job
+    title) run in order so a later status never races its own create;
+    independent ones run in parallel, at most `concurrency` Notion writes
+    at a time.
+
+    Args:
+        applications: Dicts with create_or_update_entry keyword arguments
+        timeout: Seconds before unfinished applications are cancelled
+            (None = wait for all)
+
+    Returns:
+        list: (page_result, was_updated) per application, in input order;
+        None for applications cancelled by the timeout
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout if timeout is not None else None
+    semaphore = asyncio.Semaphore(concurrency)
+    results: List[Optional[Tuple[Optional[Dict[str, Any]], bool]]] = [None] * len(
+        applications
+    )
+
+    # Items reachable through either key share a group, in input order
+    group_of: Dict[Any, int] = {}
+    groups: Dict[int, List[int]] = {}
+    for i, app in enumerate(applications):
+        keys = [normalize_key(app.get("company", ""), app.get("job_title", ""))]
+        if (app.get("app_id") or "").strip():
+            keys.append(("app_id", app["app_id"].strip()))
+        found = sorted({group_of[k] for k in keys if k in group_of})
+        group = found[0] if found else i
+        members = groups.setdefault(group, [])
+        for other in found[1:]:
+            members.extend(groups.pop(other))
+            for k, g in group_of.items():
+                if g == other:
+                    group_of[k] = group
+        if len(found) > 1:
+            members.sort()
+        members.append(i)
+        for k in keys:
+            group_of[k] = group
+
+    # Build the match index once instead of racing to build it per item
+    if get_run_index() is None:
+        await asyncio.to_thread(get_match_index)
+
+    async def run_group(indices: List[int]):
+        for i in indices:
+            async with semaphore:
+                results[i] = await acreate_or_update_entry(**applications[i])
+
+    tasks = [asyncio.create_task(run_group(indices)) for indices in groups.values()]
+    if not tasks:
+        return results
+    try:
+        remaining = max(deadline - loop.time(), 0) if deadline is not None else None
+        done, pending = await asyncio.wait(tasks, timeout=remaining)
+    finally:
+        # Also stops the writes when the caller itself is cancelled
+        for task in tasks:
+            task.cancel()
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+        unfinished = sum(result is None for result in results)
+        print(
+            f"[NOTION] Batch upsert stopped after {timeout:g}s: "
+            f"{unfinished} of {len(results)} applications not confirmed"
+        )
+    for task in done:
+        task.result()
+    return results
+
+
+# === UPDATE ENTRY ===
+async def aupdate_entry(page_id: str, status: str, notes: str = ""):
+    """Async counterpart of notion_utils.update_entry."""
+    outbox_id = await asyncio.to_thread(
+        outbox_append, "update_entry", page_id=page_id, status=status, notes=notes
+    )
+    try:
+        properties = await asyncio.to_thread(build_status_update, page_id, status, notes)
+        result = await async_notion.pages.update(page_id=page_id, properties=properties)
+    except Exception as e:
+        print(f"[WARN] Update failed: {e}")
+        return None
+
+    await asyncio.to_thread(record_written_page, result)
+    await asyncio.to_thread(outbox_ack, outbox_id)
+    return result
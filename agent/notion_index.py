@@ -0,0 +1,351 @@
+"""
+In-memory mirror of the Notion job database.
+Loaded once per run and kept current after every write, so duplicate
+lookups by Application ID or (company, job title) cost no API calls.
+Company and title are normalized (legal suffixes, casefolding,
+abbreviations), so variants such as "Google LLC / SWE II" vs
+"Google / Software Engineer II" share a key, and indexed by character
+trigrams so near-duplicates are ranked locally instead of by the LLM.
+"""
+
+import re
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from shared.config import NOTION_MATCH_THRESHOLD
+from shared.projection import project_page
+
+# === NORMALIZATION ===
+_COMPANY_SUFFIXES = {
+    "inc",
+    "incorporated",
+    "llc",
+    "llp",
+    "ltd",
+    "limited",
+    "corp",
+    "corporation",
+    "co",
+    "company",
+    "plc",
+    "gmbh",
+    "ag",
+    "sa",
+    "bv",
+    "com",
+    "pte",
+    "pty",
+    "holdings",
+    "group",
+}
+_TITLE_ABBREVIATIONS = {
+    "swe": "software engineer",
+    "sde": "software engineer",
+    "sw": "software",
+    "eng": "engineer",
+    "engr": "engineer",
+    "dev": "developer",
+    "sr": "senior",
+    "snr": "senior",
+    "jr": "junior",
+    "mgr": "manager",
+    "pm": "product manager",
+    "tpm": "technical program manager",
+    "em": "engineering manager",
+    "ml": "machine learning",
+    "ds": "data scientist",
+    "de": "data engineer",
+    "qa": "quality assurance",
+    "sre": "site reliability engineer",
+    "fe": "frontend",
+    "be": "backend",
+    "fullstack": "full stack",
+    "assoc": "associate",
+    "intl": "international",
+    "internship": "intern",
+    "i": "1",
+    "ii": "2",
+    "iii": "3",
+    "iv": "4",
+}
+# Title words that distinguish otherwise similar roles; a fuzzy match
+# must agree on all of them (plus any level numbers)
+_LEVEL_WORDS = {
+    "senior",
+    "junior",
+    "staff",
+    "principal",
+    "lead",
+    "intern",
+    "manager",
+    "director",
+    "head",
+    "associate",
+}
+_NON_WORD = re.compile(r"[^\w]+")
+
+
+def normalize_company(company: str) -> str:
+    """Casefold, drop punctuation, a leading "the" and trailing legal suffixes."""
+    words = _NON_WORD.sub(" ", (company or "").casefold()).split()
+    if len(words) > 1 and words[0] == "the":
+        words = words[1:]
+    while len(words) > 1 and words[-1] in _COMPANY_SUFFIXES:
+        words.pop()
+    return " ".join(words)
+
+
+def normalize_title(job_title: str) -> str:
+    """Casefold, drop punctuation and expand common title abbreviations."""
+    words = _NON_WORD.sub(" ", (job_title or "").casefold()).split()
+    return " ".join(_TITLE_ABBREVIATIONS.get(word, word) for word in words)
+
+
+def normalize_key(company: str, job_title: str) -> Tuple[str, str]:
+    """Normalized (company, title) so trivial variants share a key."""
+    return normalize_company(company), normalize_title(job_title)
+
+
+def title_markers(normalized_title: str) -> frozenset:
+    """Level words and numbers of a normalized title ("senior", "2", ...)."""
+    return frozenset(
+        word
+        for word in normalized_title.split()
+        if word in _LEVEL_WORDS or word.isdigit()
+    )
+
+
+def trigrams(text: str) -> Set[str]:
+    """Character trigrams of a normalized string, padded at word edges."""
+    padded = f"  {text} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)} if text else set()
+
+
+def similarity(a: Set[str], b: Set[str]) -> float:
+    """Dice coefficient of two trigram sets (1.0 = identical)."""
+    if not a or not b:
+        return 0.0
+    return 2 * len(a & b) / (len(a) + len(b))
+
+
+def same_words(a: str, b: str, threshold: float) -> bool:
+    """
+    True when every word of either normalized title has a counterpart in
+    the other that is identical or, for non-numeric words, scores at least
+    `threshold` (a typo); word order is ignored.
+    """
+    words_a, words_b = set(a.split()), set(b.split())
+
+    def covered(words: Set[str], others: Set[str]) -> bool:
+        return all(
+            word in others
+            or (
+                not word.isdigit()
+                and any(
+                    similarity(trigrams(word), trigrams(other)) >= threshold
+                    for other in others
+                )
+            )
+            for word in words
+        )
+
+    return covered(words_a, words_b) and covered(words_b, words_a)
+
+
+class NotionIndex:
+    """
+    Hash and trigram indexes over the job database pages seen in this run.
+
+    Searches run on MCP worker threads while writes upsert pages from
+    others, so every read and write holds the index lock.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self.pages: Dict[str, Dict[str, Any]] = {}
+        self.by_app_id: Dict[str, str] = {}
+        self.by_key: Dict[Tuple[str, str], str] = {}
+        # page_id -> (app_id, key, title markers) currently indexed for that page
+        self._keys: Dict[str, Tuple[str, Tuple[str, str], frozenset]] = {}
+        # Trigram indexes: distinct normalized companies -> page_ids, their
+        # trigrams and postings; per-page title trigrams and postings
+        self._companies: Dict[str, Set[str]] = {}
+        self._company_grams: Dict[str, Set[str]] = {}
+        self._company_postings: Dict[str, Set[str]] = {}
+        self._title_grams: Dict[str, Set[str]] = {}
+        self._title_postings: Dict[str, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self.pages)
+
+    def load(self, pages: Iterable[Dict[str, Any]]) -> "NotionIndex":
+        """Index pages from a full scan; the first page seen wins on key clashes."""
+        with self._lock:
+            for page in pages:
+                self._index(page, replace=False)
+        return self
+
+    def upsert(self, page: Dict[str, Any]):
+        """Insert or refresh a page after a create/update returned it."""
+        if page and page.get("id"):
+            with self._lock:
+                self._index(page, replace=True)
+
+    def find_by_app_id(self, app_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            page_id = self.by_app_id.get((app_id or "").strip())
+            return self.pages.get(page_id) if page_id else None
+
+    def find_by_company_title(
+        self, company: str, job_title: str, threshold: float = NOTION_MATCH_THRESHOLD
+    ) -> Optional[Dict[str, Any]]:
+        """
+        The page to update for (company, job title): an exact normalized-key
+        match, else a page of the same normalized company whose title scores
+        at least `threshold`, has the same level words and numbers (so
+        "Engineer I" never matches "Engineer II") and the same words up to
+        typos (so "Engineer, Ads" never matches "Engineer").
+
+        Companies are never matched fuzzily: "Capital Group" is not
+        "Capital One". Near-duplicates outside these rules are left to
+        `candidates()` for the caller to confirm.
+        """
+        company_key, title_key = normalize_key(company, job_title)
+        with self._lock:
+            page_id = self.by_key.get((company_key, title_key))
+            if page_id:
+                return self.pages.get(page_id)
+
+            markers = title_markers(title_key)
+            title_grams = trigrams(title_key)
+            best_score, best_id = 0.0, None
+            for page_id in self._companies.get(company_key, ()):
+                _, (_, other_title), other_markers = self._keys[page_id]
+                if other_markers != markers:
+                    continue
+                score = similarity(title_grams, self._title_grams[page_id])
+                if (
+                    score >= threshold
+                    and score > best_score
+                    and same_words(title_key, other_title, threshold)
+                ):
+                    best_score, best_id = score, page_id
+            return self.pages.get(best_id) if best_id else None
+
+    def candidates(
+        self,
+        company: str,
+        job_title: str = "",
+        limit: int = 5,
+        min_score: float = 0.3,
+    ) -> List[Tuple[float, float, float, Dict[str, Any]]]:
+        """
+        Rank indexed pages by trigram similarity to (company, job title).
+
+        Distinct companies sharing a trigram with the query are scored once
+        each and visited best first; titles are scored only while a company
+        can still place a page in the top `limit`. Without a company, titles
+        are searched directly; without a job title only the company is scored.
+
+        Returns:
+            list: (score, company score, title score, page), best first
+        """
+        company_grams = trigrams(normalize_company(company))
+        title_grams = trigrams(normalize_title(job_title)) if job_title else set()
+
+        with self._lock:
+            return self._rank(company_grams, title_grams, limit, min_score)
+
+    def _rank(
+        self,
+        company_grams: Set[str],
+        title_grams: Set[str],
+        limit: int,
+        min_score: float,
+    ) -> List[Tuple[float, float, float, Dict[str, Any]]]:
+        ranked: List[Tuple[float, float, float, str]] = []
+        if company_grams:
+            names: Set[str] = set()
+            for gram in company_grams:
+                names |= self._company_postings.get(gram, set())
+            by_company = sorted(
+                ((similarity(company_grams, self._company_grams[name]), name) for name in names),
+                reverse=True,
+            )
+            # Best companies first; stop once even a perfect title could not
+            # lift a page into the current top `limit`
+            for company_score, name in by_company:
+                best_possible = (company_score + 1) / 2 if title_grams else company_score
+                if best_possible < min_score or (
+                    len(ranked) >= limit and best_possible < ranked[limit - 1][0]
+                ):
+                    break
+                for page_id in self._companies[name]:
+                    if title_grams:
+                        title_score = similarity(title_grams, self._title_grams[page_id])
+                        score = (company_score + title_score) / 2
+                    else:
+                        title_score, score = 0.0, company_score
+                    if score >= min_score:
+                        ranked.append((score, company_score, title_score, page_id))
+                ranked.sort(key=lambda r: r[0], reverse=True)
+                del ranked[limit:]
+        elif title_grams:
+            page_ids: Set[str] = set()
+            for gram in title_grams:
+                page_ids |= self._title_postings.get(gram, set())
+            for page_id in page_ids:
+                title_score = similarity(title_grams, self._title_grams[page_id])
+                if title_score >= min_score:
+                    ranked.append((title_score, 0.0, title_score, page_id))
+            ranked.sort(key=lambda r: r[0], reverse=True)
+
+        return [(s, c, t, self.pages[pid]) for s, c, t, pid in ranked[:limit]]
+
+    def _index(self, page: Dict[str, Any], replace: bool):
+        page_id = page["id"]
+        fields = project_page(page)
+        app_id = fields["app_id"].strip()
+        key = normalize_key(fields["company"], fields["title"])
+
+        # Drop stale keys if the page's company/title/app_id changed
+        old_app_id, old_key, _ = self._keys.get(page_id, ("", ("", ""), frozenset()))
+        if old_app_id and self.by_app_id.get(old_app_id) == page_id:
+            del self.by_app_id[old_app_id]
+        if old_key != ("", "") and self.by_key.get(old_key) == page_id:
+            del self.by_key[old_key]
+        if page_id in self._keys:
+            self._unindex_grams(page_id, old_key)
+
+        self.pages[page_id] = page
+        self._keys[page_id] = (app_id, key, title_markers(key[1]))
+        if app_id and (replace or app_id not in self.by_app_id):
+            self.by_app_id[app_id] = page_id
+        if key != ("", "") and (replace or key not in self.by_key):
+            self.by_key[key] = page_id
+        self._index_grams(page_id, key)
+
+    def _index_grams(self, page_id: str, key: Tuple[str, str]):
+        company, title = key
+        if company not in self._companies:
+            self._companies[company] = set()
+            self._company_grams[company] = trigrams(company)
+            for gram in self._company_grams[company]:
+                self._company_postings.setdefault(gram, set()).add(company)
+        self._companies[company].add(page_id)
+
+        self._title_grams[page_id] = trigrams(title)
+        for gram in self._title_grams[page_id]:
+            self._title_postings.setdefault(gram, set()).add(page_id)
+
+    def _unindex_grams(self, page_id: str, key: Tuple[str, str]):
+        company, _ = key
+        members = self._companies.get(company)
+        if members is not None:
+            members.discard(page_id)
+            if not members:
+                del self._companies[company]
+                for gram in self._company_grams.pop(company):
+                    self._company_postings[gram].discard(company)
+        for gram in self._title_grams.pop(page_id, set()):
+            self._title_postings[gram].discard(page_id)
@@ -0,0 +1,209 @@
+"""
+Durable write-ahead outbox for Notion mutations.
+Every intended create/update is appended to a local JSONL log before it is
+sent and acknowledged after Notion accepts it, so mutations lost to a
+crash or API errors are replayed on the next run without re-running the
+LLM extraction that produced them.
+"""
+
+import contextlib
+import json
+import os
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process lock, one writer per log
+    fcntl = None
+
+from shared.config import NOTION_OUTBOX_PATH, NOTION_OUTBOX_MAX_ATTEMPTS
+
+
+class OutboxEntry:
+    """One intended mutation: an operation name and its keyword arguments."""
+
+    __slots__ = ("id", "op", "args", "attempts", "created")
+
+    def __init__(
+        self,
+        op: str,
+        args: Dict[str, Any],
+        attempts: int = 0,
+        entry_id: Optional[str] = None,
+        created: Optional[float] = None,
+    ):
+        self.id = entry_id or uuid.uuid4().hex
+        self.op = op
+        self.args = args
+        self.attempts = attempts
+        self.created = created if created is not None else time.time()
+
+    def to_record(self) -> Dict[str, Any]:
+        return {
+            "type": "intent",
+            "id": self.id,
+            "op": self.op,
+            "args": self.args,
+            "attempts": self.attempts,
+            "created": self.created,
+        }
+
+
+class NotionOutbox:
+    """
+    Append-only JSONL log of intents and acknowledgements.
+
+    An intent without a matching ack is pending. Lines are fsynced before
+    the mutation is sent; compact() rewrites the file with pending intents
+    only once they have been replayed.
+
+    Job sync and the MCP servers may share one log, so every write holds
+    an exclusive flock on "<path>.lock" and compact() re-reads the file
+    under it rather than trusting this process's view.
+    """
+
+    def __init__(self, path: str = NOTION_OUTBOX_PATH):
+        self.path = path
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        self.appended = 0
+        self.acked = 0
+        with self._lock, self._file_lock():
+            self.pending: Dict[str, OutboxEntry] = self._read()
+
+    def __len__(self) -> int:
+        return len(self.pending)
+
+    @contextlib.contextmanager
+    def _file_lock(self):
+        """Exclusive lock shared with other processes using the same log."""
+        if fcntl is None:
+            yield
+            return
+        # A sidecar file, because compact() replaces the log's inode
+        with open(f"{self.path}.lock", "a") as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def _read(self) -> Dict[str, OutboxEntry]:
+        """Pending intents in the log as written by every process."""
+        pending: Dict[str, OutboxEntry] = {}
+        if not os.path.exists(self.path):
+            return pending
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A torn last line from a crash mid-write; its send never happened
+                    continue
+                if record.get("type") == "intent":
+                    pending[record["id"]] = OutboxEntry(
+                        record["op"],
+                        record["args"],
+                        record.get("attempts", 0),
+                        record["id"],
+                        record.get("created"),
+                    )
+                elif record.get("type") == "ack":
+                    pending.pop(record["id"], None)
+        return pending
+
+    def _write(self, record: Dict[str, Any]):
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, separators=(",", ":")) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    # === WRITE-AHEAD ===
+    def append(self, op: str, args: Dict[str, Any], attempts: int = 0) -> str:
+        """Durably record an intended mutation; returns its id."""
+        entry = OutboxEntry(op, args, attempts)
+        with self._lock, self._file_lock():
+            self._write(entry.to_record())
+            self.pending[entry.id] = entry
+            self.appended += 1
+        return entry.id
+
+    def ack(self, entry_id: Optional[str]):
+        """Mark a mutation as accepted by Notion."""
+        if not entry_id:
+            return
+        with self._lock, self._file_lock():
+            if self.pending.pop(entry_id, None) is None:
+                return
+            self._write({"type": "ack", "id": entry_id})
+            self.acked += 1
+
+    # === REPLAY ===
+    def take_pending(self) -> List[OutboxEntry]:
+        """Pending intents, oldest first."""
+        with self._lock:
+            return sorted(self.pending.values(), key=lambda e: e.created)
+
+    def compact(self):
+        """
+        Rewrite the log with pending intents only (atomic replace).
+        Intents other processes appended since this one loaded the log are
+        kept, and become pending here too.
+        """
+        with self._lock, self._file_lock():
+            self.pending = self._read()
+            tmp = f"{self.path}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                for entry in sorted(self.pending.values(), key=lambda e: e.created):
+                    f.write(json.dumps(entry.to_record(), separators=(",", ":")) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.path)
+
+    def replay(
+        self,
+        handlers: Dict[str, Callable[[OutboxEntry], Any]],
+        batch_size: int = 0,
+        on_batch: Optional[Callable[[], Any]] = None,
+    ) -> Dict[str, int]:
+        """
+        Re-send pending intents through `handlers[op](entry)`.
+
+        Each replayed intent is re-appended (with attempts + 1) by the
+        handler's own write-ahead path, so the old copy is acknowledged
+        once the handler returns. Intents past NOTION_OUTBOX_MAX_ATTEMPTS
+        are dropped with a warning.
+
+        Args:
+            handlers: op name -> callable taking the pending OutboxEntry
+            batch_size: Call on_batch() after this many intents (0 = never)
+            on_batch: Hook to flush buffered writes between batches
+
+        Returns:
+            dict: replayed, dropped
+        """
+        entries = self.take_pending()
+        replayed = dropped = 0
+        for i, entry in enumerate(entries, 1):
+            if entry.attempts >= NOTION_OUTBOX_MAX_ATTEMPTS or entry.op not in handlers:
+                print(
+                    f"[OUTBOX] Dropping {entry.op} after {entry.attempts} attempts: "
+                    f"{json.dumps(entry.args)[:120]}"
+                )
+                self.ack(entry.id)
+                dropped += 1
+                continue
+
+            handlers[entry.op](entry)
+            self.ack(entry.id)
+            replayed += 1
+            if batch_size and on_batch and i % batch_size == 0:
+                on_batch()
+
+        if entries:
+            print(f"[OUTBOX] Replayed {replayed} pending Notion writes, dropped {dropped}")
+        return {"replayed": replayed, "dropped": dropped}
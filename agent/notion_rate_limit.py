@@ -0,0 +1,208 @@
+"""
+Process-wide rate limiting for Notion API calls.
+A token bucket paces every request to Notion's documented average of
+3 requests/second, honors Retry-After on 429s and retries idempotent
+reads on transient failures. Works from both sync and async code.
+"""
+
+import asyncio
+import random
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import httpx
+from notion_client import AsyncClient, Client
+from notion_client.errors import HTTPResponseError, RequestTimeoutError
+
+from shared.config import (
+    NOTION_RATE_LIMIT_RPS,
+    NOTION_RATE_LIMIT_BURST,
+    NOTION_MAX_RETRIES,
+)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Callers reserve a slot under a lock (tokens may go negative, which
+    queues later callers behind earlier ones) and then sleep outside it,
+    so the same bucket paces threads and event-loop tasks alike.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+        # Stats
+        self.requests = 0
+        self.throttled = 0
+        self.retries = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def _reserve(self) -> float:
+        """Take one token and return how long the caller must wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            self.requests += 1
+            if self.rate <= 0:
+                wait = max(0.0, self._blocked_until - now)
+            else:
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                self._tokens -= 1
+                wait = max(
+                    -self._tokens / self.rate if self._tokens < 0 else 0.0,
+                    self._blocked_until - now,
+                )
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+            return wait
+
+    def acquire(self):
+        """Block the current thread until a request may be sent."""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def aacquire(self):
+        """Wait without blocking the event loop until a request may be sent."""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def pause(self, seconds: float):
+        """Hold back every caller for `seconds` (e.g. after a 429)."""
+        with self._lock:
+            self.throttled += 1
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+    def record_retry(self):
+        """Count one retried request (called from threads and tasks alike)."""
+        with self._lock:
+            self.retries += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue-wait statistics; high waits mean Notion is the bottleneck."""
+        return {
+            "requests": self.requests,
+            "throttled": self.throttled,
+            "retries": self.retries,
+            "total_wait_s": round(self.total_wait, 3),
+            "avg_wait_ms": round(1000 * self.total_wait / self.requests, 1)
+            if self.requests
+            else 0.0,
+            "max_wait_ms": round(1000 * self.max_wait, 1),
+        }
+
+    def print_summary(self):
+        stats = self.stats()
+        print(
+            f"[NOTION] {stats['requests']} requests, {stats['throttled']} throttled (429), "
+            f"{stats['retries']} retries, queue wait {stats['total_wait_s']}s total / "
+            f"{stats['avg_wait_ms']}ms avg / {stats['max_wait_ms']}ms max"
+        )
+
+
+# Shared by every Notion client in the process
+notion_limiter = TokenBucket(NOTION_RATE_LIMIT_RPS, NOTION_RATE_LIMIT_BURST)
+
+
+def _is_read(path: str, method: str) -> bool:
+    """GETs, database queries and search never mutate and are safe to retry."""
+    return method == "GET" or path.endswith("/query") or path == "search"
+
+
+def _retry_delay(error: Exception, attempt: int, is_read: bool) -> Optional[float]:
+    """
+    Decide whether to retry a failed request.
+
+    Returns:
+        Seconds to wait before retrying, or None to give up.
+    """
+    if attempt >= NOTION_MAX_RETRIES:
+        return None
+
+    backoff = min(2**attempt, 30) + random.uniform(0, 0.5)
+    if isinstance(error, HTTPResponseError) and error.status == 429:
+        # A 429 is rejected before processing, so writes are safe to resend too
+        retry_after = error.headers.get("retry-after")
+        try:
+            return float(retry_after) if retry_after else backoff
+        except ValueError:
+            return backoff
+    if not is_read:
+        return None
+    if isinstance(error, HTTPResponseError) and error.status >= 500:
+        return backoff
+    if isinstance(error, (RequestTimeoutError, httpx.TransportError)):
+        return backoff
+    return None
+
+
+class RateLimitedClient(Client):
+    """notion_client.Client that paces and retries through notion_limiter."""
+
+    def request(
+        self,
+        path: str,
+        method: str,
+        query: Optional[Dict[Any, Any]] = None,
+        body: Optional[Dict[Any, Any]] = None,
+        form_data: Optional[Dict[Any, Any]] = None,
+        auth: Optional[str] = None,
+    ) -> Any:
+        is_read = _is_read(path, method)
+        attempt = 0
+        while True:
+            notion_limiter.acquire()
+            try:
+                return super().request(path, method, query, body, form_data, auth)
+            except (HTTPResponseError, RequestTimeoutError, httpx.TransportError) as e:
+                delay = _retry_delay(e, attempt, is_read)
+                if delay is None:
+                    raise
+                if isinstance(e, HTTPResponseError) and e.status == 429:
+                    notion_limiter.pause(delay)
+                else:
+                    time.sleep(delay)
+                notion_limiter.record_retry()
+                attempt += 1
+
+
+class RateLimitedAsyncClient(AsyncClient):
+    """notion_client.AsyncClient that paces and retries through notion_limiter."""
+
+    async def request(
+        self,
+        path: str,
+        method: str,
+        query: Optional[Dict[Any, Any]] = None,
+        body: Optional[Dict[Any, Any]] = None,
+        form_data: Optional[Dict[Any, Any]] = None,
+        auth: Optional[str] = None,
+    ) -> Any:
+        is_read = _is_read(path, method)
+        attempt = 0
+        while True:
+            await notion_limiter.aacquire()
+            try:
+                return await super().request(path, method, query, body, form_data, auth)
+            except (HTTPResponseError, RequestTimeoutError, httpx.TransportError) as e:
+                delay = _retry_delay(e, attempt, is_read)
+                if delay is None:
+                    raise
+                if isinstance(e, HTTPResponseError) and e.status == 429:
+                    notion_limiter.pause(delay)
+                else:
+                    await asyncio.sleep(delay)
+                notion_limiter.record_retry()
+                attempt += 1
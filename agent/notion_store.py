@@ -0,0 +1,210 @@
+"""
+Persistent SQLite copy of the Notion job database.
+Refreshed incrementally with a last_edited_time filter from a stored
+high-water mark, with a periodic full scan to reconcile deletions, so
+weekly reports and duplicate lookups read locally.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from shared.config import NOTION_CACHE_PATH, NOTION_FULL_SCAN_HOURS
+from shared.projection import project_page
+from agent.notion_utils import iter_query_pages
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    id TEXT PRIMARY KEY,
+    company TEXT,
+    job_title TEXT,
+    status TEXT,
+    applied_on TEXT,
+    app_id TEXT,
+    last_edited_time TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS pages_applied_on ON pages (applied_on);
+CREATE INDEX IF NOT EXISTS pages_app_id ON pages (app_id);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# Only rows whose stored page differs are rewritten
+_UPSERT = """
+INSERT INTO pages VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (id) DO UPDATE SET
+    company = excluded.company,
+    job_title = excluded.job_title,
+    status = excluded.status,
+    applied_on = excluded.applied_on,
+    app_id = excluded.app_id,
+    last_edited_time = excluded.last_edited_time,
+    data = excluded.data
+WHERE pages.data != excluded.data
+"""
+
+
+class NotionLocalStore:
+    """SQLite mirror of the job database with delta refresh."""
+
+    def __init__(self, path: str = NOTION_CACHE_PATH):
+        self.path = path
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        # Bumped whenever page content changes, so derived data (e.g. the
+        # weekly aggregate) is recomputed only after a real change
+        self.revision = 0
+        with self._lock, self._conn:
+            self._conn.executescript(_SCHEMA)
+
+    # === META ===
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str):
+        self._conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value)
+        )
+
+    @property
+    def high_water_mark(self) -> Optional[str]:
+        return self._get_meta("high_water_mark")
+
+    # === REFRESH ===
+    def refresh(self, full: bool = False) -> Dict[str, Any]:
+        """
+        Bring the local copy up to date with Notion.
+
+        Runs a delta query for pages edited since the high-water mark, or a
+        full scan (which also drops deleted pages) when forced, on first
+        use, or when the last full scan is older than NOTION_FULL_SCAN_HOURS.
+
+        Returns:
+            dict: mode, pages fetched, pages deleted, elapsed seconds
+        """
+        started = time.perf_counter()
+        hwm = self.high_water_mark
+        last_full = float(self._get_meta("last_full_scan") or 0)
+        if not hwm or time.time() - last_full > NOTION_FULL_SCAN_HOURS * 3600:
+            full = True
+
+        query = {}
+        if not full:
+            # Notion rounds last_edited_time to the minute, so on_or_after
+            # re-reads the boundary minute instead of missing edits in it
+            query["filter"] = {
+                "timestamp": "last_edited_time",
+                "last_edited_time": {"on_or_after": hwm},
+            }
+
+        fetched = 0
+        seen = set()
+        new_hwm = hwm or ""
+        for batch in iter_query_pages(**query):
+            self.upsert_pages(batch)
+            fetched += len(batch)
+            for page in batch:
+                seen.add(page["id"])
+                new_hwm = max(new_hwm, page.get("last_edited_time", ""))
+
+        deleted = 0
+        with self._lock, self._conn:
+            if full:
+                local_ids = {r[0] for r in self._conn.execute("SELECT id FROM pages")}
+                stale = local_ids - seen
+                self._conn.executemany(
+                    "DELETE FROM pages WHERE id = ?", [(i,) for i in stale]
+                )
+                deleted = len(stale)
+                if stale:
+                    self.revision += 1
+                self._set_meta("last_full_scan", str(time.time()))
+            if new_hwm:
+                self._set_meta("high_water_mark", new_hwm)
+
+        stats = {
+            "mode": "full" if full else "delta",
+            "fetched": fetched,
+            "deleted": deleted,
+            "seconds": round(time.perf_counter() - started, 2),
+        }
+        print(
+            f"[STORE] {stats['mode']} refresh: {fetched} fetched, {deleted} deleted "
+            f"in {stats['seconds']}s"
+        )
+        return stats
+
+    # === WRITES ===
+    def upsert_pages(self, pages: List[Dict[str, Any]]):
+        """
+        Insert or replace pages (e.g. after a refresh or a local write).
+        Pages identical to the stored copy are left untouched and do not
+        bump the revision.
+        """
+        rows = []
+        for page in pages:
+            fields = project_page(page)
+            rows.append(
+                (
+                    page["id"],
+                    fields["company"],
+                    fields["title"],
+                    fields["status"],
+                    fields["date"],
+                    fields["app_id"],
+                    page.get("last_edited_time", ""),
+                    json.dumps(page),
+                )
+            )
+        with self._lock, self._conn:
+            before = self._conn.total_changes
+            self._conn.executemany(_UPSERT, rows)
+            if self._conn.total_changes != before:
+                self.revision += 1
+
+    # === READS ===
+    def all_pages(self) -> List[Dict[str, Any]]:
+        return [json.loads(r[0]) for r in self._conn.execute("SELECT data FROM pages")]
+
+    def pages_applied_since(self, cutoff: str) -> List[Dict[str, Any]]:
+        """Pages whose Applied On date is on or after `cutoff` (YYYY-MM-DD)."""
+        return [
+            json.loads(r[0])
+            for r in self._conn.execute(
+                "SELECT data FROM pages WHERE applied_on >= ? ORDER BY applied_on DESC",
+                (cutoff,),
+            )
+        ]
+
+    def get_page(self, page_id: str) -> Optional[Dict[str, Any]]:
+        row = self._conn.execute(
+            "SELECT data FROM pages WHERE id = ?", (page_id,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def find_by_app_id(self, app_id: str) -> Optional[Dict[str, Any]]:
+        row = self._conn.execute(
+            "SELECT data FROM pages WHERE app_id = ? LIMIT 1", (app_id,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def find_by_company_title(
+        self, company: str, job_title: str
+    ) -> Optional[Dict[str, Any]]:
+        row = self._conn.execute(
+            "SELECT data FROM pages WHERE company = ? AND job_title = ? LIMIT 1",
+            (company, job_title),
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
@@ -1,8 +1,436 @@
-from notion_client import Client as NotionClient
-from shared.config import NOTION_TOKEN, NOTION_DATABASE_ID
+from contextvars import ContextVar
+
+from shared.config import (
+    NOTION_TOKEN,
+    NOTION_BASE_URL,
+    NOTION_DATABASE_ID,
+    NOTION_PAGE_SIZE,
+    NOTION_CACHE_PATH,
+    NOTION_STORE_MAX_STALENESS,
+    NOTION_FILTER_PROPERTIES,
+    NOTION_OUTBOX_PATH,
+    NOTION_OUTBOX_REPLAY_BATCH,
+    NOTION_MATCH_THRESHOLD,
+    NOTION_SEARCH_MIN_SCORE,
+)
+from shared.notion_schema import decode_job_page, JOB_PROPERTY_NAMES
+from agent.notion_rate_limit import RateLimitedClient
 
 # === INITIALIZE CLIENT ===
-notion = NotionClient(auth=NOTION_TOKEN)
+# Every request is paced by the process-wide limiter and retried on 429
+notion = RateLimitedClient(auth=NOTION_TOKEN, base_url=NOTION_BASE_URL)
+
+# Notion API limits for a rich_text property
+NOTION_RICH_TEXT_LIMIT = 2000
+NOTION_RICH_TEXT_MAX_CHUNKS = 100
+
+# Property IDs requested via filter_properties (resolved on first query)
+_filter_property_ids = None
+
+# Per-run mirror of the job database (None until load_run_index is called)
+_run_index = None
+
+# Persistent SQLite copy of the job database (created on first use)
+_local_store = None
+_local_store_refreshed = 0.0
+
+# Per-run update coalescing (None until start_write_buffer is called)
+_write_buffer = None
+
+# Fuzzy-match index over the local store when no run index is loaded
+_match_index = None
+_match_index_built = 0.0
+
+# Write-ahead log of mutations (opened on first write)
+_outbox = None
+# Attempt count of the intent being replayed, carried into its re-appended
+# copy; per thread and task, so concurrent writes never pick up another's
+_outbox_attempts = ContextVar("outbox_attempts", default=0)
+
+# Weekly aggregates by (days, date) with the local store revision they were
+# computed at; reused until the store's pages change
+_weekly_cache = {}
+
+
+# === PAGINATED QUERIES ===
+def get_filter_property_ids():
+    """
+    Property IDs of the fields JOB_SCHEMA decodes, for filter_properties.
+    Resolved once per process with databases.retrieve; None disables filtering.
+    """
+    global _filter_property_ids
+    if not NOTION_FILTER_PROPERTIES:
+        return None
+    if _filter_property_ids is None:
+        try:
+            db = notion.databases.retrieve(database_id=NOTION_DATABASE_ID)
+            properties = db.get("properties", {})
+            _filter_property_ids = [
+                properties[name]["id"]
+                for name in JOB_PROPERTY_NAMES
+                if name in properties
+            ]
+        except Exception as e:
+            print(f"[WARN] Could not resolve property IDs, fetching all properties: {e}")
+            _filter_property_ids = []
+    return _filter_property_ids or None
+
+
+def iter_query_pages(page_size: int = NOTION_PAGE_SIZE, **query):
+    """
+    Yield each result page of a databases.query, following next_cursor.
+
+    Args:
+        page_size: Entries per request (max 100)
+        **query: Extra databases.query arguments (filter, sorts, ...)
+
+    Yields:
+        list: Page objects of one response, as soon as it arrives
+    """
+    if "filter_properties" not in query:
+        property_ids = get_filter_property_ids()
+        if property_ids:
+            query["filter_properties"] = property_ids
+
+    cursor = None
+    while True:
+        if cursor:
+            query["start_cursor"] = cursor
+        resp = notion.databases.query(
+            database_id=NOTION_DATABASE_ID, page_size=page_size, **query
+        )
+        yield resp.get("results", [])
+        cursor = resp.get("next_cursor")
+        if not resp.get("has_more") or not cursor:
+            return
+
+
+def query_all_entries(**query):
+    """
+    Fetch every matching entry of a databases.query.
+
+    Returns:
+        list: All matching page objects
+    """
+    return [entry for batch in iter_query_pages(**query) for entry in batch]
+
+
+# === LOCAL STORE (persistent SQLite copy) ===
+def get_local_store(refresh: bool = True):
+    """
+    Return the persistent local store, or None when NOTION_CACHE_PATH is empty.
+
+    With refresh=True the store is delta-refreshed from Notion first, at
+    most once every NOTION_STORE_MAX_STALENESS seconds.
+    """
+    global _local_store, _local_store_refreshed
+    if not NOTION_CACHE_PATH:
+        return None
+
+    import time
+
+    try:
+        if _local_store is None:
+            from agent.notion_store import NotionLocalStore
+
+            _local_store = NotionLocalStore(NOTION_CACHE_PATH)
+        if refresh and time.time() - _local_store_refreshed > NOTION_STORE_MAX_STALENESS:
+            _local_store.refresh()
+            _local_store_refreshed = time.time()
+    except Exception as e:
+        print(f"[WARN] Local Notion store unavailable, using live queries: {e}")
+        return None
+    return _local_store
+
+
+def get_cached_page(page_id: str):
+    """
+    Latest snapshot of a page from the run index or local store, without
+    calling Notion. Returns None when neither has seen the page.
+    """
+    if _run_index is not None and page_id in _run_index.pages:
+        return _run_index.pages[page_id]
+    store = get_local_store(refresh=False)
+    return store.get_page(page_id) if store is not None else None
+
+
+def cache_page_snapshots(pages):
+    """Remember pages just read from Notion so later updates can skip a retrieve."""
+    store = get_local_store(refresh=False)
+    if store is not None and pages:
+        store.upsert_pages(pages)
+        if _match_index is not None:
+            for page in pages:
+                _match_index.upsert(page)
+
+
+def record_written_page(page):
+    """Keep the run index and local store current after a create/update."""
+    if not page:
+        return
+    if _run_index is not None:
+        _run_index.upsert(page)
+    if _match_index is not None:
+        _match_index.upsert(page)
+    if _local_store is not None:
+        _local_store.upsert_pages([page])
+
+
+# === RUN INDEX (in-memory mirror) ===
+def load_run_index():
+    """
+    Load the whole job database into an in-memory index for this run.
+    After this, duplicate lookups cost zero API calls.
+    """
+    global _run_index
+    from agent.notion_index import NotionIndex
+
+    try:
+        store = get_local_store()
+        pages = store.all_pages() if store is not None else query_all_entries()
+        _run_index = NotionIndex().load(pages)
+        source = "local store" if store is not None else "Notion"
+        print(f"[INDEX] Loaded {len(_run_index)} entries from {source}")
+    except Exception as e:
+        print(f"[WARN] Could not load Notion index, using live queries: {e}")
+        _run_index = None
+    return _run_index
+
+
+def get_run_index():
+    """Return the loaded run index, or None if lookups go to the API."""
+    return _run_index
+
+
+def get_match_index(refresh: bool = True):
+    """
+    Index for company/title matching: the run index when loaded, otherwise
+    one built over the local store and rebuilt after each store refresh.
+    Returns None when neither is available.
+    """
+    global _match_index, _match_index_built
+    if _run_index is not None:
+        return _run_index
+
+    store = get_local_store(refresh=refresh)
+    if store is None:
+        return None
+
+    import time
+
+    from agent.notion_index import NotionIndex
+
+    if _match_index is None or _match_index_built < _local_store_refreshed:
+        _match_index = NotionIndex().load(store.all_pages())
+        _match_index_built = time.time()
+    return _match_index
+
+
+def clear_run_index():
+    """Drop the run index (e.g. at the end of a run)."""
+    global _run_index
+    _run_index = None
+
+
+# === WRITE BUFFER (update coalescing) ===
+def _send_buffered_update(pending):
+    """Flush one coalesced PendingUpdate as a single pages.update."""
+    update_props = build_update_properties(
+        pending.base_page, pending.status, pending.status_date, app_id=pending.app_id
+    )
+    new_notes = merge_notes(pending.base_page, pending.note_updates())
+    if new_notes is not None:
+        update_props["Notes"] = notes_rich_text(new_notes)
+
+    result = notion.pages.update(page_id=pending.page_id, properties=update_props)
+    record_written_page(result)
+    for outbox_id in pending.outbox_ids:
+        outbox_ack(outbox_id)
+    return result
+
+
+def start_write_buffer():
+    """Coalesce updates to the same page until flush_write_buffer is called."""
+    global _write_buffer
+    from agent.notion_write_buffer import NotionWriteBuffer
+
+    _write_buffer = NotionWriteBuffer(_send_buffered_update)
+    return _write_buffer
+
+
+def flush_write_buffer(stop: bool = True):
+    """Send pending coalesced updates; stop buffering unless stop=False."""
+    global _write_buffer
+    if _write_buffer is None:
+        return []
+    results = _write_buffer.flush()
+    if stop:
+        _write_buffer = None
+    return results
+
+
+# === OUTBOX (write-ahead log) ===
+def get_outbox():
+    """Return the write-ahead outbox, or None when NOTION_OUTBOX_PATH is empty."""
+    global _outbox
+    if not NOTION_OUTBOX_PATH:
+        return None
+    if _outbox is None:
+        from agent.notion_outbox import NotionOutbox
+
+        try:
+            _outbox = NotionOutbox(NOTION_OUTBOX_PATH)
+        except OSError as e:
+            print(f"[WARN] Notion outbox unavailable, writes are not logged: {e}")
+            return None
+    return _outbox
+
+
+def outbox_append(op: str, **args):
+    """Durably log an intended mutation before sending it; returns its id."""
+    outbox = get_outbox()
+    if outbox is None:
+        return None
+    try:
+        return outbox.append(op, args, _outbox_attempts.get())
+    except OSError as e:
+        print(f"[WARN] Could not log {op} to the outbox: {e}")
+        return None
+
+
+def outbox_ack(outbox_id):
+    """Mark a logged mutation as accepted by Notion."""
+    if outbox_id and _outbox is not None:
+        _outbox.ack(outbox_id)
+
+
+def _replay_with(func):
+    def handler(entry):
+        token = _outbox_attempts.set(entry.attempts + 1)
+        try:
+            func(**entry.args)
+        finally:
+            _outbox_attempts.reset(token)
+
+    return handler
+
+
+def replay_outbox():
+    """
+    Re-send mutations a previous run logged but never got acknowledged.
+
+    Call after load_run_index/start_write_buffer so replays dedupe against
+    the mirror and coalesce; buffered updates are flushed every
+    NOTION_OUTBOX_REPLAY_BATCH intents.
+    """
+    outbox = get_outbox()
+    if outbox is None or not len(outbox):
+        return {"replayed": 0, "dropped": 0}
+
+    print(f"[OUTBOX] {len(outbox)} unacknowledged Notion writes from a previous run")
+    stats = outbox.replay(
+        {
+            "create_or_update_entry": _replay_with(create_or_update_entry),
+            "update_entry": _replay_with(update_entry),
+        },
+        batch_size=NOTION_OUTBOX_REPLAY_BATCH,
+        on_batch=lambda: flush_write_buffer(stop=False),
+    )
+    return stats
+
+
+def compact_outbox():
+    """Drop acknowledged intents from the log (e.g. at the end of a run)."""
+    if _outbox is not None:
+        _outbox.compact()
+        if len(_outbox):
+            print(f"[OUTBOX] {len(_outbox)} Notion writes pending for the next run")
+
+
+# === PROPERTY BUILDERS ===
+def notes_rich_text(text: str):
+    """
+    Notes as a rich_text property split into 2000-character chunks.
+
+    Notion caps each text object at 2000 characters and a rich_text array
+    at 100 objects; past that the oldest notes are dropped.
+    """
+    limit = NOTION_RICH_TEXT_LIMIT
+    max_chars = limit * NOTION_RICH_TEXT_MAX_CHUNKS
+    if len(text) > max_chars:
+        text = text[-max_chars:]
+    chunks = [text[i : i + limit] for i in range(0, len(text), limit)] or [""]
+    return {"rich_text": [{"text": {"content": chunk}} for chunk in chunks]}
+
+
+def build_create_properties(
+    company: str,
+    job_title: str,
+    status: str,
+    applied_on: str,
+    notes: str = "",
+    app_id: str = None,
+):
+    """Build the property payload for a new job application page."""
+    properties = {
+        "Title": {"title": [{"text": {"content": f"{company} - {job_title}"}}]},
+        "Company": {"rich_text": [{"text": {"content": company}}]},
+        "Job Title": {"rich_text": [{"text": {"content": job_title}}]},
+        "Status": {"status": {"name": status}},
+        "Applied On": {"date": {"start": applied_on}},
+        "Notes": notes_rich_text(notes or ""),
+    }
+
+    # Add Application ID if provided
+    if app_id:
+        properties["Application ID"] = {"rich_text": [{"text": {"content": app_id}}]}
+
+    return properties
+
+
+def merge_notes(existing_page: dict, updates):
+    """
+    Append "[Update date] note" lines to a page's notes.
+
+    Args:
+        existing_page: Page snapshot holding the current notes
+        updates: (date, note) pairs in the order they should appear
+
+    Returns:
+        str: The merged notes, or None when nothing new was added
+    """
+    notes_text = decode_job_page(existing_page).notes
+
+    changed = False
+    for date, note in updates:
+        if note and note not in notes_text:
+            notes_text = f"{notes_text}\n\n[Update {date}] {note}".strip()
+            changed = True
+    return notes_text if changed else None
+
+
+def build_update_properties(
+    existing_page: dict,
+    status: str,
+    applied_on: str,
+    notes: str = "",
+    app_id: str = None,
+):
+    """Build the property payload that moves an existing page to a new status."""
+    update_props = {
+        "Status": {"status": {"name": status}},
+    }
+
+    # Add Application ID if provided and not already set
+    if app_id:
+        update_props["Application ID"] = {"rich_text": [{"text": {"content": app_id}}]}
+
+    # Append to notes if new information
+    new_notes = merge_notes(existing_page, [(applied_on, notes)] if notes else [])
+    if new_notes is not None:
+        update_props["Notes"] = notes_rich_text(new_notes)
+
+    return update_props
 
 
 # === CREATE OR UPDATE ENTRY ===
@@ -35,6 +463,17 @@ def create_or_update_entry(
         )
         return None, False
 
+    # Log the intent first so a failed or interrupted write is replayed
+    outbox_id = outbox_append(
+        "create_or_update_entry",
+        company=company,
+        job_title=job_title,
+        status=status,
+        applied_on=applied_on,
+        notes=notes,
+        app_id=app_id,
+    )
+
     # Check if entry already exists by Application ID first
     existing_page = None
     if app_id:
@@ -48,48 +487,27 @@ def create_or_update_entry(
         if existing_page:
             print(f"[FOUND] Existing entry for {company} - {job_title}")
 
+    # Coalesce with other updates to this page in the current run
+    if existing_page and _write_buffer is not None:
+        _write_buffer.add(existing_page, status, applied_on, notes, app_id, outbox_id)
+        print(f"[BUFFER] Queued update for {company} - {job_title} -> {status}")
+        return existing_page, True
+
     # UPDATE existing entry
     if existing_page:
         try:
-            old_status = (
-                existing_page.get("properties", {})
-                .get("Status", {})
-                .get("status", {})
-                .get("name", "Unknown")
-            )
+            old_status = decode_job_page(existing_page).status or "Unknown"
             print(f"[UPDATE] Updating status: {old_status} -> {status}")
 
-            update_props = {
-                "Status": {"status": {"name": status}},
-            }
-
-            # Add Application ID if provided and not already set
-            if app_id:
-                update_props["Application ID"] = {
-                    "rich_text": [{"text": {"content": app_id}}]
-                }
-
-            # Append to notes if new information
-            if notes:
-                old_notes = (
-                    existing_page.get("properties", {})
-                    .get("Notes", {})
-                    .get("rich_text", [])
-                )
-                old_notes_text = (
-                    old_notes[0].get("text", {}).get("content", "") if old_notes else ""
-                )
-                if notes not in old_notes_text:
-                    new_notes = (
-                        f"{old_notes_text}\n\n[Update {applied_on}] {notes}".strip()
-                    )
-                    update_props["Notes"] = {
-                        "rich_text": [{"text": {"content": new_notes}}]
-                    }
+            update_props = build_update_properties(
+                existing_page, status, applied_on, notes, app_id
+            )
 
             result = notion.pages.update(
                 page_id=existing_page["id"], properties=update_props
             )
+            record_written_page(result)
+            outbox_ack(outbox_id)
 
             print(f"   [OK] Updated entry! ID: {result['id'][:8]}...")
             return result, True
@@ -111,24 +529,15 @@ def create_or_update_entry(
         if app_id:
             print(f"   Application ID: {app_id}")
 
-        properties = {
-            "Title": {"title": [{"text": {"content": f"{company} - {job_title}"}}]},
-            "Company": {"rich_text": [{"text": {"content": company}}]},
-            "Job Title": {"rich_text": [{"text": {"content": job_title}}]},
-            "Status": {"status": {"name": status}},
-            "Applied On": {"date": {"start": applied_on}},
-            "Notes": {"rich_text": [{"text": {"content": notes or ""}}]},
-        }
-
-        # Add Application ID if provided
-        if app_id:
-            properties["Application ID"] = {
-                "rich_text": [{"text": {"content": app_id}}]
-            }
+        properties = build_create_properties(
+            company, job_title, status, applied_on, notes, app_id
+        )
 
         result = notion.pages.create(
             parent={"database_id": NOTION_DATABASE_ID}, properties=properties
         )
+        record_written_page(result)
+        outbox_ack(outbox_id)
 
         print(f"   [OK] Created in Notion! ID: {result['id'][:8]}...")
         return result, False
@@ -154,6 +563,13 @@ def find_entry_by_app_id(app_id: str):
     if not app_id:
         return None
 
+    if _run_index is not None:
+        return _run_index.find_by_app_id(app_id)
+
+    store = get_local_store()
+    if store is not None:
+        return store.find_by_app_id(app_id)
+
     try:
         resp = notion.databases.query(
             database_id=NOTION_DATABASE_ID,
@@ -170,24 +586,23 @@ def find_entry_by_app_id(app_id: str):
 def find_entry_by_company_title(company: str, job_title: str):
     """
     Search for an existing entry by company and job title.
-    Fallback when no Application ID is provided.
+    Fallback when no Application ID is provided. Locally, names are
+    normalized and, within the same company, titles matched up to typos;
+    other near-duplicates come from find_possible_duplicates. The live
+    API fallback only finds exact matches.
     """
-    try:
-        # Query by company first
-        resp = notion.databases.query(
-            database_id=NOTION_DATABASE_ID,
-            filter={"property": "Company", "rich_text": {"equals": company}},
-        )
+    index = get_match_index()
+    if index is not None:
+        return index.find_by_company_title(company, job_title)
 
-        # Then filter by job title in results
-        for page in resp.get("results", []):
-            props = page.get("properties", {})
-            page_title = props.get("Job Title", {}).get("rich_text", [])
-            if (
-                page_title
-                and page_title[0].get("text", {}).get("content", "") == job_title
-            ):
-                return page
+    try:
+        # Query by company first, then filter by job title page by page
+        for batch in iter_query_pages(
+            filter={"property": "Company", "rich_text": {"equals": company}}
+        ):
+            for page in batch:
+                if decode_job_page(page).job_title == job_title:
+                    return page
 
         return None
     except Exception as e:
@@ -195,6 +610,61 @@ def find_entry_by_company_title(company: str, job_title: str):
         return None
 
 
+# === SIMILARITY SEARCH ===
+def search_similar_entries(company: str, job_title: str = "", limit: int = 10):
+    """
+    Rank local entries by trigram similarity of company and job title.
+
+    Served from the run index or local store (refreshed in bulk at most every
+    NOTION_STORE_MAX_STALENESS seconds), so no per-search Notion query.
+
+    Returns:
+        list: Entry dicts with score, company_score and title_score, best
+        first; None when no local index is available
+    """
+    index = get_match_index()
+    if index is None:
+        return None
+
+    entries = []
+    for score, company_score, title_score, page in index.candidates(
+        company, job_title, limit=limit, min_score=NOTION_SEARCH_MIN_SCORE
+    ):
+        record = decode_job_page(page)
+        entries.append(
+            {
+                "id": record.id,
+                "company": record.company,
+                "job_title": record.job_title,
+                "status": record.status,
+                "applied_on": record.applied_on,
+                "notes": record.notes,
+                "app_id": record.app_id,
+                "score": round(score, 3),
+                "company_score": round(company_score, 3),
+                "title_score": round(title_score, 3),
+            }
+        )
+    return entries
+
+
+def find_possible_duplicates(company: str, job_title: str, limit: int = 3):
+    """
+    Near-duplicates that find_entry_by_company_title will not update on its
+    own (a similar company name, an extra title word), for the caller or
+    LLM to confirm before merging via update_entry.
+
+    Returns:
+        list: search_similar_entries dicts whose company and title both
+        score at least NOTION_MATCH_THRESHOLD (empty without a local index)
+    """
+    return [
+        entry
+        for entry in search_similar_entries(company, job_title, limit) or []
+        if min(entry["company_score"], entry["title_score"]) >= NOTION_MATCH_THRESHOLD
+    ]
+
+
 # === QUERY ENTRIES (used for weekly summary) ===
 def query_recent_entries(days: int = 7):
     """
@@ -206,31 +676,81 @@ def query_recent_entries(days: int = 7):
         (datetime.datetime.utcnow() - datetime.timedelta(days=days)).date().isoformat()
     )
     try:
-        resp = notion.databases.query(
-            **{
-                "database_id": NOTION_DATABASE_ID,
-                "filter": {
-                    "property": "Applied On",
-                    "date": {"on_or_after": cutoff},
-                },
+        store = get_local_store()
+        if store is not None:
+            return store.pages_applied_since(cutoff)
+
+        return query_all_entries(
+            filter={
+                "property": "Applied On",
+                "date": {"on_or_after": cutoff},
             }
         )
-        return resp.get("results", [])
     except Exception as e:
         print("[WARN] Query failed:", e)
         return []
 
 
 # === UPDATE ENTRY (optional) ===
-def update_entry(page_id: str, status: str):
+def build_status_update(page_id: str, status: str, notes: str = ""):
+    """
+    Property payload for a status change that appends `notes`.
+
+    Old notes come from the cached page snapshot, so the update costs a
+    single pages.update; only a page never seen locally is retrieved first.
+    """
+    update_props = {"Status": {"status": {"name": status}}}
+    if not notes:
+        return update_props
+
+    snapshot = get_cached_page(page_id)
+    if snapshot is None:
+        print(f"[NOTION] No cached snapshot for {page_id[:8]}, retrieving page")
+        snapshot = notion.pages.retrieve(page_id=page_id)
+
+    import datetime
+
+    today = datetime.date.today().isoformat()
+    new_notes = merge_notes(snapshot, [(today, notes)])
+    if new_notes is not None:
+        update_props["Notes"] = notes_rich_text(new_notes)
+    return update_props
+
+
+def update_entry(page_id: str, status: str, notes: str = ""):
     """
     Update the status or notes of an existing Notion page.
+
+    While the write buffer is active the change is queued with any other
+    pending update to the page, so a later flush from an older snapshot
+    cannot overwrite it.
     """
+    outbox_id = outbox_append("update_entry", page_id=page_id, status=status, notes=notes)
     try:
-        return notion.pages.update(
+        if _write_buffer is not None:
+            import datetime
+
+            base_page = get_cached_page(page_id) or notion.pages.retrieve(
+                page_id=page_id
+            )
+            # Dated today, so it wins over the emails seen in this run
+            _write_buffer.add(
+                base_page,
+                status,
+                datetime.date.today().isoformat(),
+                notes,
+                outbox_id=outbox_id,
+            )
+            print(f"[BUFFER] Queued update for {page_id[:8]} -> {status}")
+            return base_page
+
+        result = notion.pages.update(
             page_id=page_id,
-            properties={"Status": {"status": {"name": status}}},
+            properties=build_status_update(page_id, status, notes),
         )
+        record_written_page(result)
+        outbox_ack(outbox_id)
+        return result
     except Exception as e:
         print("[WARN] Update failed:", e)
         return None
@@ -289,93 +809,84 @@ def get_weekly_application_data(days: int = 7):
     """
     Fetch and aggregate job application data from the last X days.
 
+    Entries are fetched once for the longest trend window and aggregated
+    in one vectorized pass, so the multi-week trends cost no extra queries.
+    With the local store enabled the aggregate is cached and recomputed
+    only when the store's pages change (or the date rolls over).
+
     Returns:
-        dict: Aggregated data with counts, deadlines, and detailed entries
+        dict: Aggregated data with counts, trends, deadlines, and detailed entries
     """
+    import copy
+    import datetime
+
+    from shared.config import WEEKLY_DEADLINE_HORIZON_DAYS, WEEKLY_DEADLINE_LIMIT
+    from shared.deadlines import upcoming_deadlines
+    from shared.weekly_stats import TREND_WINDOWS_WEEKS, aggregate_trends
+
     try:
-        entries = query_recent_entries(days)
+        today = datetime.datetime.utcnow().date()
+        # Delta-refreshes the store (throttled) before its revision is read
+        store = get_local_store()
+        revision = store.revision if store is not None else None
+        key = (days, today.isoformat())
+        cached = _weekly_cache.get(key)
+        if revision is not None and cached is not None and cached[0] == revision:
+            return copy.deepcopy(cached[1])
+
+        lookback = max(days, 7 * max(TREND_WINDOWS_WEEKS))
+        records = [decode_job_page(entry) for entry in query_recent_entries(lookback)]
+
+        trends = aggregate_trends(records, today, days)
+        period = trends["windows"][trends["period"]]
+        # Same window as the period counts: today and the days - 1 before it
+        cutoff = (today - datetime.timedelta(days=days - 1)).isoformat()
 
-        # Initialize counters
         data = {
-            "total": len(entries),
-            "applied": 0,
-            "interview": 0,
-            "offer": 0,
-            "rejected": 0,
-            "assessment": 0,
+            "total": period["total"],
+            "applied": period["applied"],
+            "interview": period["interview"],
+            "offer": period["offer"],
+            "rejected": period["rejected"],
+            "assessment": period["assessment"],
+            "trends": trends,
             "deadlines": [],
             "entries": [],
         }
 
-        for entry in entries:
-            props = entry.get("properties", {})
-
-            # Extract basic info
-            company = props.get("Company", {}).get("rich_text", [])
-            company_name = (
-                company[0].get("text", {}).get("content", "Unknown")
-                if company
-                else "Unknown"
-            )
-
-            job_title = props.get("Job Title", {}).get("rich_text", [])
-            job_title_text = (
-                job_title[0].get("text", {}).get("content", "Unknown")
-                if job_title
-                else "Unknown"
+        # Only dated, still-upcoming deadlines, soonest first
+        for deadline in upcoming_deadlines(
+            records, today, WEEKLY_DEADLINE_HORIZON_DAYS, WEEKLY_DEADLINE_LIMIT
+        ):
+            data["deadlines"].append(
+                {
+                    "company": deadline.company,
+                    "job_title": deadline.job_title,
+                    "due": deadline.due.isoformat(),
+                    "note": deadline.note[:200],
+                }
             )
 
-            status_obj = props.get("Status", {}).get("status", {})
-            status = status_obj.get("name", "Applied") if status_obj else "Applied"
-
-            applied_on = props.get("Applied On", {}).get("date", {})
-            applied_date = applied_on.get("start", "") if applied_on else ""
-
-            notes = props.get("Notes", {}).get("rich_text", [])
-            notes_text = notes[0].get("text", {}).get("content", "") if notes else ""
-
-            # Count by status
-            status_lower = status.lower()
-            if status_lower == "applied":
-                data["applied"] += 1
-            elif status_lower == "interview":
-                data["interview"] += 1
-            elif status_lower == "offer":
-                data["offer"] += 1
-            elif status_lower == "rejected":
-                data["rejected"] += 1
-            elif status_lower == "assessment":
-                data["assessment"] += 1
-
-            # Check for deadlines in notes
-            deadline_keywords = [
-                "deadline",
-                "due",
-                "by",
-                "before",
-                "respond by",
-                "complete by",
-            ]
-            if any(keyword in notes_text.lower() for keyword in deadline_keywords):
-                data["deadlines"].append(
-                    {
-                        "company": company_name,
-                        "job_title": job_title_text,
-                        "note": notes_text[:200],  # First 200 chars
-                    }
-                )
+        for record in records:
+            if record.applied_on[:10] < cutoff:
+                continue
 
             # Store entry details
             data["entries"].append(
                 {
-                    "company": company_name,
-                    "job_title": job_title_text,
-                    "status": status,
-                    "applied_on": applied_date,
-                    "notes": notes_text[:500],  # First 500 chars
+                    "company": record.company or "Unknown",
+                    "job_title": record.job_title or "Unknown",
+                    "status": record.status or "Applied",
+                    "applied_on": record.applied_on,
+                    "notes": record.notes[:500],  # First 500 chars
                 }
             )
 
+        if revision is not None:
+            # Aggregates of earlier dates are never asked for again
+            for stale in [k for k in _weekly_cache if k[1] != key[1]]:
+                del _weekly_cache[stale]
+            _weekly_cache[key] = (revision, copy.deepcopy(data))
         return data
 
     except Exception as e:
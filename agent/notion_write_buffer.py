@@ -0,0 +1,132 @@
+"""
+Write coalescing for Notion page updates within a run.
+Several emails about the same application (applied, assessment,
+interview, ...) collapse into one pages.update per page.
+"""
+
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from shared.config import NOTION_WRITE_BUFFER_MAX_PAGES, NOTION_WRITE_BUFFER_MAX_AGE
+
+
+class PendingUpdate:
+    """Accumulated changes for one Notion page."""
+
+    __slots__ = (
+        "page_id",
+        "base_page",
+        "status",
+        "status_date",
+        "app_id",
+        "notes",
+        "outbox_ids",
+        "_seq",
+    )
+
+    def __init__(self, base_page: Dict[str, Any]):
+        self.page_id = base_page["id"]
+        self.base_page = base_page
+        self.status: Optional[str] = None
+        self.status_date = ""
+        self.app_id: Optional[str] = None
+        # (email date, arrival order, note text)
+        self.notes: List[Tuple[str, int, str]] = []
+        # Outbox intents this update acknowledges once sent
+        self.outbox_ids: List[str] = []
+        self._seq = 0
+
+    def merge(
+        self,
+        status: str,
+        email_date: str,
+        notes: str,
+        app_id: Optional[str],
+        outbox_id: Optional[str] = None,
+    ):
+        # Latest email date wins; on equal dates the later arrival wins
+        if self.status is None or (email_date or "") >= self.status_date:
+            self.status = status
+            self.status_date = email_date or ""
+        if app_id:
+            self.app_id = app_id
+        if notes:
+            self.notes.append((email_date or "", self._seq, notes))
+        if outbox_id:
+            self.outbox_ids.append(outbox_id)
+        self._seq += 1
+
+    def note_updates(self) -> List[Tuple[str, str]]:
+        """Note deltas ordered by email date, then arrival."""
+        return [(date, text) for date, _, text in sorted(self.notes)]
+
+
+class NotionWriteBuffer:
+    """
+    Groups pending page updates and flushes one update per page.
+
+    Flushes when `max_pages` distinct pages are pending, when the oldest
+    pending change is older than `max_age` seconds (checked on add), and
+    whenever flush() is called explicitly (e.g. at the end of a run).
+    """
+
+    def __init__(
+        self,
+        send: Callable[[PendingUpdate], Optional[Dict[str, Any]]],
+        max_pages: int = NOTION_WRITE_BUFFER_MAX_PAGES,
+        max_age: float = NOTION_WRITE_BUFFER_MAX_AGE,
+    ):
+        self.send = send
+        self.max_pages = max_pages
+        self.max_age = max_age
+        self.pending: Dict[str, PendingUpdate] = {}
+        self._oldest: Optional[float] = None
+        self.queued = 0
+        self.flushed = 0
+
+    def __len__(self) -> int:
+        return len(self.pending)
+
+    def add(
+        self,
+        page: Dict[str, Any],
+        status: str,
+        email_date: str,
+        notes: str = "",
+        app_id: Optional[str] = None,
+        outbox_id: Optional[str] = None,
+    ) -> PendingUpdate:
+        """Queue a status/notes change for `page`."""
+        pending = self.pending.get(page["id"])
+        if pending is None:
+            pending = self.pending[page["id"]] = PendingUpdate(page)
+        pending.merge(status, email_date, notes, app_id, outbox_id)
+        self.queued += 1
+
+        if self._oldest is None:
+            self._oldest = time.monotonic()
+        if len(self.pending) >= self.max_pages or (
+            time.monotonic() - self._oldest >= self.max_age
+        ):
+            self.flush()
+        return pending
+
+    def flush(self) -> List[Dict[str, Any]]:
+        """Send one update per pending page; returns the updated pages."""
+        pending, self.pending, self._oldest = self.pending, {}, None
+        results = []
+        for update in pending.values():
+            try:
+                result = self.send(update)
+            except Exception as e:
+                print(f"[ERROR] Buffered update failed for {update.page_id[:8]}: {e}")
+                continue
+            if result:
+                results.append(result)
+                self.flushed += 1
+        if pending:
+            print(
+                f"[BUFFER] Flushed {len(pending)} page updates "
+                f"({self.queued} changes queued so far)"
+            )
+        return results
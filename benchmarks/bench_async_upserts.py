@@ -0,0 +1,116 @@
+"""
+Benchmark: sequential sync upserts vs. concurrent async upserts.
+
+Runs create_or_update_entry in a loop and aupsert_entries at several
+concurrency levels against an in-process fake Notion with fixed latency.
+Plain notion_client clients are used, bypassing the process-wide rate
+limiter, so the numbers isolate the effect of concurrency.
+
+Usage:
+    uv run benchmarks/bench_async_upserts.py [n_applications] [latency_ms]
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+os.environ.setdefault("NOTION_TOKEN", "fake-token")
+os.environ.setdefault("NOTION_DATABASE_ID", "fake-db")
+# Keep the local store and outbox away from the user's real ones;
+# reset_state() empties them before every run
+_tmp = tempfile.TemporaryDirectory(prefix="jobsync-bench-")
+os.environ["NOTION_CACHE_PATH"] = os.path.join(_tmp.name, "notion.sqlite")
+os.environ["NOTION_OUTBOX_PATH"] = os.path.join(_tmp.name, "outbox.jsonl")
+
+import httpx
+from notion_client import AsyncClient, Client
+
+import agent.notion_async as notion_async
+import agent.notion_utils as notion_utils
+from benchmarks.fake_notion import FakeNotion
+
+
+def make_applications(n: int):
+    # Every third application is a follow-up status for an earlier one
+    apps = []
+    for i in range(n):
+        company = f"Company {i - 2 if i % 3 == 2 else i}"
+        apps.append(
+            {
+                "company": company,
+                "job_title": "Software Engineer",
+                "status": "Interview" if i % 3 == 2 else "Applied",
+                "applied_on": "2025-10-01",
+                "notes": f"email {i}",
+            }
+        )
+    return apps
+
+
+def reset_state(fake: FakeNotion):
+    """Point both clients at `fake` and start from an empty store and outbox."""
+    for name in ("notion.sqlite", "outbox.jsonl"):
+        path = os.path.join(_tmp.name, name)
+        if os.path.exists(path):
+            os.remove(path)
+    notion_utils._local_store = None
+    notion_utils._local_store_refreshed = 0.0
+    notion_utils._match_index = None
+    notion_utils._outbox = None
+    notion_utils.notion = Client(
+        auth="fake", client=httpx.Client(transport=fake.sync_transport())
+    )
+    notion_async.async_notion = AsyncClient(
+        auth="fake", client=httpx.AsyncClient(transport=fake.async_transport())
+    )
+
+
+def run_sync(apps, latency: float):
+    fake = FakeNotion(latency)
+    reset_state(fake)
+    start = time.perf_counter()
+    for app in apps:
+        notion_utils.create_or_update_entry(**app)
+    return time.perf_counter() - start, fake
+
+
+async def run_async(apps, latency: float, concurrency: int):
+    fake = FakeNotion(latency)
+    reset_state(fake)
+    start = time.perf_counter()
+    await notion_async.aupsert_entries(apps, concurrency=concurrency)
+    return time.perf_counter() - start, fake
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+    latency = (int(sys.argv[2]) if len(sys.argv) > 2 else 100) / 1000
+    apps = make_applications(n)
+
+    # Silence the per-entry logging of the sync path
+    devnull = open(os.devnull, "w")
+    stdout, sys.stdout = sys.stdout, devnull
+    try:
+        sync_time, sync_fake = run_sync(apps, latency)
+    finally:
+        sys.stdout = stdout
+
+    print(f"{n} upserts, {latency * 1000:.0f} ms simulated latency per request\n")
+    print(f"{'mode':<22}{'seconds':>10}{'requests':>10}{'pages':>8}{'speedup':>9}")
+    print(
+        f"{'sync sequential':<22}{sync_time:>10.2f}{sync_fake.requests:>10}"
+        f"{len(sync_fake.pages):>8}{1.0:>8.1f}x"
+    )
+    for concurrency in (1, 3, 10):
+        elapsed, fake = asyncio.run(run_async(apps, latency, concurrency))
+        print(
+            f"{f'async concurrency={concurrency}':<22}{elapsed:>10.2f}{fake.requests:>10}"
+            f"{len(fake.pages):>8}{sync_time / elapsed:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
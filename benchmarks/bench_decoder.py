@@ -0,0 +1,97 @@
+"""
+Micro-benchmark: schema decoders vs hand-written property extraction.
+
+Decodes synthetic Notion pages with the chained .get(...)[0] extraction the
+handlers used before, the generic schema loop (make_decoder) and the
+unrolled shared.notion_schema.decode_job_page, after checking that both
+schema decoders return the same records.
+
+Usage:
+    python benchmarks/bench_decoder.py [pages] [rounds]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from shared.notion_schema import decode_job_page, decode_job_page_generic  # noqa: E402
+
+
+def _rich(text):
+    return {"rich_text": [{"type": "text", "text": {"content": text}, "plain_text": text}]}
+
+
+def make_pages(n):
+    statuses = ["Applied", "Interview", "Rejected", "Offer", "Online Assessment"]
+    pages = []
+    for i in range(n):
+        pages.append(
+            {
+                "object": "page",
+                "id": f"page-{i:06d}",
+                "last_edited_time": "2025-01-01T00:00:00.000Z",
+                "properties": {
+                    "Title": {"title": [{"plain_text": f"Company {i} - Engineer {i}"}]},
+                    "Company": _rich(f"Company {i % 500}"),
+                    "Job Title": _rich(f"Engineer {i}"),
+                    "Status": {"status": {"name": statuses[i % len(statuses)]}},
+                    "Applied On": {"date": {"start": f"2025-01-{i % 28 + 1:02d}"}},
+                    "Notes": _rich(f"[2025-01-01] Applied via portal #{i}"),
+                    "Application ID": _rich(f"REQ-{i}"),
+                },
+            }
+        )
+    return pages
+
+
+def legacy_decode(page):
+    props = page.get("properties", {})
+    return {
+        "id": page.get("id"),
+        "company": props.get("Company", {}).get("rich_text", [{}])[0].get("plain_text", ""),
+        "job_title": props.get("Job Title", {}).get("rich_text", [{}])[0].get("plain_text", ""),
+        "status": props.get("Status", {}).get("status", {}).get("name", ""),
+        "applied_on": props.get("Applied On", {}).get("date", {}).get("start", ""),
+        "notes": props.get("Notes", {}).get("rich_text", [{}])[0].get("plain_text", ""),
+        "app_id": props.get("Application ID", {}).get("rich_text", [{}])[0].get("plain_text", ""),
+    }
+
+
+def timed(fn, pages, rounds):
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for page in pages:
+            fn(page)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    pages = make_pages(n)
+
+    mismatches = sum(decode_job_page(p) != decode_job_page_generic(p) for p in pages)
+    if mismatches:
+        sys.exit(f"decode_job_page differs from the schema loop on {mismatches} pages")
+
+    legacy = timed(legacy_decode, pages, rounds)
+    generic = timed(decode_job_page_generic, pages, rounds)
+    schema = timed(decode_job_page, pages, rounds)
+
+    print(f"{n} synthetic pages, best of {rounds} rounds\n")
+    print(f"{'decoder':<22}{'ms':>10}{'us/page':>10}")
+    for name, seconds in (
+        ("hand-written .get()", legacy),
+        ("schema loop", generic),
+        ("decode_job_page", schema),
+    ):
+        print(f"{name:<22}{seconds * 1000:>10.1f}{seconds / n * 1e6:>10.2f}")
+    print(f"\nspeedup: {legacy / schema:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Benchmark: three MCP server processes vs. the single-process MCP host.
+
+Spawns each stdio server (and then mcp_servers.host) as a real MCP client
+would and measures cold start (spawn until `initialize` returns) and the
+first call of one tool per toolset. Notion calls go to an in-process fake
+Notion server; Gmail has no credentials here, so its first call measures
+the googleapiclient import and then fails fast.
+
+Usage:
+    uv run benchmarks/bench_mcp_host.py [rounds]
+"""
+
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+
+from benchmarks.fake_notion import FakeNotion, FakeNotionServer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# One representative call per toolset
+FIRST_CALLS = {
+    "gmail": ("get_email_content", {"email_id": "bench"}),
+    "notion": (
+        "search_similar_entries",
+        {"company": "Company 7", "job_title": "Engineer"},
+    ),
+    "weekly_report": ("get_weekly_data", {"days": 7}),
+}
+SERVERS = {
+    "gmail": ["mcp_servers/gmail_server.py"],
+    "notion": ["mcp_servers/notion_server.py"],
+    "weekly_report": ["mcp_servers/weekly_report_server.py"],
+}
+HOST = ["-m", "mcp_servers.host"]
+
+
+async def measure(args, env, toolsets):
+    """
+    Returns:
+        dict: "start" seconds plus one entry per toolset's first call
+            (None where the process or call failed)
+    """
+    params = StdioServerParameters(command=sys.executable, args=args, env=env, cwd=ROOT)
+    timings = {"start": None, **{t: None for t in toolsets}}
+    started = time.perf_counter()
+    try:
+        async with stdio_client(params, errlog=open(os.devnull, "w")) as (r, w):
+            async with ClientSession(r, w) as session:
+                await asyncio.wait_for(session.initialize(), 60)
+                timings["start"] = time.perf_counter() - started
+                listed = {tool.name for tool in (await session.list_tools()).tools}
+                for toolset in toolsets:
+                    name, arguments = FIRST_CALLS[toolset]
+                    if name not in listed:
+                        continue
+                    call_started = time.perf_counter()
+                    await asyncio.wait_for(session.call_tool(name, arguments), 60)
+                    timings[toolset] = time.perf_counter() - call_started
+    except Exception:
+        pass
+    return timings
+
+
+def fmt(values):
+    values = [v for v in values if v is not None]
+    return f"{statistics.median(values) * 1000:8.0f} ms" if values else "  failed"
+
+
+async def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+
+    fake = FakeNotion()
+    fake.seed(200)
+    with FakeNotionServer(fake) as notion_server, tempfile.TemporaryDirectory() as tmp:
+        env = {
+            **os.environ,
+            "NOTION_BASE_URL": notion_server.url,
+            "NOTION_TOKEN": "fake-token",
+            "NOTION_DATABASE_ID": "fake-db",
+            "NOTION_CACHE_PATH": os.path.join(tmp, "notion.sqlite"),
+            "NOTION_OUTBOX_PATH": os.path.join(tmp, "outbox.jsonl"),
+            "GMAIL_CREDENTIALS_PATH": os.path.join(tmp, "missing.json"),
+            "GMAIL_TOKEN_PATH": os.path.join(tmp, "missing-token.json"),
+        }
+
+        separate = {t: [] for t in SERVERS}
+        hosted = []
+        for _ in range(rounds):
+            for toolset, args in SERVERS.items():
+                separate[toolset].append(await measure(args, env, [toolset]))
+            hosted.append(await measure(HOST, env, list(FIRST_CALLS)))
+
+    print(f"Median of {rounds} rounds\n")
+    print(f"{'':28}{'cold start':>12}{'first call':>12}")
+    for toolset, runs in separate.items():
+        print(
+            f"{toolset + ' process':28}{fmt(r['start'] for r in runs):>12}"
+            f"{fmt(r[toolset] for r in runs):>12}"
+        )
+    # Servers that failed to start are left out of the total
+    starts = [
+        sum(r["start"] for r in runs if r["start"] is not None)
+        for runs in zip(*separate.values())
+    ]
+    print(f"{'separate processes (sum)':28}{fmt(starts):>12}")
+    print()
+    print(f"{'host process':28}{fmt(r['start'] for r in hosted):>12}")
+    for toolset in FIRST_CALLS:
+        print(
+            f"{'  host first ' + toolset:28}{'':>12}{fmt(r[toolset] for r in hosted):>12}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
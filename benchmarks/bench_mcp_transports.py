@@ -0,0 +1,204 @@
+"""
+Load test: stdio vs. Streamable HTTP transport for the MCP host.
+
+Simulates several agent clients calling Notion tools concurrently against
+an in-process fake Notion server:
+
+- stdio: every client spawns its own host process (cold imports, its own
+  local index and rate limiter), as MCP clients do with stdio servers.
+- http: one long-lived host process; every client opens a Streamable HTTP
+  session to it and shares its warm state.
+
+Reports session setup time, per-request latency percentiles (the first
+call of each session separately) and total wall time.
+
+Usage:
+    uv run benchmarks/bench_mcp_transports.py [clients] [calls_per_client]
+"""
+
+import asyncio
+import os
+import socket
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+from mcp.client.streamable_http import streamablehttp_client
+
+from benchmarks.fake_notion import FakeNotion, FakeNotionServer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HOST_ARGS = ["-m", "mcp_servers.host", "--toolsets", "notion"]
+
+
+def tool_calls(client: int, count: int):
+    """A read-heavy mix: similarity searches plus one Application ID lookup."""
+    calls = []
+    for i in range(count):
+        if i % 5 == 4:
+            calls.append(("find_application_by_id", {"app_id": f"APP-{client}-{i}"}))
+        else:
+            company = f"Company {(client * 37 + i * 11) % 200}"
+            calls.append(
+                (
+                    "search_similar_entries",
+                    {"company": company, "job_title": "Engineer", "limit": 5},
+                )
+            )
+    return calls
+
+
+async def run_session(session: ClientSession, calls, stats):
+    for name, arguments in calls:
+        started = time.perf_counter()
+        await session.call_tool(name, arguments)
+        elapsed = time.perf_counter() - started
+        stats["first" if not stats["first"] else "calls"].append(elapsed)
+
+
+async def stdio_client_run(env, calls):
+    stats = {"setup": [], "first": [], "calls": []}
+    params = StdioServerParameters(
+        command=sys.executable, args=HOST_ARGS, env=env, cwd=ROOT
+    )
+    started = time.perf_counter()
+    async with stdio_client(params, errlog=open(os.devnull, "w")) as (r, w):
+        async with ClientSession(r, w) as session:
+            await session.initialize()
+            stats["setup"].append(time.perf_counter() - started)
+            await run_session(session, calls, stats)
+    return stats
+
+
+async def http_client_run(url, calls):
+    stats = {"setup": [], "first": [], "calls": []}
+    started = time.perf_counter()
+    async with streamablehttp_client(url) as (r, w, _):
+        async with ClientSession(r, w) as session:
+            await session.initialize()
+            stats["setup"].append(time.perf_counter() - started)
+            await run_session(session, calls, stats)
+    return stats
+
+
+def merge(results):
+    merged = {"setup": [], "first": [], "calls": []}
+    for stats in results:
+        for key in merged:
+            merged[key].extend(stats[key])
+    return merged
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def report(label, stats, wall):
+    ms = lambda s: f"{s * 1000:7.1f} ms"  # noqa: E731
+    calls = stats["calls"]
+    print(f"{label}")
+    print(f"  session setup (median)   {ms(statistics.median(stats['setup']))}")
+    print(f"  first call (median)      {ms(statistics.median(stats['first']))}")
+    print(
+        f"  later calls p50 / p95    {ms(percentile(calls, 50))} / {ms(percentile(calls, 95))}"
+    )
+    print(f"  wall time                {ms(wall)}")
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def wait_for_port(port: int, timeout: float = 30):
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        try:
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.close()
+            return
+        except OSError:
+            await asyncio.sleep(0.05)
+    raise TimeoutError(f"MCP host did not listen on port {port}")
+
+
+async def main():
+    clients = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    per_client = int(sys.argv[2]) if len(sys.argv) > 2 else 25
+    workload = [tool_calls(c, per_client) for c in range(clients)]
+
+    fake = FakeNotion(latency=0.02)
+    fake.seed(500)
+    with FakeNotionServer(fake) as notion, tempfile.TemporaryDirectory() as tmp:
+        env = {
+            **os.environ,
+            "NOTION_BASE_URL": notion.url,
+            "NOTION_TOKEN": "fake-token",
+            "NOTION_DATABASE_ID": "fake-db",
+            "NOTION_OUTBOX_PATH": "",
+        }
+
+        # stdio: one process (and one local store) per client
+        started = time.perf_counter()
+        results = await asyncio.gather(
+            *(
+                stdio_client_run(
+                    {
+                        **env,
+                        "NOTION_CACHE_PATH": os.path.join(tmp, f"stdio-{c}.sqlite"),
+                    },
+                    calls,
+                )
+                for c, calls in enumerate(workload)
+            )
+        )
+        stdio_wall = time.perf_counter() - started
+        stdio_requests = fake.requests
+
+        # http: one warm process shared by every client
+        port = free_port()
+        process = await asyncio.create_subprocess_exec(
+            sys.executable,
+            *HOST_ARGS,
+            "--transport",
+            "http",
+            "--port",
+            str(port),
+            cwd=ROOT,
+            env={**env, "NOTION_CACHE_PATH": os.path.join(tmp, "http.sqlite")},
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        try:
+            await wait_for_port(port)
+            url = f"http://127.0.0.1:{port}/mcp"
+            # A first agent warms the server, as a long-lived instance would be
+            await http_client_run(url, workload[0][:1])
+            fake.requests = 0
+            started = time.perf_counter()
+            http_results = await asyncio.gather(
+                *(http_client_run(url, calls) for calls in workload)
+            )
+            http_wall = time.perf_counter() - started
+            http_requests = fake.requests
+        finally:
+            process.terminate()
+            await process.wait()
+
+    print(f"{clients} clients x {per_client} calls, fake Notion latency 20 ms\n")
+    report("stdio (process per client)", merge(results), stdio_wall)
+    print(f"  Notion requests          {stdio_requests:7d}")
+    print()
+    report("streamable http (shared warm host)", merge(http_results), http_wall)
+    print(f"  Notion requests          {http_requests:7d}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,87 @@
+"""
+Micro-benchmark: local trigram search for search_similar_entries.
+
+Builds a NotionIndex over synthetic pages with varied company names and
+common job titles, then times ranked candidate lookups for queries with
+typos, legal suffixes and abbreviated titles.
+
+Usage:
+    python benchmarks/bench_search.py [pages] [queries]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agent.notion_index import NotionIndex  # noqa: E402
+
+SYLLABLES = ["ar", "bo", "ca", "del", "ex", "fi", "gro", "hel", "io", "jun", "ka", "lum",
+             "mo", "nex", "or", "pa", "qui", "ra", "sol", "ta", "ul", "ve", "wi", "xa", "zen"]
+SUFFIXES = ["", "", "", " Inc", " LLC", " Labs", " Technologies", " Corp"]
+ROLES = ["Software Engineer", "Senior Software Engineer", "Data Scientist",
+         "Product Manager", "Backend Engineer", "Frontend Engineer",
+         "Machine Learning Engineer", "Site Reliability Engineer",
+         "Software Engineer II", "Software Engineer Intern", "Data Engineer",
+         "Engineering Manager", "Full Stack Developer", "QA Engineer"]
+ABBREVIATED = {"Software Engineer": "SWE", "Senior Software Engineer": "Sr. SWE",
+               "Product Manager": "PM", "Software Engineer II": "SWE II",
+               "Machine Learning Engineer": "ML Engineer"}
+
+
+def company_name(rng):
+    return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 3))).capitalize()
+
+
+def make_pages(n, rng):
+    companies = [company_name(rng) for _ in range(max(n // 3, 1))]
+    pages = []
+    for i in range(n):
+        company = rng.choice(companies) + rng.choice(SUFFIXES)
+        pages.append({
+            "id": f"page-{i}",
+            "properties": {
+                "Company": {"rich_text": [{"plain_text": company}]},
+                "Job Title": {"rich_text": [{"plain_text": rng.choice(ROLES)}]},
+            },
+        })
+    return pages
+
+
+def make_queries(pages, count, rng):
+    queries = []
+    for page in rng.sample(pages, min(count, len(pages))):
+        company = page["properties"]["Company"]["rich_text"][0]["plain_text"]
+        title = page["properties"]["Job Title"]["rich_text"][0]["plain_text"]
+        if rng.random() < 0.3:
+            pos = rng.randrange(len(company))
+            company = company[:pos] + company[pos + 1:]  # drop a letter
+        queries.append((company + rng.choice(SUFFIXES), ABBREVIATED.get(title, title)))
+    return queries
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000
+    rng = random.Random(42)
+    pages = make_pages(n, rng)
+
+    started = time.perf_counter()
+    index = NotionIndex().load(pages)
+    build = time.perf_counter() - started
+
+    queries = make_queries(pages, count, rng)
+    started = time.perf_counter()
+    for company, title in queries:
+        index.candidates(company, title, limit=10)
+    per_query = (time.perf_counter() - started) / len(queries)
+
+    print(f"{n} pages, {len(queries)} queries")
+    print(f"index build: {build * 1000:.1f} ms")
+    print(f"search:      {per_query * 1e6:.0f} us/query (0 Notion requests)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Check: deadline extraction on example notes.
+
+Each note either has a deadline (with its expected due date) or must
+yield none, e.g. review timelines that are not the candidate's deadline.
+Exits non-zero on failure.
+
+Usage:
+    uv run benchmarks/check_deadlines.py
+"""
+
+import os
+import sys
+from datetime import date
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from shared.deadlines import extract_deadlines
+
+# Wednesday
+ANCHOR = date(2025, 10, 15)
+
+EXAMPLES = [
+    ("Please complete the assessment within 5 days.", date(2025, 10, 20)),
+    ("Submit your answers within 3 business days", date(2025, 10, 20)),
+    ("Kindly reply by Friday to confirm a slot.", date(2025, 10, 17)),
+    ("The offer expires on Oct 24.", date(2025, 10, 24)),
+    ("Deadline: 2025-11-01", date(2025, 11, 1)),
+    # Not deadlines: no cue before the duration or date
+    ("We will review your application in 2 weeks.", None),
+    ("You should hear back within 5 business days.", None),
+    ("Thanks for applying on Oct 10.", None),
+    # "by" only counts right before the date
+    ("Please send the signed form by Oct 22.", date(2025, 10, 22)),
+    ("Referred by John; interview on Oct 20", None),
+    ("Reviewed by team on 10/20", None),
+]
+
+
+def main():
+    failures = []
+    for text, expected in EXAMPLES:
+        found = [due for due, _ in extract_deadlines(text, ANCHOR)]
+        wanted = [expected] if expected else []
+        if found != wanted:
+            failures.append(f"{text!r}: got {found}, expected {wanted}")
+
+    if failures:
+        print("FAIL:\n  " + "\n  ".join(failures))
+        sys.exit(1)
+    print(f"OK: {len(EXAMPLES)} examples")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Check: which (company, job title) pairs NotionIndex treats as the same entry.
+
+A match is the page create_or_update_entry overwrites, so near-duplicates
+of a different company or role must not match; they stay available as
+ranked candidates. Pages are built with the real create properties and
+stored by the fake Notion, so they have the job schema's shape.
+Exits non-zero on failure.
+
+Usage:
+    uv run benchmarks/check_matching.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+os.environ.setdefault("NOTION_TOKEN", "fake-token")
+os.environ.setdefault("NOTION_DATABASE_ID", "fake-db")
+
+from agent.notion_index import NotionIndex
+from agent.notion_utils import build_create_properties
+from benchmarks.fake_notion import FakeNotion
+
+PAGES = [
+    ("Capital One", "Software Engineer"),
+    ("Company 12", "Software Engineer"),
+    ("Acme", "Machine Learning Engineer"),
+    ("Google LLC", "SWE II"),
+    ("Stripe", "Senior Backend Engineer"),
+]
+
+# (company, job title) -> index into PAGES of the page it must match, or None
+EXAMPLES = [
+    (("Capital One, Inc.", "software engineer"), 0),
+    (("Google", "Software Engineer II"), 3),
+    (("Stripe", "Sr. Backend Enginer"), 4),
+    (("Stripe", "Backend Engineer, Senior"), 4),
+    # Different companies or roles: candidates only, never an update target
+    (("Capital Group", "Software Engineer"), None),
+    (("Company 1", "Software Engineer"), None),
+    (("Acme", "Machine Learning Engineer, Ads"), None),
+    (("Google", "Software Engineer III"), None),
+]
+
+
+def main():
+    fake = FakeNotion()
+    pages = [
+        fake.create_page(
+            {
+                "properties": build_create_properties(
+                    company, title, "Applied", "2025-10-01", "", None
+                )
+            }
+        )
+        for company, title in PAGES
+    ]
+    index = NotionIndex().load(pages)
+
+    failures = []
+    for (company, title), expected in EXAMPLES:
+        page = index.find_by_company_title(company, title)
+        found = pages.index(page) if page else None
+        if found != expected:
+            got = PAGES[found] if found is not None else None
+            wanted = PAGES[expected] if expected is not None else None
+            failures.append(f"{company} / {title}: got {got}, expected {wanted}")
+
+    # Rejected near-duplicates are still offered for confirmation
+    ranked = [
+        page for *_, page in index.candidates("Capital Group", "Software Engineer")
+    ]
+    if pages[0] not in ranked:
+        failures.append("Capital One missing from candidates for Capital Group")
+
+    if failures:
+        print("FAIL:\n  " + "\n  ".join(failures))
+        sys.exit(1)
+    print(f"OK: {len(EXAMPLES)} examples")
+
+
+if __name__ == "__main__":
+    main()
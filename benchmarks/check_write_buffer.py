@@ -0,0 +1,71 @@
+"""
+Check: buffered updates and direct updates to one page within a run.
+
+Job sync creates or updates an entry (queued in the write buffer) and may
+then call update_entry on the same page before the buffer is flushed.
+Both changes must reach Notion: the later status, and both notes.
+Runs against an in-process fake Notion; exits non-zero on failure.
+
+Usage:
+    uv run benchmarks/check_write_buffer.py
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+_tmp = tempfile.mkdtemp(prefix="jobsync-check-")
+os.environ.setdefault("NOTION_TOKEN", "fake-token")
+os.environ.setdefault("NOTION_DATABASE_ID", "fake-db")
+os.environ["NOTION_CACHE_PATH"] = os.path.join(_tmp, "notion.sqlite")
+os.environ["NOTION_OUTBOX_PATH"] = os.path.join(_tmp, "outbox.jsonl")
+
+import httpx
+from notion_client import Client
+
+import agent.notion_utils as notion_utils
+from benchmarks.fake_notion import FakeNotion, _plain
+
+
+def main():
+    fake = FakeNotion()
+    fake.seed(10)
+    notion_utils.notion = Client(
+        auth="fake", client=httpx.Client(transport=fake.sync_transport())
+    )
+
+    notion_utils.load_run_index()
+    notion_utils.start_write_buffer()
+    page, was_updated = notion_utils.create_or_update_entry(
+        company="Company 3",
+        job_title="Role 3",
+        status="Interview",
+        applied_on="2025-10-01",
+        notes="Interview invite",
+    )
+    assert was_updated, "seeded page was not matched"
+    notion_utils.update_entry(page["id"], "Rejected", "Withdrew after call")
+    notion_utils.flush_write_buffer()
+
+    properties = fake.pages[page["id"]]["properties"]
+    status = properties["Status"]["status"]["name"]
+    notes = _plain(properties["Notes"])
+    failures = []
+    if status != "Rejected":
+        failures.append(f"status is {status!r}, expected 'Rejected'")
+    for note in ("Seeded page 3", "Interview invite", "Withdrew after call"):
+        if note not in notes:
+            failures.append(f"note {note!r} missing from {notes!r}")
+    pending = len(notion_utils.get_outbox())
+    if pending:
+        failures.append(f"{pending} outbox intents left unacknowledged")
+
+    if failures:
+        print("FAIL: " + "; ".join(failures))
+        sys.exit(1)
+    print(f"OK: one page update sent ({fake.requests} requests), status and notes kept")
+
+
+if __name__ == "__main__":
+    main()
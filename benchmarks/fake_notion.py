@@ -0,0 +1,406 @@
+"""
+Fake of the Notion API for offline benchmarks and load tests.
+Serves databases.retrieve/query (filters, sorts, cursors), pages.create,
+pages.update and pages.retrieve with configurable latency and injected
+429 responses, either in-process through httpx mock transports or on
+localhost for clients pointed at it with NOTION_BASE_URL.
+
+Usage:
+    python -m benchmarks.fake_notion [--port 8787] [--latency 0.05]
+        [--rate-limit-every 0] [--seed-pages 0]
+"""
+
+import argparse
+import asyncio
+import json
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import httpx
+
+PROPERTY_NAMES = (
+    "Title",
+    "Company",
+    "Job Title",
+    "Status",
+    "Applied On",
+    "Notes",
+    "Application ID",
+)
+PROPERTY_IDS = {name: f"p{i}" for i, name in enumerate(PROPERTY_NAMES)}
+
+
+def _plain(prop: Dict[str, Any]) -> str:
+    items = prop.get("rich_text") or prop.get("title") or []
+    return "".join(i.get("text", {}).get("content", "") for i in items)
+
+
+def _with_plain_text(properties: Dict[str, Any]) -> Dict[str, Any]:
+    """Add plain_text to rich_text/title items the way Notion echoes them."""
+    for prop in properties.values():
+        for kind in ("rich_text", "title"):
+            for item in prop.get(kind, []) or []:
+                item.setdefault("type", "text")
+                item.setdefault("plain_text", item.get("text", {}).get("content", ""))
+    return properties
+
+
+def _sort_value(page: Dict[str, Any], sort: Dict[str, Any]) -> str:
+    if "timestamp" in sort:
+        return page.get(sort["timestamp"], "")
+    prop = page["properties"].get(sort.get("property"), {})
+    if "date" in prop:
+        return (prop.get("date") or {}).get("start") or ""
+    if "status" in prop or "select" in prop:
+        return ((prop.get("status") or prop.get("select")) or {}).get("name", "")
+    return _plain(prop)
+
+
+def _compare(value: str, cond: Dict[str, Any]) -> bool:
+    """Evaluate one text/date/status condition against a plain value."""
+    for op, target in cond.items():
+        if op == "equals" and value != target:
+            return False
+        if op == "does_not_equal" and value == target:
+            return False
+        if op == "contains" and target.lower() not in value.lower():
+            return False
+        if op == "does_not_contain" and target.lower() in value.lower():
+            return False
+        if op == "starts_with" and not value.startswith(target):
+            return False
+        if op == "is_empty" and bool(value) == bool(target):
+            return False
+        if op == "is_not_empty" and not value:
+            return False
+        if op in ("on_or_after", "after", "on_or_before", "before"):
+            if not value:
+                return False
+            # Compare dates and timestamps at the precision of the target
+            value = value[: len(target)]
+            if op == "on_or_after" and value < target:
+                return False
+            if op == "after" and value <= target:
+                return False
+            if op == "on_or_before" and value > target:
+                return False
+            if op == "before" and value >= target:
+                return False
+    return True
+
+
+class FakeNotion:
+    """
+    Minimal in-memory Notion workspace holding a single job database.
+
+    Args:
+        latency: Seconds every request sleeps before it is answered
+        rate_limit_every: Answer every Nth request with 429 (0 disables)
+        retry_after: Retry-After seconds sent with injected 429s
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        rate_limit_every: int = 0,
+        retry_after: float = 1.0,
+    ):
+        self.latency = latency
+        self.rate_limit_every = rate_limit_every
+        self.retry_after = retry_after
+        self.pages: Dict[str, Dict[str, Any]] = {}
+        self.requests = 0
+        self.rate_limited = 0
+        self._pending_429 = 0
+        self._lock = threading.Lock()
+
+    def inject_429(self, count: int = 1):
+        """Answer the next `count` requests with 429 rate_limited."""
+        with self._lock:
+            self._pending_429 += count
+
+    def seed(self, count: int, start: str = "2025-01-01"):
+        """Create `count` synthetic job pages with spread-out Applied On dates."""
+        statuses = ("Applied", "Online Assessment", "Interview", "Rejected", "Offer")
+        base = datetime.fromisoformat(start)
+        for i in range(count):
+            applied_on = datetime.fromordinal(base.toordinal() + i % 365).date()
+            self.create_page(
+                {
+                    "properties": {
+                        "Title": {"title": [{"text": {"content": f"Company {i} - Role {i}"}}]},
+                        "Company": {"rich_text": [{"text": {"content": f"Company {i % 200}"}}]},
+                        "Job Title": {"rich_text": [{"text": {"content": f"Role {i}"}}]},
+                        "Status": {"status": {"name": statuses[i % len(statuses)]}},
+                        "Applied On": {"date": {"start": applied_on.isoformat()}},
+                        "Notes": {"rich_text": [{"text": {"content": f"Seeded page {i}"}}]},
+                        "Application ID": {"rich_text": [{"text": {"content": f"REQ-{i}"}}]},
+                    }
+                }
+            )
+
+    # === TRANSPORTS ===
+    def sync_transport(self) -> httpx.MockTransport:
+        def handler(request: httpx.Request) -> httpx.Response:
+            time.sleep(self.latency)
+            return self._respond(request)
+
+        return httpx.MockTransport(handler)
+
+    def async_transport(self) -> httpx.MockTransport:
+        async def handler(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(self.latency)
+            return self._respond(request)
+
+        return httpx.MockTransport(handler)
+
+    # === ROUTING ===
+    def _respond(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content) if request.content else {}
+        params = {
+            key: request.url.params.get_list(key) for key in request.url.params.keys()
+        }
+        status, payload, headers = self.dispatch(
+            request.method, request.url.path, body, params
+        )
+        return httpx.Response(status, json=payload, headers=headers)
+
+    def dispatch(
+        self,
+        method: str,
+        path: str,
+        body: Dict[str, Any],
+        params: Optional[Dict[str, List[str]]] = None,
+    ) -> Tuple[int, Any, Dict[str, str]]:
+        """Count the request, apply 429 injection, then route it."""
+        with self._lock:
+            self.requests += 1
+            throttle = self._pending_429 > 0 or (
+                self.rate_limit_every and self.requests % self.rate_limit_every == 0
+            )
+            if self._pending_429 > 0:
+                self._pending_429 -= 1
+            if throttle:
+                self.rate_limited += 1
+        if throttle:
+            return (
+                429,
+                {
+                    "object": "error",
+                    "status": 429,
+                    "code": "rate_limited",
+                    "message": "Rate limited",
+                },
+                {"Retry-After": str(self.retry_after)},
+            )
+
+        with self._lock:
+            status, payload = self.handle(method, path, body, params or {})
+        return status, payload, {}
+
+    def handle(
+        self,
+        method: str,
+        path: str,
+        body: Dict[str, Any],
+        params: Optional[Dict[str, List[str]]] = None,
+    ) -> Tuple[int, Any]:
+        parts = path.strip("/").split("/")[1:]  # drop "v1"
+        if method == "POST" and parts[:1] == ["pages"] and len(parts) == 1:
+            return 200, self.create_page(body)
+        if method == "PATCH" and parts[:1] == ["pages"] and len(parts) == 2:
+            return self._or_404(self.update_page(parts[1], body))
+        if method == "GET" and parts[:1] == ["pages"] and len(parts) == 2:
+            return self._or_404(self.pages.get(parts[1]))
+        if method == "POST" and parts[:1] == ["databases"] and parts[2:] == ["query"]:
+            filter_ids = (params or {}).get("filter_properties") or []
+            return 200, self.query(body, filter_ids)
+        if method == "GET" and parts[:1] == ["databases"] and len(parts) == 2:
+            return 200, self.retrieve_database(parts[1])
+        return 400, {"object": "error", "code": "invalid_request_url", "message": path}
+
+    @staticmethod
+    def _or_404(page: Optional[Dict[str, Any]]) -> Tuple[int, Any]:
+        if page is None:
+            return 404, {
+                "object": "error",
+                "code": "object_not_found",
+                "message": "Could not find page",
+            }
+        return 200, page
+
+    # === ENDPOINTS ===
+    def retrieve_database(self, database_id: str) -> Dict[str, Any]:
+        return {
+            "object": "database",
+            "id": database_id,
+            "properties": {
+                name: {"id": prop_id, "name": name}
+                for name, prop_id in PROPERTY_IDS.items()
+            },
+        }
+
+    def create_page(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        now = datetime.now(timezone.utc).isoformat()
+        page = {
+            "object": "page",
+            "id": str(uuid.uuid4()),
+            "created_time": now,
+            "last_edited_time": now,
+            "parent": body.get("parent", {}),
+            "properties": _with_plain_text(body.get("properties", {})),
+        }
+        self.pages[page["id"]] = page
+        return page
+
+    def update_page(self, page_id: str, body: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        page = self.pages.get(page_id)
+        if page is None:
+            return None
+        page["properties"].update(_with_plain_text(body.get("properties", {})))
+        page["last_edited_time"] = datetime.now(timezone.utc).isoformat()
+        return page
+
+    def query(
+        self, body: Dict[str, Any], filter_ids: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        matches = [p for p in self.pages.values() if self._matches(p, body.get("filter"))]
+        # Apply sorts last-to-first so the first sort is the primary key
+        for sort in reversed(body.get("sorts") or []):
+            matches.sort(
+                key=lambda p: _sort_value(p, sort),
+                reverse=sort.get("direction") == "descending",
+            )
+
+        start = int(body.get("start_cursor") or 0)
+        size = min(int(body.get("page_size", 100)), 100)
+        end = start + size
+        results = matches[start:end]
+        if filter_ids:
+            keep = {name for name, prop_id in PROPERTY_IDS.items() if prop_id in filter_ids}
+            results = [
+                {**p, "properties": {k: v for k, v in p["properties"].items() if k in keep}}
+                for p in results
+            ]
+        return {
+            "object": "list",
+            "results": results,
+            "has_more": end < len(matches),
+            "next_cursor": str(end) if end < len(matches) else None,
+        }
+
+    def _matches(self, page: Dict[str, Any], flt: Optional[Dict[str, Any]]) -> bool:
+        if not flt:
+            return True
+        if "and" in flt:
+            return all(self._matches(page, f) for f in flt["and"])
+        if "or" in flt:
+            return any(self._matches(page, f) for f in flt["or"])
+        if "timestamp" in flt:
+            return _compare(page.get(flt["timestamp"], ""), flt[flt["timestamp"]])
+
+        prop = page["properties"].get(flt.get("property"), {})
+        for kind in ("rich_text", "title"):
+            if kind in flt:
+                return _compare(_plain(prop), flt[kind])
+        for kind in ("status", "select"):
+            if kind in flt:
+                return _compare((prop.get(kind) or {}).get("name", ""), flt[kind])
+        if "date" in flt:
+            return _compare((prop.get("date") or {}).get("start") or "", flt["date"])
+        return True
+
+
+# === LOCALHOST SERVER ===
+class FakeNotionServer:
+    """
+    Serve a FakeNotion over HTTP on localhost from a background thread.
+
+    Point the real clients at it with NOTION_BASE_URL=server.url.
+    """
+
+    def __init__(self, fake: FakeNotion, host: str = "127.0.0.1", port: int = 0):
+        self.fake = fake
+        self.httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self.httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeNotionServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self) -> "FakeNotionServer":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _handler_class(self):
+        fake = self.fake
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _serve(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                raw = self.rfile.read(length) if length else b""
+                body = json.loads(raw) if raw else {}
+                url = urlsplit(self.path)
+                time.sleep(fake.latency)
+                status, payload, headers = fake.dispatch(
+                    self.command, url.path, body, parse_qs(url.query)
+                )
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            do_GET = do_POST = do_PATCH = _serve
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a fake Notion API on localhost")
+    parser.add_argument("--port", type=int, default=8787)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--rate-limit-every", type=int, default=0)
+    parser.add_argument("--seed-pages", type=int, default=0)
+    args = parser.parse_args()
+
+    fake = FakeNotion(latency=args.latency, rate_limit_every=args.rate_limit_every)
+    fake.seed(args.seed_pages)
+    server = FakeNotionServer(fake, port=args.port).start()
+    print(f"[FAKE NOTION] Serving {len(fake.pages)} pages on {server.url}")
+    print(f"[FAKE NOTION] export NOTION_BASE_URL={server.url}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,5 @@
 # MCP Servers package
-from .gmail_server import server as gmail_server
-from .notion_server import server as notion_server
-from .weekly_report_server import server as weekly_report_server
-
-__all__ = ["gmail_server", "notion_server", "weekly_report_server"]
+# Each toolset module exposes TOOLS and handle_tool(); host.py serves all of
+# them from one process. Submodules are not imported here so importing the
+# package stays cheap.
+__all__ = ["gmail_server", "notion_server", "weekly_report_server", "host"]
@@ -1,16 +1,292 @@
+import argparse
 import asyncio
-from typing import List, Optional
+import base64
+import json
+from typing import List, Optional, Tuple
 from mcp.server import Server
-from mcp.server.models import InitializationOptions
-from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 import sys
 import os
 
 # Add parent directory to path to import existing Gmail client
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
-from agent.gmail_client import list_messages, get_message, message_summary
+# agent.gmail_client (googleapiclient) is imported on first tool use, so
+# hosting these tools costs no startup time
+from shared.config import GMAIL_PAGE_CHAR_BUDGET, GMAIL_EMAIL_TEXT_CHARS
+from shared.config import MCP_EMAIL_CACHE_TTL
 from shared.models import EmailData
+from shared.config import MCP_TRANSPORT, MCP_HTTP_HOST, MCP_HTTP_PORT
+from shared.tool_runtime import call_with_timeout, run_blocking
+from shared.tool_cache import CachePolicy, cached_tool
+from mcp_servers.transport import add_transport_arguments, serve
+
+# Filter for job application related emails only
+JOB_EMAIL_QUERY = "application OR applied OR interview OR assessment OR offer OR rejection -label:spam -label:promotions"
+
+# Headers and JSON keys of one record on top of its text, and the least text
+# worth sending when a record has to be shortened to fit the page budget
+_RECORD_OVERHEAD_CHARS = 400
+_MIN_TEXT_CHARS = 200
+
+
+def _fetch_summary(message_id: str) -> dict:
+    """Fetch and summarize one message (blocking; run on the tool pool)."""
+    from agent.gmail_client import get_message, message_summary
+
+    return message_summary(get_message(message_id))
+
+
+# === PAGINATION ===
+def encode_cursor(page_token: Optional[str], offset: int, newer_than_days: int) -> str:
+    """Opaque cursor: Gmail page token, position within that page, query window."""
+    raw = json.dumps(
+        {"t": page_token or "", "o": offset, "d": newer_than_days},
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Optional[str], int, int]:
+    """
+    Returns:
+        tuple: (Gmail page token or None, offset, newer_than_days)
+
+    Raises:
+        ValueError: If the cursor was not produced by encode_cursor
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return data["t"] or None, int(data["o"]), int(data["d"])
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor[:40]}") from e
+
+
+def compact_email(summary: dict, text_chars: int = GMAIL_EMAIL_TEXT_CHARS) -> dict:
+    """Reduce a message summary to the fields a client needs, text capped."""
+    email = EmailData(
+        id=summary["id"],
+        subject=summary.get("subject") or "",
+        sender=summary.get("from") or "",
+        date=summary.get("date") or "",
+        text=summary.get("text") or "",
+        snippet=summary.get("snippet") or "",
+    )
+    text = " ".join((email.text or email.snippet).split())
+    if len(text) > text_chars:
+        text = text[:text_chars].rstrip() + "…"
+    return {
+        "id": email.id,
+        "date": email.date,
+        "from": email.sender,
+        "subject": email.subject,
+        "text": text,
+    }
+
+
+def _record_chars(record: dict) -> int:
+    return len(json.dumps(record, ensure_ascii=False, separators=(",", ":"))) + 1
+
+
+# === TOOLS ===
+TOOLS = [
+    Tool(
+        name="get_recent_emails",
+        description=(
+            "Fetch recent job-related emails from Gmail as compact records "
+            "(id, date, from, subject, text). Results are paginated: pass the "
+            "returned next_cursor to get the next page; null means no more."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "max_results": {
+                    "type": "integer",
+                    "description": "Maximum number of emails per page",
+                    "default": 10,
+                },
+                "newer_than_days": {
+                    "type": "integer",
+                    "description": "Only fetch emails newer than X days (ignored with a cursor)",
+                    "default": 7,
+                },
+                "cursor": {
+                    "type": "string",
+                    "description": "next_cursor from the previous page",
+                },
+                "max_chars": {
+                    "type": "integer",
+                    "description": "Size budget of one page in characters",
+                    "default": GMAIL_PAGE_CHAR_BUDGET,
+                },
+            },
+        },
+    ),
+    Tool(
+        name="get_email_content",
+        description="Get full content of a specific email",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "email_id": {
+                    "type": "string",
+                    "description": "Gmail message ID",
+                }
+            },
+            "required": ["email_id"],
+        },
+    ),
+    Tool(
+        name="mark_email_processed",
+        description="Mark an email as processed",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "email_id": {
+                    "type": "string",
+                    "description": "Gmail message ID to mark as processed",
+                }
+            },
+            "required": ["email_id"],
+        },
+    ),
+]
+
+
+# Message bodies never change, so they are kept longer than listings;
+# marking an email processed relabels it and drops the cached listings
+CACHED_READS = {
+    "get_recent_emails": CachePolicy(
+        "gmail",
+        defaults={
+            "max_results": 10,
+            "newer_than_days": 7,
+            "max_chars": GMAIL_PAGE_CHAR_BUDGET,
+        },
+    ),
+    "get_email_content": CachePolicy("gmail_content", ttl=MCP_EMAIL_CACHE_TTL),
+}
+WRITES = {"mark_email_processed": "gmail"}
+
+
+@cached_tool(reads=CACHED_READS, writes=WRITES)
+async def handle_tool(name: str, arguments: dict) -> List[TextContent]:
+    """Route one Gmail tool call."""
+    if name == "get_recent_emails":
+        try:
+            page = await _recent_emails_page(
+                page_size=int(arguments.get("max_results", 10)),
+                newer_than_days=int(arguments.get("newer_than_days", 7)),
+                cursor=arguments.get("cursor"),
+                max_chars=int(arguments.get("max_chars") or GMAIL_PAGE_CHAR_BUDGET),
+            )
+            return [
+                TextContent(
+                    type="text",
+                    text=json.dumps(page, ensure_ascii=False, separators=(",", ":")),
+                )
+            ]
+
+        except Exception as e:
+            return [TextContent(type="text", text=f"Error fetching emails: {str(e)}")]
+
+    elif name == "get_email_content":
+        email_id = arguments["email_id"]
+        try:
+            summary = await run_blocking(_fetch_summary, email_id)
+            return [
+                TextContent(
+                    type="text",
+                    text=f"Email content: {summary['text'][:1000]}...",
+                )
+            ]
+        except Exception as e:
+            return [
+                TextContent(type="text", text=f"Error fetching email content: {str(e)}")
+            ]
+
+    elif name == "mark_email_processed":
+        email_id = arguments["email_id"]
+        # In a real implementation, you'd save this to a database
+        return [TextContent(type="text", text=f"Marked email {email_id} as processed")]
+
+    else:
+        return [TextContent(type="text", text=f"Unknown tool: {name}")]
+
+
+async def _recent_emails_page(
+    page_size: int = 10,
+    newer_than_days: int = 7,
+    cursor: Optional[str] = None,
+    max_chars: int = GMAIL_PAGE_CHAR_BUDGET,
+) -> dict:
+    """
+    One page of compact email records within `max_chars`.
+
+    Messages are fetched in parallel waves sized so every fetched message
+    fits the remaining budget (a record that runs over has its text
+    shortened), so each message is fetched once across the whole stream.
+
+    Returns:
+        dict: emails (list of compact records) and next_cursor (None at the end)
+    """
+    from agent.gmail_client import list_message_page
+
+    page_size = max(1, min(page_size, 100))
+    if cursor:
+        page_token, offset, newer_than_days = decode_cursor(cursor)
+    else:
+        page_token, offset = None, 0
+
+    # Re-list from the same token; `offset` skips what earlier pages sent
+    messages, next_token = await run_blocking(
+        list_message_page,
+        query=JOB_EMAIL_QUERY,
+        page_size=min(offset + page_size, 500),
+        newer_than_days=newer_than_days,
+        page_token=page_token,
+    )
+    ids = [m["id"] for m in messages[offset : offset + page_size]]
+
+    emails, used, full = [], 0, False
+    max_record = GMAIL_EMAIL_TEXT_CHARS + _RECORD_OVERHEAD_CHARS
+    while not full and len(emails) < len(ids):
+        remaining = max_chars - used
+        if emails and remaining < _RECORD_OVERHEAD_CHARS + _MIN_TEXT_CHARS:
+            break
+        wave = ids[len(emails) : len(emails) + max(1, remaining // max_record)]
+        summaries = await asyncio.gather(
+            *(run_blocking(_fetch_summary, i) for i in wave)
+        )
+
+        for summary in summaries:
+            record = compact_email(summary)
+            over = used + _record_chars(record) - max_chars
+            if over > 0:
+                keep = len(record["text"]) - over - 1
+                if emails and keep < _MIN_TEXT_CHARS:
+                    # Rare: headers alone overflow; this message starts the next page
+                    full = True
+                    break
+                record["text"] = record["text"][: max(keep, 0)].rstrip() + "…"
+            emails.append(record)
+            used += _record_chars(record)
+
+    taken = len(emails)
+    consumed = offset + taken
+    if consumed < len(messages):
+        next_cursor = encode_cursor(page_token, consumed, newer_than_days)
+    elif next_token:
+        next_cursor = encode_cursor(next_token, 0, newer_than_days)
+    else:
+        next_cursor = None
+
+    print(
+        f"[GMAIL] Page of {len(emails)} emails, {used} chars, "
+        f"{'more' if next_cursor else 'end'}",
+        file=sys.stderr,
+    )
+    return {"emails": emails, "next_cursor": next_cursor}
 
 
 class GmailMCPServer:
@@ -21,142 +297,29 @@ class GmailMCPServer:
     def _setup_tools(self):
         @self.server.list_tools()
         async def list_tools() -> List[Tool]:
-            return [
-                Tool(
-                    name="get_recent_emails",
-                    description="Fetch recent emails from Gmail",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "max_results": {
-                                "type": "integer",
-                                "description": "Maximum number of emails to fetch",
-                                "default": 10,
-                            },
-                            "newer_than_days": {
-                                "type": "integer",
-                                "description": "Only fetch emails newer than X days",
-                                "default": 7,
-                            },
-                        },
-                    },
-                ),
-                Tool(
-                    name="get_email_content",
-                    description="Get full content of a specific email",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "email_id": {
-                                "type": "string",
-                                "description": "Gmail message ID",
-                            }
-                        },
-                        "required": ["email_id"],
-                    },
-                ),
-                Tool(
-                    name="mark_email_processed",
-                    description="Mark an email as processed",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "email_id": {
-                                "type": "string",
-                                "description": "Gmail message ID to mark as processed",
-                            }
-                        },
-                        "required": ["email_id"],
-                    },
-                ),
-            ]
+            return TOOLS
 
         @self.server.call_tool()
         async def call_tool(name: str, arguments: dict) -> List[TextContent]:
-            if name == "get_recent_emails":
-                max_results = arguments.get("max_results", 10)
-                newer_than_days = arguments.get("newer_than_days", 7)
-
-                try:
-                    # Filter for job application related emails only - use simpler query
-                    query = "application OR applied OR interview OR assessment OR offer OR rejection -label:spam -label:promotions"
-                    msg_ids = list_messages(
-                        query=query,
-                        max_results=max_results,
-                        newer_than_days=newer_than_days,
-                    )
-                    emails = []
-
-                    for msg_id in msg_ids:
-                        msg = get_message(msg_id["id"])
-                        summary = message_summary(msg)
-                        emails.append(
-                            EmailData(
-                                id=summary["id"],
-                                subject=summary.get("subject", ""),
-                                sender=summary.get("from", ""),
-                                date=summary.get("date", ""),
-                                text=summary.get("text", ""),
-                                snippet=summary.get("snippet", ""),
-                            )
-                        )
-
-                    return [
-                        TextContent(type="text", text=f"Fetched {len(emails)} emails")
-                    ]
-
-                except Exception as e:
-                    return [
-                        TextContent(
-                            type="text", text=f"Error fetching emails: {str(e)}"
-                        )
-                    ]
-
-            elif name == "get_email_content":
-                email_id = arguments["email_id"]
-                try:
-                    msg = get_message(email_id)
-                    summary = message_summary(msg)
-                    return [
-                        TextContent(
-                            type="text",
-                            text=f"Email content: {summary['text'][:1000]}...",
-                        )
-                    ]
-                except Exception as e:
-                    return [
-                        TextContent(
-                            type="text", text=f"Error fetching email content: {str(e)}"
-                        )
-                    ]
-
-            elif name == "mark_email_processed":
-                email_id = arguments["email_id"]
-                # In a real implementation, you'd save this to a database
-                return [
-                    TextContent(
-                        type="text", text=f"Marked email {email_id} as processed"
-                    )
-                ]
-
-            else:
-                return [TextContent(type="text", text=f"Unknown tool: {name}")]
-
-    async def run(self):
-        async with stdio_server() as (read_stream, write_stream):
-            await self.server.run(
-                read_stream,
-                write_stream,
-                InitializationOptions(
-                    server_name="gmail-mcp-server",
-                    server_version="1.0.0",
-                    capabilities=self.server.get_capabilities(
-                        notification_options=None, experimental_capabilities=None
-                    ),
-                ),
+            # Bounded per tool, so a stalled Gmail call never hangs the client
+            return await call_with_timeout(
+                name,
+                lambda: handle_tool(name, arguments),
+                lambda message: [TextContent(type="text", text=message)],
             )
 
+    async def run(
+        self,
+        transport: str = MCP_TRANSPORT,
+        host: str = MCP_HTTP_HOST,
+        port: int = MCP_HTTP_PORT,
+    ):
+        await serve(self.server, "gmail-mcp-server", transport, host, port)
+
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Gmail MCP server")
+    add_transport_arguments(parser)
+    args = parser.parse_args()
     server = GmailMCPServer()
-    asyncio.run(server.run())
+    asyncio.run(server.run(args.transport, args.host, args.port))
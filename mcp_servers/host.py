@@ -0,0 +1,123 @@
+"""
+Single-process MCP host for the JobSync toolsets.
+Serves the Gmail, Notion and weekly-report tools from one stdio server
+instead of three processes. Toolset modules only define tool schemas at
+import time; their backends (googleapiclient, notion_client, the local
+store) are imported on first tool use, and Notion clients, the rate
+limiter, the local index and the Gmail service are shared by every tool.
+
+Usage:
+    python -m mcp_servers.host [--toolsets gmail,notion,weekly_report]
+                               [--transport stdio|http] [--host H] [--port P]
+"""
+
+import argparse
+import asyncio
+import importlib
+import json
+import os
+import sys
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from mcp.server import Server
+from mcp.types import Tool, TextContent
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from shared.config import MCP_TRANSPORT, MCP_HTTP_HOST, MCP_HTTP_PORT
+from shared.tool_runtime import call_with_timeout
+from shared.tool_cache import tool_cache
+from mcp_servers.transport import add_transport_arguments, serve
+
+# Toolset name -> module exposing TOOLS and handle_tool(name, arguments)
+TOOLSETS = {
+    "gmail": "mcp_servers.gmail_server",
+    "notion": "mcp_servers.notion_server",
+    "weekly_report": "mcp_servers.weekly_report_server",
+}
+
+# Served by the host itself rather than a toolset
+CACHE_STATS_TOOL = Tool(
+    name="get_tool_cache_stats",
+    description="Hit rates, size and invalidations of the MCP tool result cache",
+    inputSchema={"type": "object", "properties": {}},
+)
+
+Handler = Callable[[str, Dict[str, Any]], Awaitable[List[TextContent]]]
+
+
+class MCPHost:
+    def __init__(self, toolsets: Optional[Iterable[str]] = None):
+        self.server = Server("jobsync-mcp-host")
+        self.tools: List[Tool] = []
+        self.routes: Dict[str, Handler] = {}
+        for toolset in toolsets or TOOLSETS:
+            self._register(toolset)
+        self.tools.append(CACHE_STATS_TOOL)
+        self._setup_tools()
+
+    def _register(self, toolset: str):
+        """Add a toolset's tools; the first toolset to define a name keeps it."""
+        try:
+            module = importlib.import_module(TOOLSETS[toolset])
+            tools, handler = module.TOOLS, module.handle_tool
+        except Exception as e:
+            # stdout carries the MCP stream, so log on stderr
+            print(f"[MCP] Skipping {toolset} toolset: {e!r}", file=sys.stderr)
+            return
+
+        for tool in tools:
+            if tool.name in self.routes:
+                print(
+                    f"[MCP] {toolset}: {tool.name} already served by another toolset",
+                    file=sys.stderr,
+                )
+                continue
+            self.tools.append(tool)
+            self.routes[tool.name] = handler
+
+    def _setup_tools(self):
+        @self.server.list_tools()
+        async def list_tools() -> List[Tool]:
+            return self.tools
+
+        @self.server.call_tool()
+        async def call_tool(name: str, arguments: dict) -> List[TextContent]:
+            if name == CACHE_STATS_TOOL.name:
+                text = json.dumps(tool_cache.stats(), indent=2)
+                return [TextContent(type="text", text=text)]
+            handler = self.routes.get(name)
+            if handler is None:
+                return [TextContent(type="text", text=f"Unknown tool: {name}")]
+            return await call_with_timeout(
+                name,
+                lambda: handler(name, arguments or {}),
+                lambda message: [TextContent(type="text", text=message)],
+            )
+
+    async def run(
+        self,
+        transport: str = MCP_TRANSPORT,
+        host: str = MCP_HTTP_HOST,
+        port: int = MCP_HTTP_PORT,
+    ):
+        await serve(self.server, "jobsync-mcp-host", transport, host, port)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve all JobSync MCP toolsets")
+    parser.add_argument(
+        "--toolsets",
+        default=",".join(TOOLSETS),
+        help="Comma-separated toolsets to register (default: all)",
+    )
+    add_transport_arguments(parser)
+    args = parser.parse_args()
+    toolsets = [t.strip() for t in args.toolsets.split(",") if t.strip()]
+    unknown = [t for t in toolsets if t not in TOOLSETS]
+    if unknown:
+        parser.error(f"unknown toolsets: {', '.join(unknown)}")
+    asyncio.run(MCPHost(toolsets).run(args.transport, args.host, args.port))
+
+
+if __name__ == "__main__":
+    main()
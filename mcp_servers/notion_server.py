@@ -1,38 +1,63 @@
+import argparse
 import asyncio
 import json
 from typing import List, Optional
 from mcp.server import Server
-from mcp.server.models import InitializationOptions
-from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 import sys
 import os
 
 # Add parent directory to path to import existing Notion client
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
-from agent.notion_utils import (
-    create_or_update_entry,
-    find_entry_by_app_id,
-    create_weekly_report,
-    notion,
-    NOTION_DATABASE_ID,
-)
+# notion_utils / notion_async (notion_client, httpx, the local store) are
+# imported on first tool use, so hosting these tools costs no startup time
 from shared.models import JobApplicationData
-
-
-class NotionMCPServer:
-    def __init__(self):
-        self.server = Server("notion-mcp-server")
-        self._setup_tools()
-
-    def _setup_tools(self):
-        @self.server.list_tools()
-        async def list_tools() -> List[Tool]:
-            return [
-                Tool(
-                    name="create_job_application",
-                    description="Create a new job application entry in Notion",
-                    inputSchema={
+from shared.notion_schema import decode_job_page
+from shared.projection import (
+    COMPACT_FIELDS,
+    estimate_raw_tokens,
+    format_compact,
+    parse_fields,
+    project_page,
+    token_savings,
+)
+from shared.config import MCP_TRANSPORT, MCP_HTTP_HOST, MCP_HTTP_PORT
+from shared.tool_runtime import call_with_timeout, run_blocking, tool_timeout
+from shared.tool_cache import CachePolicy, cached_tool
+from mcp_servers.transport import add_transport_arguments, serve
+
+# === TOOLS ===
+TOOLS = [
+    Tool(
+        name="create_job_application",
+        description="Create a new job application entry in Notion",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "company": {"type": "string"},
+                "job_title": {"type": "string"},
+                "status": {"type": "string"},
+                "applied_on": {"type": "string"},
+                "notes": {"type": "string", "default": ""},
+                "app_id": {"type": "string", "default": None},
+            },
+            "required": ["company", "job_title", "status", "applied_on"],
+        },
+    ),
+    Tool(
+        name="upsert_job_applications",
+        description=(
+            "Create or update many job applications in one call. Duplicates "
+            "(same Application ID, or same company and job title) are merged "
+            "into existing entries; near-duplicates are listed, not merged. "
+            "Returns one result row per application."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "applications": {
+                    "type": "array",
+                    "items": {
                         "type": "object",
                         "properties": {
                             "company": {"type": "string"},
@@ -42,371 +67,496 @@ class NotionMCPServer:
                             "notes": {"type": "string", "default": ""},
                             "app_id": {"type": "string", "default": None},
                         },
-                        "required": ["company", "job_title", "status", "applied_on"],
-                    },
-                ),
-                Tool(
-                    name="update_job_application",
-                    description="Update an existing job application",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "app_id": {"type": "string"},
-                            "updates": {"type": "object"},
-                        },
-                        "required": ["app_id", "updates"],
-                    },
-                ),
-                Tool(
-                    name="find_application_by_id",
-                    description="Find application by ID to check for duplicates",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {"app_id": {"type": "string"}},
-                        "required": ["app_id"],
-                    },
-                ),
-                Tool(
-                    name="create_weekly_report",
-                    description="Create weekly report entry",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "title": {"type": "string"},
-                            "week_range": {"type": "string"},
-                            "summary": {"type": "string"},
-                            "created_on": {"type": "string"},
-                        },
-                        "required": ["title", "week_range", "summary", "created_on"],
+                        "required": [
+                            "company",
+                            "job_title",
+                            "status",
+                            "applied_on",
+                        ],
                     },
-                ),
-                Tool(
-                    name="search_similar_entries",
-                    description="Search for similar job application entries in the database",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "company": {
-                                "type": "string",
-                                "description": "Company name to search for",
-                            },
-                            "job_title": {
-                                "type": "string",
-                                "description": "Job title to search for",
-                            },
-                            "limit": {
-                                "type": "integer",
-                                "description": "Maximum number of results to return",
-                                "default": 10,
-                            },
-                        },
-                        "required": ["company", "job_title"],
-                    },
-                ),
-                Tool(
-                    name="update_existing_entry",
-                    description="Update an existing job application entry",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "entry_id": {
-                                "type": "string",
-                                "description": "Notion page ID of the entry to update",
-                            },
-                            "status": {
-                                "type": "string",
-                                "description": "New status for the entry",
-                            },
-                            "notes": {
-                                "type": "string",
-                                "description": "Additional notes to append",
-                                "default": "",
-                            },
-                        },
-                        "required": ["entry_id", "status"],
-                    },
-                ),
-                Tool(
-                    name="get_all_recent_entries",
-                    description="Get all recent job application entries for duplicate detection",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "days": {
-                                "type": "integer",
-                                "description": "Number of days to look back",
-                                "default": 30,
-                            }
-                        },
-                    },
-                ),
-            ]
+                },
+            },
+            "required": ["applications"],
+        },
+    ),
+    Tool(
+        name="update_job_application",
+        description="Update an existing job application",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "app_id": {"type": "string"},
+                "updates": {"type": "object"},
+            },
+            "required": ["app_id", "updates"],
+        },
+    ),
+    Tool(
+        name="find_application_by_id",
+        description="Find application by ID to check for duplicates",
+        inputSchema={
+            "type": "object",
+            "properties": {"app_id": {"type": "string"}},
+            "required": ["app_id"],
+        },
+    ),
+    Tool(
+        name="create_weekly_report",
+        description="Create weekly report entry",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {"type": "string"},
+                "week_range": {"type": "string"},
+                "summary": {"type": "string"},
+                "created_on": {"type": "string"},
+            },
+            "required": ["title", "week_range", "summary", "created_on"],
+        },
+    ),
+    Tool(
+        name="search_similar_entries",
+        description="Search for similar job application entries in the database, ranked by company and job title similarity (score 0-1)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "company": {
+                    "type": "string",
+                    "description": "Company name to search for",
+                },
+                "job_title": {
+                    "type": "string",
+                    "description": "Job title to search for",
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of results to return",
+                    "default": 10,
+                },
+            },
+            "required": ["company", "job_title"],
+        },
+    ),
+    Tool(
+        name="update_existing_entry",
+        description="Update an existing job application entry",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "entry_id": {
+                    "type": "string",
+                    "description": "Notion page ID of the entry to update",
+                },
+                "status": {
+                    "type": "string",
+                    "description": "New status for the entry",
+                },
+                "notes": {
+                    "type": "string",
+                    "description": "Additional notes to append",
+                    "default": "",
+                },
+            },
+            "required": ["entry_id", "status"],
+        },
+    ),
+    Tool(
+        name="get_all_recent_entries",
+        description="Get job application entries applied within the last N days (most recent first) for duplicate detection",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "days": {
+                    "type": "integer",
+                    "description": "Number of days to look back (by Applied On)",
+                    "default": 30,
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum entries to return, most recent first (0 = all)",
+                    "default": 0,
+                },
+                "fields": {
+                    "type": "array",
+                    "items": {"type": "string", "enum": list(COMPACT_FIELDS)},
+                    "description": "Fields to return (default: all)",
+                },
+                "format": {
+                    "type": "string",
+                    "enum": ["tsv", "json"],
+                    "description": "Compact output format (TSV rows or minified JSON)",
+                    "default": "tsv",
+                },
+            },
+        },
+    ),
+]
+
+
+# Read-only tools served from the shared result cache; every write tool
+# drops all cached Notion reads
+CACHED_READS = {
+    "get_all_recent_entries": CachePolicy(
+        "notion",
+        defaults={
+            "days": 30,
+            "limit": 0,
+            "fields": list(COMPACT_FIELDS),
+            "format": "tsv",
+        },
+    ),
+    "search_similar_entries": CachePolicy("notion", defaults={"limit": 10}),
+    "find_application_by_id": CachePolicy("notion"),
+}
+WRITES = {
+    "create_job_application": "notion",
+    "upsert_job_applications": "notion",
+    "update_job_application": "notion",
+    "update_existing_entry": "notion",
+    "create_weekly_report": "notion",
+}
+
+
+@cached_tool(reads=CACHED_READS, writes=WRITES)
+async def handle_tool(name: str, arguments: dict) -> List[TextContent]:
+    """Route one Notion tool call; the Notion backend is imported on first use."""
+    from agent.notion_utils import (
+        cache_page_snapshots,
+        find_entry_by_app_id,
+        find_possible_duplicates,
+        search_similar_entries,
+        create_weekly_report,
+    )
+    from agent.notion_async import (
+        aiter_recent_entries,
+        acreate_or_update_entry,
+        aupdate_entry,
+    )
+
+    if name == "create_job_application":
+        try:
+            result, was_updated = await acreate_or_update_entry(
+                company=arguments["company"],
+                job_title=arguments["job_title"],
+                status=arguments["status"],
+                applied_on=arguments["applied_on"],
+                notes=arguments.get("notes", ""),
+                app_id=arguments.get("app_id"),
+            )
 
-        @self.server.call_tool()
-        async def call_tool(name: str, arguments: dict) -> List[TextContent]:
-            if name == "create_job_application":
-                try:
-                    result, was_updated = create_or_update_entry(
-                        company=arguments["company"],
-                        job_title=arguments["job_title"],
-                        status=arguments["status"],
-                        applied_on=arguments["applied_on"],
-                        notes=arguments.get("notes", ""),
-                        app_id=arguments.get("app_id"),
+            if result:
+                action = "Updated" if was_updated else "Created"
+                text = f"{action} job application: {arguments['company']} - {arguments['job_title']}"
+                if not was_updated:
+                    # Near-duplicates are never merged automatically
+                    similar = await run_blocking(
+                        find_possible_duplicates,
+                        arguments["company"],
+                        arguments["job_title"],
                     )
-
-                    if result:
-                        action = "Updated" if was_updated else "Created"
-                        return [
-                            TextContent(
-                                type="text",
-                                text=f"{action} job application: {arguments['company']} - {arguments['job_title']}",
-                            )
-                        ]
-                    else:
-                        return [
-                            TextContent(
-                                type="text",
-                                text="Failed to create/update job application",
-                            )
-                        ]
-
-                except Exception as e:
-                    return [
-                        TextContent(
-                            type="text",
-                            text=f"Error creating job application: {str(e)}",
-                        )
-                    ]
-
-            elif name == "find_application_by_id":
-                app_id = arguments["app_id"]
-                try:
-                    existing = find_entry_by_app_id(app_id)
-                    if existing:
-                        return [
-                            TextContent(
-                                type="text",
-                                text=f"Found existing application with ID: {app_id}",
-                            )
-                        ]
-                    else:
-                        return [
-                            TextContent(
-                                type="text",
-                                text=f"No existing application found with ID: {app_id}",
-                            )
-                        ]
-                except Exception as e:
-                    return [
-                        TextContent(
-                            type="text", text=f"Error finding application: {str(e)}"
+                    similar = [e for e in similar if e["id"] != result["id"]]
+                    if similar:
+                        text += (
+                            "\nPossible duplicates (merge with update_existing_entry "
+                            "only if it is the same application): "
+                            + json.dumps(similar)
                         )
-                    ]
-
-            elif name == "create_weekly_report":
-                try:
-                    result = create_weekly_report(
-                        title=arguments["title"],
-                        week_range=arguments["week_range"],
-                        summary=arguments["summary"],
-                        created_on=arguments["created_on"],
+                return [TextContent(type="text", text=text)]
+            else:
+                return [
+                    TextContent(
+                        type="text",
+                        text="Failed to create/update job application",
                     )
+                ]
 
-                    if result:
-                        return [
-                            TextContent(
-                                type="text",
-                                text=f"Created weekly report: {arguments['title']}",
-                            )
-                        ]
-                    else:
-                        return [
-                            TextContent(
-                                type="text", text="Failed to create weekly report"
-                            )
-                        ]
-
-                except Exception as e:
-                    return [
-                        TextContent(
-                            type="text", text=f"Error creating weekly report: {str(e)}"
-                        )
-                    ]
-
-            elif name == "search_similar_entries":
-                company = arguments["company"]
-                job_title = arguments["job_title"]
-                limit = arguments.get("limit", 10)
-
-                try:
-                    # Search for entries with similar company name
-                    resp = notion.databases.query(
-                        database_id=NOTION_DATABASE_ID,
-                        filter={
-                            "property": "Company",
-                            "rich_text": {"contains": company},
-                        },
-                        page_size=limit,
-                    )
+        except Exception as e:
+            return [
+                TextContent(
+                    type="text",
+                    text=f"Error creating job application: {str(e)}",
+                )
+            ]
 
-                    # Format results for LLM
-                    entries = []
-                    for page in resp.get("results", []):
-                        props = page.get("properties", {})
-                        entries.append(
-                            {
-                                "id": page["id"],
-                                "company": props.get("Company", {})
-                                .get("rich_text", [{}])[0]
-                                .get("text", {})
-                                .get("content", ""),
-                                "job_title": props.get("Job Title", {})
-                                .get("rich_text", [{}])[0]
-                                .get("text", {})
-                                .get("content", ""),
-                                "status": props.get("Status", {})
-                                .get("status", {})
-                                .get("name", ""),
-                                "applied_on": props.get("Applied On", {})
-                                .get("date", {})
-                                .get("start", ""),
-                                "notes": props.get("Notes", {})
-                                .get("rich_text", [{}])[0]
-                                .get("text", {})
-                                .get("content", ""),
-                                "app_id": props.get("Application ID", {})
-                                .get("rich_text", [{}])[0]
-                                .get("text", {})
-                                .get("content", ""),
-                            }
-                        )
+    elif name == "upsert_job_applications":
+        try:
+            text = await _upsert_batch(arguments.get("applications") or [])
+            return [TextContent(type="text", text=text)]
 
-                    return [TextContent(type="text", text=json.dumps(entries))]
+        except Exception as e:
+            return [
+                TextContent(
+                    type="text", text=f"Error upserting job applications: {str(e)}"
+                )
+            ]
 
-                except Exception as e:
-                    return [
-                        TextContent(
-                            type="text", text=f"Error searching entries: {str(e)}"
-                        )
-                    ]
-
-            elif name == "update_existing_entry":
-                entry_id = arguments["entry_id"]
-                status = arguments["status"]
-                notes = arguments.get("notes", "")
-
-                try:
-                    # Update the existing entry
-                    update_props = {"Status": {"status": {"name": status}}}
-
-                    if notes:
-                        # Get existing notes and append new ones
-                        existing_page = notion.pages.retrieve(page_id=entry_id)
-                        existing_notes = (
-                            existing_page.get("properties", {})
-                            .get("Notes", {})
-                            .get("rich_text", [])
-                        )
-                        old_notes_text = (
-                            existing_notes[0].get("text", {}).get("content", "")
-                            if existing_notes
-                            else ""
-                        )
-                        new_notes = f"{old_notes_text}\n\n[Update] {notes}".strip()
-                        update_props["Notes"] = {
-                            "rich_text": [{"text": {"content": new_notes}}]
-                        }
+    elif name == "find_application_by_id":
+        app_id = arguments["app_id"]
+        try:
+            existing = await run_blocking(find_entry_by_app_id, app_id)
+            if existing:
+                return [
+                    TextContent(
+                        type="text",
+                        text=f"Found existing application with ID: {app_id}",
+                    )
+                ]
+            else:
+                return [
+                    TextContent(
+                        type="text",
+                        text=f"No existing application found with ID: {app_id}",
+                    )
+                ]
+        except Exception as e:
+            return [
+                TextContent(type="text", text=f"Error finding application: {str(e)}")
+            ]
 
-                    result = notion.pages.update(
-                        page_id=entry_id, properties=update_props
+    elif name == "create_weekly_report":
+        try:
+            result = await run_blocking(
+                create_weekly_report,
+                title=arguments["title"],
+                week_range=arguments["week_range"],
+                summary=arguments["summary"],
+                created_on=arguments["created_on"],
+            )
+
+            if result:
+                return [
+                    TextContent(
+                        type="text",
+                        text=f"Created weekly report: {arguments['title']}",
                     )
+                ]
+            else:
+                return [TextContent(type="text", text="Failed to create weekly report")]
 
-                    return [
-                        TextContent(
-                            type="text",
-                            text=f"Updated entry {entry_id} with status: {status}",
-                        )
-                    ]
+        except Exception as e:
+            return [
+                TextContent(type="text", text=f"Error creating weekly report: {str(e)}")
+            ]
 
-                except Exception as e:
-                    return [
-                        TextContent(type="text", text=f"Error updating entry: {str(e)}")
-                    ]
+    elif name == "search_similar_entries":
+        company = arguments["company"]
+        job_title = arguments["job_title"]
+        limit = arguments.get("limit", 10)
 
-            elif name == "get_all_recent_entries":
-                days = arguments.get("days", 30)
+        try:
+            # Ranked locally over company and title from the trigram
+            # index; no Notion query per search
+            entries = await run_blocking(
+                search_similar_entries, company, job_title, limit
+            )
+            if entries is None:
+                entries = await _remote_company_search(company, limit)
 
-                # Convert days to integer if it's a string (common when called by LLM)
-                if isinstance(days, str):
-                    days = int(days)
+            return [TextContent(type="text", text=json.dumps(entries))]
 
-                try:
-                    # Get all recent entries
-                    resp = notion.databases.query(
-                        database_id=NOTION_DATABASE_ID,
-                        page_size=100,  # Adjust based on your needs
-                    )
+        except Exception as e:
+            return [TextContent(type="text", text=f"Error searching entries: {str(e)}")]
 
-                    # Format results for LLM
-                    entries = []
-                    for page in resp.get("results", []):
-                        props = page.get("properties", {})
-                        entries.append(
-                            {
-                                "id": page["id"],
-                                "company": props.get("Company", {})
-                                .get("rich_text", [{}])[0]
-                                .get("text", {})
-                                .get("content", ""),
-                                "job_title": props.get("Job Title", {})
-                                .get("rich_text", [{}])[0]
-                                .get("text", {})
-                                .get("content", ""),
-                                "status": props.get("Status", {})
-                                .get("status", {})
-                                .get("name", ""),
-                                "applied_on": props.get("Applied On", {})
-                                .get("date", {})
-                                .get("start", ""),
-                                "notes": props.get("Notes", {})
-                                .get("rich_text", [{}])[0]
-                                .get("text", {})
-                                .get("content", ""),
-                                "app_id": props.get("Application ID", {})
-                                .get("rich_text", [{}])[0]
-                                .get("text", {})
-                                .get("content", ""),
-                            }
-                        )
+    elif name == "update_existing_entry":
+        entry_id = arguments["entry_id"]
+        status = arguments["status"]
+        notes = arguments.get("notes", "")
 
-                    return [TextContent(type="text", text=json.dumps(entries))]
+        try:
+            # Old notes come from the cached snapshot: one request per update
+            result = await aupdate_entry(entry_id, status, notes)
+            if not result:
+                return [
+                    TextContent(type="text", text=f"Failed to update entry {entry_id}")
+                ]
 
-                except Exception as e:
-                    return [
-                        TextContent(
-                            type="text", text=f"Error getting recent entries: {str(e)}"
-                        )
-                    ]
+            return [
+                TextContent(
+                    type="text",
+                    text=f"Updated entry {entry_id} with status: {status}",
+                )
+            ]
 
-            else:
-                return [TextContent(type="text", text=f"Unknown tool: {name}")]
-
-    async def run(self):
-        async with stdio_server() as (read_stream, write_stream):
-            await self.server.run(
-                read_stream,
-                write_stream,
-                InitializationOptions(
-                    server_name="notion-mcp-server",
-                    server_version="1.0.0",
-                    capabilities=self.server.get_capabilities(
-                        notification_options=None, experimental_capabilities=None
-                    ),
-                ),
+        except Exception as e:
+            return [TextContent(type="text", text=f"Error updating entry: {str(e)}")]
+
+    elif name == "get_all_recent_entries":
+        try:
+            # Convert numbers to integers if they are strings (common when called by LLM)
+            days = int(arguments.get("days", 30))
+            limit = int(arguments.get("limit") or 0)
+            fields = parse_fields(arguments.get("fields"))
+
+            # Date window, sort and limit run in Notion; each batch is
+            # projected as it arrives, so raw pages are never all held
+            records, raw_tokens = [], 0
+            async for batch in aiter_recent_entries(days, limit):
+                await run_blocking(cache_page_snapshots, batch)
+                records.extend(project_page(page) for page in batch)
+                raw_tokens += estimate_raw_tokens(batch)
+
+            # Compact projection keeps raw page objects out of the LLM context
+            text = format_compact(records, arguments.get("format", "tsv"), fields)
+            stats = token_savings(len(records), raw_tokens, text)
+            # stdout carries the MCP stream, so report savings on stderr
+            print(
+                f"[TOKENS] {stats['entries']} entries: ~{stats['compact_tokens']} tokens "
+                f"(raw ~{stats['raw_tokens']}, -{stats['saved_pct']}%)",
+                file=sys.stderr,
+            )
+            return [TextContent(type="text", text=text)]
+
+        except Exception as e:
+            return [
+                TextContent(type="text", text=f"Error getting recent entries: {str(e)}")
+            ]
+
+    else:
+        return [TextContent(type="text", text=f"Unknown tool: {name}")]
+
+
+async def _upsert_batch(applications: List[dict]) -> str:
+    """
+    Upsert a batch concurrently under the rate limiter and render one
+    TSV row per input item: created, updated, merged (same entry as an
+    earlier item in the batch), invalid, failed or timed out (not
+    confirmed before the tool timeout; safe to resend). Created rows list
+    any near-duplicate entries for the caller to confirm.
+    """
+    from agent.notion_async import aupsert_entries
+    from agent.notion_utils import find_possible_duplicates
+
+    fields = ("company", "job_title", "status", "applied_on", "notes", "app_id")
+    required = fields[:4]
+
+    valid, rows = [], [None] * len(applications)
+    for i, app in enumerate(applications):
+        app = app if isinstance(app, dict) else {}
+        missing = [f for f in required if not str(app.get(f) or "").strip()]
+        if missing:
+            rows[i] = ("invalid", "missing " + ",".join(missing))
+        else:
+            valid.append((i, {f: app.get(f, "") for f in fields}))
+
+    # Stop writing shortly before the tool timeout, so the rows of the
+    # applications already written still reach the client
+    timeout = tool_timeout("upsert_job_applications")
+    budget = timeout - min(5.0, timeout / 10) if timeout > 0 else None
+    results = await aupsert_entries([app for _, app in valid], timeout=budget)
+
+    written_by = {}
+    for (i, _), result in zip(valid, results):
+        page, was_updated = result or (None, False)
+        if result is None:
+            rows[i] = ("timed out", "")
+        elif not page:
+            rows[i] = ("failed", "")
+        elif page["id"] in written_by:
+            rows[i] = ("merged", page["id"])
+        else:
+            rows[i] = ("updated" if was_updated else "created", page["id"])
+            written_by[page["id"]] = i
+
+    def similar_ids():
+        return {
+            i: ",".join(
+                entry["id"]
+                for entry in find_possible_duplicates(
+                    applications[i]["company"], applications[i]["job_title"]
+                )
+                if entry["id"] != detail
+            )
+            for i, (result, detail) in enumerate(rows)
+            if result == "created"
+        }
+
+    similar = await run_blocking(similar_ids)
+
+    counts = {}
+    lines = ["#\tresult\tcompany\tjob_title\tentry_id\tsimilar"]
+    for i, (result, detail) in enumerate(rows):
+        app = applications[i] if isinstance(applications[i], dict) else {}
+        counts[result] = counts.get(result, 0) + 1
+        lines.append(
+            "\t".join(
+                [str(i), result]
+                + [
+                    " ".join(str(app.get(f) or "").split())
+                    for f in ("company", "job_title")
+                ]
+                + [detail, similar.get(i, "")]
             )
+        )
+    summary = ", ".join(f"{n} {result}" for result, n in counts.items())
+    print(f"[NOTION] Batch upsert of {len(applications)}: {summary}", file=sys.stderr)
+    return f"{len(applications)} applications: {summary or 'none'}\n" + "\n".join(lines)
+
+
+async def _remote_company_search(company: str, limit: int) -> List[dict]:
+    """Company "contains" query against Notion when no local index exists."""
+    from agent.notion_utils import cache_page_snapshots
+    from agent.notion_async import aiter_query_pages
+
+    pages = []
+    async for batch in aiter_query_pages(
+        page_size=min(limit, 100),
+        filter={"property": "Company", "rich_text": {"contains": company}},
+    ):
+        pages.extend(batch)
+        if len(pages) >= limit:
+            break
+
+    # Entry ids handed to the LLM can be updated without a retrieve
+    await run_blocking(cache_page_snapshots, pages[:limit])
+
+    entries = []
+    for page in pages[:limit]:
+        record = decode_job_page(page)
+        entries.append(
+            {
+                "id": record.id,
+                "company": record.company,
+                "job_title": record.job_title,
+                "status": record.status,
+                "applied_on": record.applied_on,
+                "notes": record.notes,
+                "app_id": record.app_id,
+            }
+        )
+    return entries
+
+
+class NotionMCPServer:
+    def __init__(self):
+        self.server = Server("notion-mcp-server")
+        self._setup_tools()
+
+    def _setup_tools(self):
+        @self.server.list_tools()
+        async def list_tools() -> List[Tool]:
+            return TOOLS
+
+        @self.server.call_tool()
+        async def call_tool(name: str, arguments: dict) -> List[TextContent]:
+            # Bounded per tool, so a stalled Notion call never hangs the client
+            return await call_with_timeout(
+                name,
+                lambda: handle_tool(name, arguments),
+                lambda message: [TextContent(type="text", text=message)],
+            )
+
+    async def run(
+        self,
+        transport: str = MCP_TRANSPORT,
+        host: str = MCP_HTTP_HOST,
+        port: int = MCP_HTTP_PORT,
+    ):
+        await serve(self.server, "notion-mcp-server", transport, host, port)
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Notion MCP server")
+    add_transport_arguments(parser)
+    args = parser.parse_args()
     server = NotionMCPServer()
-    asyncio.run(server.run())
+    asyncio.run(server.run(args.transport, args.host, args.port))
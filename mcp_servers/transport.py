@@ -0,0 +1,117 @@
+"""
+Transports for the JobSync MCP servers.
+"stdio" (default) serves the one client that spawned the process. "http"
+runs a long-lived instance that many clients share concurrently, over
+Streamable HTTP at /mcp and the older SSE transport at /sse, so Gmail and
+Notion clients, the local index and caches stay warm between clients.
+The HTTP transport has no authentication; keep it bound to localhost.
+"""
+
+import argparse
+import sys
+
+from mcp.server import NotificationOptions, Server
+from mcp.server.models import InitializationOptions
+
+from shared.config import MCP_TRANSPORT, MCP_HTTP_HOST, MCP_HTTP_PORT
+from shared.tool_runtime import install_executor, mcp_stdio
+
+TRANSPORTS = ("stdio", "http")
+
+
+def add_transport_arguments(parser: argparse.ArgumentParser):
+    """--transport/--host/--port options, defaulting to the MCP_* settings."""
+    parser.add_argument("--transport", choices=TRANSPORTS, default=MCP_TRANSPORT)
+    parser.add_argument(
+        "--host", default=MCP_HTTP_HOST, help="HTTP bind address (http transport)"
+    )
+    parser.add_argument(
+        "--port", type=int, default=MCP_HTTP_PORT, help="HTTP port (http transport)"
+    )
+
+
+class _StreamableHTTPEndpoint:
+    """ASGI endpoint (a plain function would be wrapped as a request handler)."""
+
+    def __init__(self, sessions):
+        self.sessions = sessions
+
+    async def __call__(self, scope, receive, send):
+        await self.sessions.handle_request(scope, receive, send)
+
+
+def build_http_app(server: Server, options: InitializationOptions):
+    """
+    Starlette app serving `server` over Streamable HTTP (/mcp) and SSE
+    (GET /sse, POST /messages/).
+    """
+    from starlette.applications import Starlette
+    from starlette.requests import Request
+    from starlette.responses import Response
+    from starlette.routing import Mount, Route
+    from mcp.server.sse import SseServerTransport
+    from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+
+    sessions = StreamableHTTPSessionManager(app=server)
+    sse = SseServerTransport("/messages/")
+
+    async def handle_sse(request: Request) -> Response:
+        async with sse.connect_sse(
+            request.scope, request.receive, request._send
+        ) as streams:
+            await server.run(streams[0], streams[1], options)
+        return Response()
+
+    return Starlette(
+        routes=[
+            Route("/mcp", endpoint=_StreamableHTTPEndpoint(sessions)),
+            Route("/sse", endpoint=handle_sse, methods=["GET"]),
+            Mount("/messages/", app=sse.handle_post_message),
+        ],
+        lifespan=lambda app: sessions.run(),
+    )
+
+
+async def serve(
+    server: Server,
+    name: str,
+    transport: str = MCP_TRANSPORT,
+    host: str = MCP_HTTP_HOST,
+    port: int = MCP_HTTP_PORT,
+):
+    """
+    Run an MCP server until its transport closes.
+
+    Args:
+        server: Server with its tool handlers registered
+        name: Server name reported to clients
+        transport: "stdio" or "http"
+        host: Bind address for the http transport
+        port: Port for the http transport
+    """
+    install_executor()
+    options = InitializationOptions(
+        server_name=name,
+        server_version="1.0.0",
+        capabilities=server.get_capabilities(
+            notification_options=NotificationOptions(),
+            experimental_capabilities={},
+        ),
+    )
+
+    if transport == "stdio":
+        async with mcp_stdio() as (read_stream, write_stream):
+            await server.run(read_stream, write_stream, options)
+    elif transport == "http":
+        import uvicorn
+
+        print(
+            f"[MCP] {name} serving http://{host}:{port}/mcp (SSE: /sse)",
+            file=sys.stderr,
+        )
+        config = uvicorn.Config(
+            build_http_app(server, options), host=host, port=port, log_level="warning"
+        )
+        await uvicorn.Server(config).serve()
+    else:
+        raise ValueError(f"Unknown MCP transport: {transport}")
@@ -3,209 +3,224 @@ MCP Server for Weekly Report functionality
 Provides tools for generating weekly reports and summaries
 """
 
+import argparse
+import asyncio
+import json
+from typing import List, Dict, Any
 from mcp.server import Server
 from mcp.types import Tool, TextContent
-from typing import List, Dict, Any, Optional
-import json
 import os
 import sys
-from datetime import datetime, timedelta
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
-
-from agent.notion_utils import get_weekly_application_data, create_weekly_report
+# agent.notion_utils (notion_client, the local store) is imported on first
+# tool use, so hosting these tools costs no startup time
 from shared.utils import format_entries_for_llm, format_deadlines_for_llm
+from shared.config import MCP_TRANSPORT, MCP_HTTP_HOST, MCP_HTTP_PORT
+from shared.tool_runtime import call_with_timeout, run_blocking
+from shared.tool_cache import CachePolicy, cached_tool
+from mcp_servers.transport import add_transport_arguments, serve
 
-
-# Initialize MCP server
-server = Server("weekly-report-server")
-
-
-@server.list_tools()
-async def list_tools() -> List[Tool]:
-    """List available tools for weekly report operations"""
-    return [
-        Tool(
-            name="get_weekly_data",
-            description="Fetch weekly application data from Notion database",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "days": {
-                        "type": "integer",
-                        "description": "Number of days to look back (default: 7)",
-                        "default": 7
-                    }
+# === TOOLS ===
+TOOLS = [
+    Tool(
+        name="get_weekly_data",
+        description="Fetch weekly application data from Notion database",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "days": {
+                    "type": "integer",
+                    "description": "Number of days to look back (default: 7)",
+                    "default": 7,
+                }
+            },
+            "required": [],
+        },
+    ),
+    Tool(
+        name="create_weekly_report",
+        description="Create a weekly report entry in Notion",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {"type": "string", "description": "Report title"},
+                "week_range": {"type": "string", "description": "Week range text"},
+                "summary": {
+                    "type": "string",
+                    "description": "AI-generated summary content",
                 },
-                "required": []
-            }
-        ),
-        Tool(
-            name="create_weekly_report",
-            description="Create a weekly report entry in Notion",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {
-                        "type": "string",
-                        "description": "Report title"
-                    },
-                    "week_range": {
-                        "type": "string",
-                        "description": "Week range text"
+                "created_on": {
+                    "type": "string",
+                    "description": "Creation date in YYYY-MM-DD format",
+                },
+            },
+            "required": ["title", "week_range", "summary", "created_on"],
+        },
+    ),
+    Tool(
+        name="format_entries_for_llm",
+        description="Format application entries for LLM processing",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "entries": {
+                    "type": "array",
+                    "description": "List of application entries",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "company": {"type": "string"},
+                            "job_title": {"type": "string"},
+                            "status": {"type": "string"},
+                            "applied_on": {"type": "string"},
+                            "notes": {"type": "string"},
+                        },
                     },
-                    "summary": {
-                        "type": "string",
-                        "description": "AI-generated summary content"
+                }
+            },
+            "required": ["entries"],
+        },
+    ),
+    Tool(
+        name="format_deadlines_for_llm",
+        description="Format deadlines for LLM processing",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "deadlines": {
+                    "type": "array",
+                    "description": "List of deadline entries",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "company": {"type": "string"},
+                            "job_title": {"type": "string"},
+                            "due": {"type": "string"},
+                            "note": {"type": "string"},
+                        },
                     },
-                    "created_on": {
-                        "type": "string",
-                        "description": "Creation date in YYYY-MM-DD format"
-                    }
-                },
-                "required": ["title", "week_range", "summary", "created_on"]
-            }
-        ),
-        Tool(
-            name="format_entries_for_llm",
-            description="Format application entries for LLM processing",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "entries": {
-                        "type": "array",
-                        "description": "List of application entries",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "company": {"type": "string"},
-                                "job_title": {"type": "string"},
-                                "status": {"type": "string"},
-                                "applied_on": {"type": "string"},
-                                "notes": {"type": "string"}
-                            }
-                        }
-                    }
-                },
-                "required": ["entries"]
-            }
-        ),
-        Tool(
-            name="format_deadlines_for_llm",
-            description="Format deadlines for LLM processing",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "deadlines": {
-                        "type": "array",
-                        "description": "List of deadline entries",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "company": {"type": "string"},
-                                "job_title": {"type": "string"},
-                                "note": {"type": "string"}
-                        }
-                    }
-                },
-                "required": ["deadlines"]
-            }
-        )
-    ]
+                }
+            },
+            "required": ["deadlines"],
+        },
+    ),
+]
 
+# The weekly aggregate is also cached below this layer until the local
+# store changes; this TTL layer skips even that check and the JSON dump
+CACHED_READS = {"get_weekly_data": CachePolicy("notion", defaults={"days": 7})}
+WRITES = {"create_weekly_report": "notion"}
+
+
+@cached_tool(reads=CACHED_READS, writes=WRITES)
+async def handle_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Route one weekly report tool call; Notion is imported on first use."""
+    from agent.notion_utils import get_weekly_application_data, create_weekly_report
 
-@server.call_tool()
-async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
-    """Handle tool calls for weekly report operations"""
-    
     if name == "get_weekly_data":
-        days = arguments.get("days", 7)
-        
-        # Convert days to integer if it's a string (common when called by LLM)
-        if isinstance(days, str):
-            days = int(days)
-            
         try:
-            data = get_weekly_application_data(days)
+            # Convert days to integer if it's a string (common when called by LLM)
+            days = int(arguments.get("days", 7))
+            data = await run_blocking(get_weekly_application_data, days)
             if data:
-                return [TextContent(
-                    type="text",
-                    text=f"Weekly data retrieved successfully:\n{json.dumps(data, indent=2)}"
-                )]
+                return [
+                    TextContent(
+                        type="text",
+                        text=f"Weekly data retrieved successfully:\n{json.dumps(data, indent=2)}",
+                    )
+                ]
             else:
-                return [TextContent(
-                    type="text",
-                    text="Failed to retrieve weekly data from Notion"
-                )]
+                return [
+                    TextContent(
+                        type="text", text="Failed to retrieve weekly data from Notion"
+                    )
+                ]
         except Exception as e:
-            return [TextContent(
-                type="text",
-                text=f"Error retrieving weekly data: {str(e)}"
-            )]
-    
+            return [
+                TextContent(type="text", text=f"Error retrieving weekly data: {str(e)}")
+            ]
+
     elif name == "create_weekly_report":
-        title = arguments.get("title")
-        week_range = arguments.get("week_range")
-        summary = arguments.get("summary")
-        created_on = arguments.get("created_on")
-        
         try:
-            result = create_weekly_report(title, week_range, summary, created_on)
+            result = await run_blocking(
+                create_weekly_report,
+                arguments.get("title"),
+                arguments.get("week_range"),
+                arguments.get("summary"),
+                arguments.get("created_on"),
+            )
             if result:
-                return [TextContent(
-                    type="text",
-                    text=f"Weekly report created successfully: {result.get('id', 'Unknown')[:8]}..."
-                )]
+                return [
+                    TextContent(
+                        type="text",
+                        text=f"Weekly report created successfully: {result.get('id', 'Unknown')[:8]}...",
+                    )
+                ]
             else:
-                return [TextContent(
-                    type="text",
-                    text="Failed to create weekly report in Notion"
-                )]
+                return [
+                    TextContent(
+                        type="text", text="Failed to create weekly report in Notion"
+                    )
+                ]
         except Exception as e:
-            return [TextContent(
-                type="text",
-                text=f"Error creating weekly report: {str(e)}"
-            )]
-    
+            return [
+                TextContent(type="text", text=f"Error creating weekly report: {str(e)}")
+            ]
+
     elif name == "format_entries_for_llm":
-        entries = arguments.get("entries", [])
         try:
-            formatted_text = format_entries_for_llm(entries)
-            return [TextContent(
-                type="text",
-                text=formatted_text
-            )]
+            formatted_text = format_entries_for_llm(arguments.get("entries", []))
+            return [TextContent(type="text", text=formatted_text)]
         except Exception as e:
-            return [TextContent(
-                type="text",
-                text=f"Error formatting entries: {str(e)}"
-            )]
-    
+            return [
+                TextContent(type="text", text=f"Error formatting entries: {str(e)}")
+            ]
+
     elif name == "format_deadlines_for_llm":
-        deadlines = arguments.get("deadlines", [])
         try:
-            formatted_text = format_deadlines_for_llm(deadlines)
-            return [TextContent(
-                type="text",
-                text=formatted_text
-            )]
+            formatted_text = format_deadlines_for_llm(arguments.get("deadlines", []))
+            return [TextContent(type="text", text=formatted_text)]
         except Exception as e:
-            return [TextContent(
-                type="text",
-                text=f"Error formatting deadlines: {str(e)}"
-            )]
-    
+            return [
+                TextContent(type="text", text=f"Error formatting deadlines: {str(e)}")
+            ]
+
     else:
-        return [TextContent(
-            type="text",
-            text=f"Unknown tool: {name}"
-        )]
+        return [TextContent(type="text", text=f"Unknown tool: {name}")]
+
+
+class WeeklyReportMCPServer:
+    def __init__(self):
+        self.server = Server("weekly-report-server")
+        self._setup_tools()
+
+    def _setup_tools(self):
+        @self.server.list_tools()
+        async def list_tools() -> List[Tool]:
+            return TOOLS
 
+        @self.server.call_tool()
+        async def call_tool(name: str, arguments: dict) -> List[TextContent]:
+            return await call_with_timeout(
+                name,
+                lambda: handle_tool(name, arguments or {}),
+                lambda message: [TextContent(type="text", text=message)],
+            )
 
+    async def run(
+        self,
+        transport: str = MCP_TRANSPORT,
+        host: str = MCP_HTTP_HOST,
+        port: int = MCP_HTTP_PORT,
+    ):
+        await serve(self.server, "weekly-report-server", transport, host, port)
 
 
-# Run the server
 if __name__ == "__main__":
-    import asyncio
-    asyncio.run(server.run())
+    parser = argparse.ArgumentParser(description="Weekly report MCP server")
+    add_transport_arguments(parser)
+    args = parser.parse_args()
+    server = WeeklyReportMCPServer()
+    asyncio.run(server.run(args.transport, args.host, args.port))
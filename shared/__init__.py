@@ -7,11 +7,22 @@ from .models import EmailData, JobApplicationData, WeeklyReportData, WeeklyRepor
 from .utils import (
     setup_path_imports,
     format_entries_for_llm,
+    chunk_entries_by_tokens,
     format_deadlines_for_llm,
     generate_week_range,
     get_llm_config,
     get_llm_config_creative,
 )
+from .projection import (
+    COMPACT_FIELDS,
+    estimate_tokens,
+    estimate_raw_tokens,
+    project_page,
+    parse_fields,
+    format_compact,
+    token_savings,
+    project_pages_for_llm,
+)
 from .config import (
     NOTION_TOKEN,
     NOTION_DATABASE_ID,
@@ -36,10 +47,20 @@ __all__ = [
     # Utils
     "setup_path_imports",
     "format_entries_for_llm",
+    "chunk_entries_by_tokens",
     "format_deadlines_for_llm",
     "generate_week_range",
     "get_llm_config",
     "get_llm_config_creative",
+    # Projection
+    "COMPACT_FIELDS",
+    "estimate_tokens",
+    "estimate_raw_tokens",
+    "project_page",
+    "parse_fields",
+    "format_compact",
+    "token_savings",
+    "project_pages_for_llm",
     # Config
     "NOTION_TOKEN",
     "NOTION_DATABASE_ID",
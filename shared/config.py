@@ -18,10 +18,101 @@ OPENROUTER_MODEL = os.getenv(
     "OPENROUTER_MODEL", "mistralai/mistral-small-3.2-24b-instruct:free"
 )
 
+# Notion API root; point at a local fake (benchmarks/fake_notion.py) for load tests
+NOTION_BASE_URL = os.getenv("NOTION_BASE_URL", "https://api.notion.com").rstrip("/")
+
+# Results per databases.query request (Notion caps this at 100)
+NOTION_PAGE_SIZE = min(int(os.getenv("NOTION_PAGE_SIZE", "100")), 100)
+
+# Ask Notion for only the properties JobSync reads (smaller query responses)
+NOTION_FILTER_PROPERTIES = os.getenv("NOTION_FILTER_PROPERTIES", "true").lower() == "true"
+
+# Process-wide Notion pacing (0 disables pacing) and retry policy
+NOTION_RATE_LIMIT_RPS = float(os.getenv("NOTION_RATE_LIMIT_RPS", "3"))
+NOTION_RATE_LIMIT_BURST = int(os.getenv("NOTION_RATE_LIMIT_BURST", "3"))
+NOTION_MAX_RETRIES = int(os.getenv("NOTION_MAX_RETRIES", "5"))
+
+# Persistent local copy of the job database ("" disables it); full re-scan
+# interval to reconcile deletions, and minimum seconds between delta refreshes
+NOTION_CACHE_PATH = os.getenv("NOTION_CACHE_PATH", ".cache/notion_index.sqlite")
+NOTION_FULL_SCAN_HOURS = float(os.getenv("NOTION_FULL_SCAN_HOURS", "24"))
+NOTION_STORE_MAX_STALENESS = float(os.getenv("NOTION_STORE_MAX_STALENESS", "60"))
+
+# Write-ahead outbox of Notion mutations replayed at startup ("" disables it),
+# and how many runs may retry one mutation before it is dropped
+NOTION_OUTBOX_PATH = os.getenv("NOTION_OUTBOX_PATH", ".cache/notion_outbox.jsonl")
+NOTION_OUTBOX_MAX_ATTEMPTS = int(os.getenv("NOTION_OUTBOX_MAX_ATTEMPTS", "5"))
+NOTION_OUTBOX_REPLAY_BATCH = int(os.getenv("NOTION_OUTBOX_REPLAY_BATCH", "20"))
+
+# Minimum trigram similarity (0-1) of the title (and of each title word) for
+# a fuzzy duplicate match; the normalized companies must be identical
+NOTION_MATCH_THRESHOLD = float(os.getenv("NOTION_MATCH_THRESHOLD", "0.8"))
+
+# Lowest similarity score search_similar_entries returns
+NOTION_SEARCH_MIN_SCORE = float(os.getenv("NOTION_SEARCH_MIN_SCORE", "0.3"))
+
+# Coalesce page updates within a run: flush after N pending pages or N seconds
+NOTION_WRITE_BUFFER_MAX_PAGES = int(os.getenv("NOTION_WRITE_BUFFER_MAX_PAGES", "50"))
+NOTION_WRITE_BUFFER_MAX_AGE = float(os.getenv("NOTION_WRITE_BUFFER_MAX_AGE", "300"))
+
+# Concurrent Notion writes for batch upserts (Notion averages 3 requests/s)
+NOTION_UPSERT_CONCURRENCY = int(os.getenv("NOTION_UPSERT_CONCURRENCY", "3"))
+
 # Gmail configuration
 GMAIL_CREDENTIALS_PATH = os.getenv("GMAIL_CREDENTIALS_PATH")
 GMAIL_TOKEN_PATH = os.getenv("GMAIL_TOKEN_PATH")
 
+# get_recent_emails pages: max characters of email records per page, and of
+# one email's text
+GMAIL_PAGE_CHAR_BUDGET = int(os.getenv("GMAIL_PAGE_CHAR_BUDGET", "12000"))
+GMAIL_EMAIL_TEXT_CHARS = int(os.getenv("GMAIL_EMAIL_TEXT_CHARS", "2000"))
+
+# MCP servers: threads for blocking SDK calls, default per-tool timeout in
+# seconds (0 = none) and per-tool overrides ("get_recent_emails=120,...");
+# batch upserts are paced at ~3 Notion writes/s, so they get 300s by default
+MCP_BLOCKING_WORKERS = int(os.getenv("MCP_BLOCKING_WORKERS", "8"))
+MCP_TOOL_TIMEOUT = float(os.getenv("MCP_TOOL_TIMEOUT", "60"))
+MCP_TOOL_TIMEOUTS = {
+    "upsert_job_applications": 300.0,
+    **{
+        name.strip(): float(seconds)
+        for name, _, seconds in (
+            item.partition("=")
+            for item in os.getenv("MCP_TOOL_TIMEOUTS", "").split(",")
+        )
+        if name.strip() and seconds.strip()
+    },
+}
+
+# MCP transport: "stdio" (one client per process) or "http" (Streamable
+# HTTP + SSE, one long-lived instance shared by many clients)
+MCP_TRANSPORT = os.getenv("MCP_TRANSPORT", "stdio")
+MCP_HTTP_HOST = os.getenv("MCP_HTTP_HOST", "127.0.0.1")
+MCP_HTTP_PORT = int(os.getenv("MCP_HTTP_PORT", "8765"))
+
+# Read-only tool result cache: max entries, default TTL in seconds (0 disables
+# caching) and TTL for email contents, which never change
+MCP_CACHE_MAX_ENTRIES = int(os.getenv("MCP_CACHE_MAX_ENTRIES", "256"))
+MCP_CACHE_TTL = float(os.getenv("MCP_CACHE_TTL", "30"))
+MCP_EMAIL_CACHE_TTL = float(os.getenv("MCP_EMAIL_CACHE_TTL", "600"))
+
+# LLM usage budgets per run (0 = unlimited) and pricing in USD per 1M tokens
+LLM_MAX_CALLS_PER_RUN = int(os.getenv("LLM_MAX_CALLS_PER_RUN", "0"))
+LLM_MAX_TOKENS_PER_RUN = int(os.getenv("LLM_MAX_TOKENS_PER_RUN", "0"))
+LLM_MAX_COST_PER_RUN = float(os.getenv("LLM_MAX_COST_PER_RUN", "0"))
+LLM_PROMPT_PRICE_PER_MTOK = float(os.getenv("LLM_PROMPT_PRICE_PER_MTOK", "0"))
+LLM_COMPLETION_PRICE_PER_MTOK = float(os.getenv("LLM_COMPLETION_PRICE_PER_MTOK", "0"))
+LLM_USAGE_REPORT_PATH = os.getenv("LLM_USAGE_REPORT_PATH", "llm_usage.json")
+
+# Weekly summary: "auto" switches to map-reduce when entries exceed one chunk
+WEEKLY_SUMMARY_MODE = os.getenv("WEEKLY_SUMMARY_MODE", "auto")
+WEEKLY_SUMMARY_CHUNK_TOKENS = int(os.getenv("WEEKLY_SUMMARY_CHUNK_TOKENS", "1500"))
+WEEKLY_SUMMARY_MAP_CONCURRENCY = int(os.getenv("WEEKLY_SUMMARY_MAP_CONCURRENCY", "4"))
+
+# Weekly report deadlines: how far ahead to look and how many to list
+WEEKLY_DEADLINE_HORIZON_DAYS = int(os.getenv("WEEKLY_DEADLINE_HORIZON_DAYS", "30"))
+WEEKLY_DEADLINE_LIMIT = int(os.getenv("WEEKLY_DEADLINE_LIMIT", "10"))
+
 
 def validate_config():
     """Validate that all required environment variables are set."""
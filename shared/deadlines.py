@@ -0,0 +1,301 @@
+"""
+Deadline extraction from application notes.
+Parses explicit dates and relative phrases ("within 5 days", "by Friday")
+with precompiled patterns, anchored to the date of the email each note
+came from, and keeps the results in a min-heap ordered by due date.
+"""
+
+import heapq
+import re
+from datetime import date, timedelta
+from typing import Any, Iterable, List, NamedTuple, Optional, Tuple
+
+_MONTHS = {
+    name: i
+    for i, names in enumerate(
+        (
+            ("jan", "january"),
+            ("feb", "february"),
+            ("mar", "march"),
+            ("apr", "april"),
+            ("may",),
+            ("jun", "june"),
+            ("jul", "july"),
+            ("aug", "august"),
+            ("sep", "sept", "september"),
+            ("oct", "october"),
+            ("nov", "november"),
+            ("dec", "december"),
+        ),
+        1,
+    )
+    for name in names
+}
+_WEEKDAYS = {
+    name: i
+    for i, names in enumerate(
+        (
+            ("mon", "monday"),
+            ("tue", "tues", "tuesday"),
+            ("wed", "wednesday"),
+            ("thu", "thur", "thurs", "thursday"),
+            ("fri", "friday"),
+            ("sat", "saturday"),
+            ("sun", "sunday"),
+        )
+    )
+    for name in names
+}
+_NUMBERS = {
+    "a": 1,
+    "an": 1,
+    "one": 1,
+    "two": 2,
+    "three": 3,
+    "four": 4,
+    "five": 5,
+    "six": 6,
+    "seven": 7,
+    "eight": 8,
+    "nine": 9,
+    "ten": 10,
+    "fourteen": 14,
+}
+
+_MONTH_RE = "|".join(sorted(_MONTHS, key=len, reverse=True))
+_WEEKDAY_RE = "|".join(sorted(_WEEKDAYS, key=len, reverse=True))
+_NUMBER_RE = r"\d{1,3}|" + "|".join(sorted(_NUMBERS, key=len, reverse=True))
+
+# Words that turn a nearby date into a deadline rather than a mention
+_CUE = re.compile(
+    r"\b(deadline|due|before|until|no later than|expires?|expiring|closes?|"
+    r"submit|complete|respond|reply|scheduled for)\b",
+    re.IGNORECASE,
+)
+# "by" is a cue only right before the date ("by Oct 20"), not in
+# "Referred by John; interview on Oct 20"
+_BY_CUE = re.compile(r"\bby\s+$", re.IGNORECASE)
+# Explicit dates: 2025-10-24, Oct 24(th)(, 2025), 24 October (2025), 10/24(/2025)
+_DATE = re.compile(
+    r"\b(?P<iso>(?P<iy>\d{4})-(?P<im>\d{1,2})-(?P<id>\d{1,2}))\b"
+    rf"|\b(?P<mon>{_MONTH_RE})\.?\s+(?P<md>\d{{1,2}})(?:st|nd|rd|th)?\b(?:,?\s+(?P<my>\d{{4}}))?"
+    rf"|\b(?P<dm>\d{{1,2}})(?:st|nd|rd|th)?\s+(?:of\s+)?(?P<dmon>{_MONTH_RE})\b\.?(?:,?\s+(?P<dy>\d{{4}}))?"
+    r"|\b(?P<um>\d{1,2})/(?P<ud>\d{1,2})(?:/(?P<uy>\d{2}|\d{4}))?\b",
+    re.IGNORECASE,
+)
+# Relative phrases; "by/before/until/due <day>" carry their own cue, while
+# durations ("in 2 weeks") need one like explicit dates do
+_RELATIVE = re.compile(
+    rf"\b(?:within|in|next)\s+(?P<n>{_NUMBER_RE})\s+(?P<unit>business days?|days?|weeks?|hours?)\b"
+    rf"|\b(?:by|before|until|due)\s+(?:this\s+|next\s+)?(?P<wd>{_WEEKDAY_RE})\b"
+    r"|\b(?:by|before|until|due)\s+(?P<word>tomorrow|today|tonight|eod|end of (?:the )?(?:day|week))\b",
+    re.IGNORECASE,
+)
+# "[Update 2025-10-20] ..." markers written by notion_utils.merge_notes
+_UPDATE = re.compile(r"\[Update (\d{4}-\d{2}-\d{2})\]")
+_SENTENCE_END = re.compile(r"[.!?\n]")
+
+# A year-less date this many days before the email date belongs to next year
+_ROLLOVER_DAYS = 60
+
+# Max characters between a cue word and the date it applies to
+_CUE_WINDOW = 40
+
+
+class Deadline(NamedTuple):
+    due: date
+    company: str
+    job_title: str
+    note: str
+
+
+def _parse_iso(value: str) -> Optional[date]:
+    try:
+        return date.fromisoformat(value[:10])
+    except ValueError:
+        return None
+
+
+def _safe_date(year: int, month: int, day: int) -> Optional[date]:
+    try:
+        return date(year, month, day)
+    except ValueError:
+        return None
+
+
+def _roll_forward(found: Optional[date], anchor: date, has_year: bool) -> Optional[date]:
+    """A year-less date far behind the email date means next year (Dec -> Jan)."""
+    if found and not has_year and found < anchor - timedelta(days=_ROLLOVER_DAYS):
+        return _safe_date(found.year + 1, found.month, found.day)
+    return found
+
+
+def _add_business_days(start: date, n: int) -> date:
+    current = start
+    while n > 0:
+        current += timedelta(days=1)
+        if current.weekday() < 5:
+            n -= 1
+    return current
+
+
+def _explicit_date(match: re.Match, anchor: date) -> Optional[date]:
+    g = match.groupdict()
+    if g["iso"]:
+        return _safe_date(int(g["iy"]), int(g["im"]), int(g["id"]))
+    if g["mon"]:
+        year = int(g["my"]) if g["my"] else anchor.year
+        found = _safe_date(year, _MONTHS[g["mon"].lower()], int(g["md"]))
+        return _roll_forward(found, anchor, bool(g["my"]))
+    if g["dmon"]:
+        year = int(g["dy"]) if g["dy"] else anchor.year
+        found = _safe_date(year, _MONTHS[g["dmon"].lower()], int(g["dm"]))
+        return _roll_forward(found, anchor, bool(g["dy"]))
+    year = int(g["uy"]) if g["uy"] else anchor.year
+    if year < 100:
+        year += 2000
+    found = _safe_date(year, int(g["um"]), int(g["ud"]))
+    return _roll_forward(found, anchor, bool(g["uy"]))
+
+
+def _relative_date(match: re.Match, anchor: date) -> Optional[date]:
+    g = match.groupdict()
+    if g["n"]:
+        n = int(g["n"]) if g["n"].isdigit() else _NUMBERS[g["n"].lower()]
+        unit = g["unit"].lower()
+        if unit.startswith("business"):
+            return _add_business_days(anchor, n)
+        if unit.startswith("week"):
+            return anchor + timedelta(weeks=n)
+        if unit.startswith("hour"):
+            return anchor + timedelta(days=(n + 23) // 24)
+        return anchor + timedelta(days=n)
+    if g["wd"]:
+        ahead = (_WEEKDAYS[g["wd"].lower()] - anchor.weekday()) % 7
+        if "next" in match.group(0).lower():
+            ahead += 7 if ahead == 0 else 0
+        return anchor + timedelta(days=ahead)
+    word = g["word"].lower()
+    if word == "tomorrow":
+        return anchor + timedelta(days=1)
+    if word.startswith("end of") and word.endswith("week"):
+        return anchor + timedelta(days=(4 - anchor.weekday()) % 7)
+    return anchor
+
+
+def _has_cue(text: str, start: int) -> bool:
+    """True when a cue word precedes `start` within the same sentence."""
+    window = text[max(0, start - _CUE_WINDOW) : start]
+    ends = list(_SENTENCE_END.finditer(window))
+    if ends:
+        window = window[ends[-1].end() :]
+    return _CUE.search(window) is not None or _BY_CUE.search(window) is not None
+
+
+def extract_deadlines(text: str, anchor: date) -> List[Tuple[date, str]]:
+    """
+    Find deadline dates in one note written on `anchor`.
+
+    Args:
+        text: Note text
+        anchor: Date of the email the note came from
+
+    Returns:
+        list: (due date, surrounding snippet) pairs
+    """
+    found = []
+    for match in _RELATIVE.finditer(text):
+        if match.group("n") and not _has_cue(text, match.start()):
+            continue
+        due = _relative_date(match, anchor)
+        if due:
+            found.append((due, match.start(), match.end()))
+    for match in _DATE.finditer(text):
+        if not _has_cue(text, match.start()):
+            continue
+        due = _explicit_date(match, anchor)
+        if due:
+            found.append((due, match.start(), match.end()))
+
+    results = []
+    for due, start, end in found:
+        snippet = text[max(0, start - 60) : end + 40].strip()
+        results.append((due, " ".join(snippet.split())))
+    return results
+
+
+def note_segments(notes: str, first_anchor: date) -> List[Tuple[date, str]]:
+    """
+    Split notes into (anchor date, text) segments. Text before the first
+    "[Update date]" marker belongs to `first_anchor` (the applied date).
+    """
+    segments = []
+    anchor, last = first_anchor, 0
+    for match in _UPDATE.finditer(notes):
+        segments.append((anchor, notes[last : match.start()]))
+        anchor = _parse_iso(match.group(1)) or anchor
+        last = match.end()
+    segments.append((anchor, notes[last:]))
+    return [(a, text) for a, text in segments if text.strip()]
+
+
+class DeadlineHeap:
+    """Min-heap of deadlines keyed by due date."""
+
+    def __init__(self):
+        self._heap: List[Tuple[date, int, Deadline]] = []
+        self._seen = set()
+        self._seq = 0
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, deadline: Deadline):
+        key = (deadline.due, deadline.company, deadline.job_title)
+        if key in self._seen:
+            return
+        self._seen.add(key)
+        heapq.heappush(self._heap, (deadline.due, self._seq, deadline))
+        self._seq += 1
+
+    def add_record(self, record: Any):
+        """Extract deadlines from a decoded JobRecord's notes."""
+        first_anchor = _parse_iso(record.applied_on or "")
+        if not record.notes or first_anchor is None:
+            return
+        for anchor, text in note_segments(record.notes, first_anchor):
+            for due, snippet in extract_deadlines(text, anchor):
+                self.push(
+                    Deadline(
+                        due, record.company or "Unknown", record.job_title or "Unknown", snippet
+                    )
+                )
+
+    def upcoming(
+        self, today: date, horizon_days: Optional[int] = None, limit: Optional[int] = None
+    ) -> List[Deadline]:
+        """Deadlines due today or later (within the horizon), soonest first."""
+        last = today + timedelta(days=horizon_days) if horizon_days is not None else None
+        heap = list(self._heap)
+        results = []
+        while heap and (limit is None or len(results) < limit):
+            due, _, deadline = heapq.heappop(heap)
+            if due < today:
+                continue
+            if last is not None and due > last:
+                break
+            results.append(deadline)
+        return results
+
+
+def upcoming_deadlines(
+    records: Iterable[Any],
+    today: date,
+    horizon_days: Optional[int] = None,
+    limit: Optional[int] = None,
+) -> List[Deadline]:
+    """Upcoming deadlines across decoded JobRecords, soonest first."""
+    heap = DeadlineHeap()
+    for record in records:
+        heap.add_record(record)
+    return heap.upcoming(today, horizon_days, limit)
@@ -0,0 +1,229 @@
+"""
+Per-run LLM token and cost accounting for JobSync workflows.
+Records every LLM call by stage and enforces optional hard budgets.
+"""
+
+import json
+import time
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+from shared.config import (
+    LLM_MAX_CALLS_PER_RUN,
+    LLM_MAX_TOKENS_PER_RUN,
+    LLM_MAX_COST_PER_RUN,
+    LLM_PROMPT_PRICE_PER_MTOK,
+    LLM_COMPLETION_PRICE_PER_MTOK,
+    LLM_USAGE_REPORT_PATH,
+)
+
+
+class LLMBudgetExceeded(RuntimeError):
+    """Raised before an LLM call that would run past the configured run budget."""
+
+
+class LLMUsageTracker:
+    """Collects per-call usage for one workflow run and checks budgets."""
+
+    def __init__(
+        self,
+        run_name: str,
+        max_calls: int = LLM_MAX_CALLS_PER_RUN,
+        max_tokens: int = LLM_MAX_TOKENS_PER_RUN,
+        max_cost: float = LLM_MAX_COST_PER_RUN,
+    ):
+        self.run_name = run_name
+        self.max_calls = max_calls
+        self.max_tokens = max_tokens
+        self.max_cost = max_cost
+        self.started_at = time.time()
+        self.calls: List[Dict[str, Any]] = []
+
+    # === TOTALS ===
+    @property
+    def prompt_tokens(self) -> int:
+        return sum(c["prompt_tokens"] for c in self.calls)
+
+    @property
+    def completion_tokens(self) -> int:
+        return sum(c["completion_tokens"] for c in self.calls)
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+    @property
+    def cost(self) -> float:
+        return sum(c["cost"] for c in self.calls)
+
+    # === BUDGETS ===
+    def budget_exhausted(self) -> Optional[str]:
+        """Return a reason string if any budget is used up, None otherwise."""
+        if self.max_calls and len(self.calls) >= self.max_calls:
+            return f"call budget reached ({len(self.calls)}/{self.max_calls} calls)"
+        if self.max_tokens and self.total_tokens >= self.max_tokens:
+            return f"token budget reached ({self.total_tokens}/{self.max_tokens} tokens)"
+        if self.max_cost and self.cost >= self.max_cost:
+            return f"cost budget reached (${self.cost:.4f}/${self.max_cost:.4f})"
+        return None
+
+    def check_budget(self):
+        """Raise LLMBudgetExceeded if no further LLM calls are allowed."""
+        reason = self.budget_exhausted()
+        if reason:
+            raise LLMBudgetExceeded(f"LLM budget exceeded for {self.run_name}: {reason}")
+
+    # === RECORDING ===
+    def record(
+        self,
+        stage: str,
+        model: str,
+        prompt_tokens: int,
+        completion_tokens: int,
+        latency_ms: float,
+    ):
+        """Record a finished LLM call."""
+        cost = (
+            prompt_tokens * LLM_PROMPT_PRICE_PER_MTOK
+            + completion_tokens * LLM_COMPLETION_PRICE_PER_MTOK
+        ) / 1_000_000
+        self.calls.append(
+            {
+                "stage": stage,
+                "model": model,
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "latency_ms": round(latency_ms, 1),
+                "cost": cost,
+            }
+        )
+
+    def by_stage(self) -> Dict[str, Dict[str, Any]]:
+        """Aggregate calls per stage."""
+        stages: Dict[str, Dict[str, Any]] = {}
+        for call in self.calls:
+            stage = stages.setdefault(
+                call["stage"],
+                {
+                    "calls": 0,
+                    "prompt_tokens": 0,
+                    "completion_tokens": 0,
+                    "latency_ms": 0.0,
+                    "cost": 0.0,
+                    "models": [],
+                },
+            )
+            stage["calls"] += 1
+            stage["prompt_tokens"] += call["prompt_tokens"]
+            stage["completion_tokens"] += call["completion_tokens"]
+            stage["latency_ms"] += call["latency_ms"]
+            stage["cost"] += call["cost"]
+            if call["model"] not in stage["models"]:
+                stage["models"].append(call["model"])
+        return stages
+
+    # === REPORTING ===
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "run": self.run_name,
+            "started_at": self.started_at,
+            "duration_s": round(time.time() - self.started_at, 2),
+            "budgets": {
+                "max_calls": self.max_calls,
+                "max_tokens": self.max_tokens,
+                "max_cost": self.max_cost,
+            },
+            "budget_exhausted": self.budget_exhausted(),
+            "totals": {
+                "calls": len(self.calls),
+                "prompt_tokens": self.prompt_tokens,
+                "completion_tokens": self.completion_tokens,
+                "total_tokens": self.total_tokens,
+                "cost": self.cost,
+            },
+            "stages": self.by_stage(),
+            "calls": self.calls,
+        }
+
+    def print_summary(self):
+        """Print a per-stage usage table for the run log."""
+        print(f"\n[LLM USAGE] {self.run_name}")
+        for name, stage in self.by_stage().items():
+            print(
+                f"   {name}: {stage['calls']} calls, "
+                f"{stage['prompt_tokens']} prompt + {stage['completion_tokens']} completion tokens, "
+                f"{stage['latency_ms'] / 1000:.1f}s, ${stage['cost']:.4f} "
+                f"({', '.join(stage['models'])})"
+            )
+        print(
+            f"   Total: {len(self.calls)} calls, {self.total_tokens} tokens, ${self.cost:.4f}"
+        )
+        reason = self.budget_exhausted()
+        if reason:
+            print(f"   [BUDGET] {reason}")
+
+    def write_artifact(self, path: str = LLM_USAGE_REPORT_PATH) -> Optional[str]:
+        """Write the run usage as JSON (e.g. for upload as a CI artifact)."""
+        if not path:
+            return None
+        try:
+            with open(path, "w") as f:
+                json.dump(self.to_dict(), f, indent=2)
+            return path
+        except OSError as e:
+            print(f"[WARN] Could not write LLM usage report to {path}: {e}")
+            return None
+
+
+class UsageCallbackHandler(BaseCallbackHandler):
+    """
+    LangChain callback that feeds an LLMUsageTracker.
+
+    The stage of a call is taken from the `stage` key of the invocation
+    metadata, falling back to the handler's default stage.
+    """
+
+    # Propagate LLMBudgetExceeded out of on_*_start so the call never happens
+    raise_error = True
+
+    def __init__(self, tracker: LLMUsageTracker, default_stage: str = "llm"):
+        self.tracker = tracker
+        self.default_stage = default_stage
+        self._pending: Dict[UUID, tuple] = {}
+
+    def _start(self, run_id: UUID, metadata: Optional[Dict[str, Any]]):
+        self.tracker.check_budget()
+        stage = (metadata or {}).get("stage", self.default_stage)
+        self._pending[run_id] = (stage, time.perf_counter())
+
+    def on_llm_start(self, serialized, prompts, *, run_id, metadata=None, **kwargs):
+        self._start(run_id, metadata)
+
+    def on_chat_model_start(
+        self, serialized, messages, *, run_id, metadata=None, **kwargs
+    ):
+        self._start(run_id, metadata)
+
+    def on_llm_end(self, response, *, run_id, **kwargs):
+        stage, started = self._pending.pop(run_id, (self.default_stage, None))
+        latency_ms = (time.perf_counter() - started) * 1000 if started else 0.0
+
+        llm_output = response.llm_output or {}
+        usage = llm_output.get("token_usage") or {}
+        prompt_tokens = usage.get("prompt_tokens", 0)
+        completion_tokens = usage.get("completion_tokens", 0)
+        model = llm_output.get("model_name", "unknown")
+
+        # Fall back to message usage metadata when the provider omits llm_output
+        if not usage and response.generations and response.generations[0]:
+            message = getattr(response.generations[0][0], "message", None)
+            metadata = getattr(message, "usage_metadata", None) or {}
+            prompt_tokens = metadata.get("input_tokens", 0)
+            completion_tokens = metadata.get("output_tokens", 0)
+
+        self.tracker.record(stage, model, prompt_tokens, completion_tokens, latency_ms)
+
+    def on_llm_error(self, error, *, run_id, **kwargs):
+        self._pending.pop(run_id, None)
@@ -40,6 +40,7 @@ class WeeklyReportData(BaseModel):
     rejected: int
     deadlines: List[Dict[str, str]]
     entries: List[Dict[str, str]]
+    trends: Dict[str, Any] = {}
 
 
 class WeeklyReportState(BaseModel):
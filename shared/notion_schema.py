@@ -0,0 +1,138 @@
+"""
+Declarative schema and decoder for Notion job database pages.
+make_decoder walks a schema once per page and turns a page dict into a
+tuple-backed record in a single pass; the job database decoder is the same
+walk unrolled by hand, since it runs on every page read.
+"""
+
+from collections import namedtuple
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+# (record field, Notion property name, Notion property type)
+JOB_SCHEMA: Tuple[Tuple[str, str, str], ...] = (
+    ("company", "Company", "rich_text"),
+    ("job_title", "Job Title", "rich_text"),
+    ("status", "Status", "status"),
+    ("applied_on", "Applied On", "date"),
+    ("notes", "Notes", "rich_text"),
+    ("app_id", "Application ID", "rich_text"),
+)
+
+
+def _text(items: List[Dict[str, Any]]) -> str:
+    """Plain text of a rich_text/title array (all chunks, not just the first)."""
+    if not items:
+        return ""
+    if len(items) == 1:
+        item = items[0]
+        return item.get("plain_text") or item.get("text", {}).get("content", "")
+    return "".join(
+        item.get("plain_text") or item.get("text", {}).get("content", "")
+        for item in items
+    )
+
+
+def _rich_text(prop: Dict[str, Any]) -> str:
+    return _text(prop.get("rich_text"))
+
+
+def _title(prop: Dict[str, Any]) -> str:
+    return _text(prop.get("title"))
+
+
+def _named(kind: str) -> Callable[[Dict[str, Any]], str]:
+    def extract(prop: Dict[str, Any]) -> str:
+        value = prop.get(kind)
+        return value.get("name", "") if value else ""
+
+    return extract
+
+
+def _date(prop: Dict[str, Any]) -> str:
+    value = prop.get("date")
+    return (value.get("start") or "") if value else ""
+
+
+# Property type -> extractor of its value from the property dict ({} when
+# the page lacks the property)
+_EXTRACTORS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "rich_text": _rich_text,
+    "title": _title,
+    "status": _named("status"),
+    "select": _named("select"),
+    "date": _date,
+    "number": lambda prop: prop.get("number"),
+    "checkbox": lambda prop: bool(prop.get("checkbox")),
+}
+
+
+def make_decoder(
+    schema: Sequence[Tuple[str, str, str]], name: str
+) -> Tuple[type, Callable[[Dict[str, Any]], Any]]:
+    """
+    Build a record type and a decoder function from a property schema.
+
+    Returns:
+        tuple: (record namedtuple class, decode(page) -> record)
+    """
+    fields = ("id", "last_edited_time") + tuple(field for field, _, _ in schema)
+    record_cls = namedtuple(name, fields)
+    steps = [(prop_name, _EXTRACTORS[prop_type]) for _, prop_name, prop_type in schema]
+
+    def decode(page: Dict[str, Any]):
+        props = page.get("properties") or {}
+        values = [page.get("id", ""), page.get("last_edited_time", "")]
+        for prop_name, extract in steps:
+            values.append(extract(props.get(prop_name) or {}))
+        return record_cls._make(values)
+
+    decode.__doc__ = f"Decode a Notion page dict into a {name}."
+    return record_cls, decode
+
+
+JobRecord, decode_job_page_generic = make_decoder(JOB_SCHEMA, "JobRecord")
+
+# Builds a record from a ready tuple, skipping namedtuple's Python-level __new__
+_new_record = tuple.__new__
+
+
+def _rich_text_value(prop: Any) -> str:
+    items = prop.get("rich_text") if prop else None
+    if not items:
+        return ""
+    if len(items) == 1:
+        item = items[0]
+        return item.get("plain_text") or item.get("text", {}).get("content", "")
+    return _text(items)
+
+
+def decode_job_page(page: Dict[str, Any]) -> JobRecord:
+    """
+    Decode a Notion page dict into a JobRecord.
+
+    JOB_SCHEMA unrolled: same output as decode_job_page_generic without the
+    per-property loop and calls (benchmarks/bench_decoder.py checks both);
+    update it together with JOB_SCHEMA.
+    """
+    props = page.get("properties") or {}
+    status = props.get("Status")
+    status = status.get("status") if status else None
+    applied_on = props.get("Applied On")
+    applied_on = applied_on.get("date") if applied_on else None
+    return _new_record(
+        JobRecord,
+        (
+            page.get("id", ""),
+            page.get("last_edited_time", ""),
+            _rich_text_value(props.get("Company")),
+            _rich_text_value(props.get("Job Title")),
+            status.get("name", "") if status else "",
+            (applied_on.get("start") or "") if applied_on else "",
+            _rich_text_value(props.get("Notes")),
+            _rich_text_value(props.get("Application ID")),
+        ),
+    )
+
+
+# Notion property names the decoder reads (for filter_properties)
+JOB_PROPERTY_NAMES = tuple(prop_name for _, prop_name, _ in JOB_SCHEMA)
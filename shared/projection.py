@@ -0,0 +1,126 @@
+"""
+Compact projections of Notion pages for LLM tool results.
+Keeps only the fields an agent needs so raw page objects never reach the prompt.
+"""
+
+import json
+from typing import Any, Dict, List, Tuple
+
+from .notion_schema import decode_job_page
+
+# Fields emitted for every entry, in output order
+COMPACT_FIELDS = ("id", "company", "title", "status", "date", "app_id")
+
+# Pages serialized to estimate the raw size of a whole result
+_RAW_SAMPLE_PAGES = 3
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token estimate (~4 characters per token) used for prompt budgeting."""
+    return (len(text) + 3) // 4
+
+
+def estimate_raw_tokens(pages: List[Dict[str, Any]]) -> int:
+    """
+    Approximate tokens of `pages` as pretty-printed JSON, from a few evenly
+    spaced sample pages (pages share one shape), so the estimate costs no
+    pass over the whole payload.
+    """
+    if not pages:
+        return 0
+    step = max(1, len(pages) // _RAW_SAMPLE_PAGES)
+    sample = pages[::step][:_RAW_SAMPLE_PAGES]
+    per_page = estimate_tokens(json.dumps(sample, indent=2)) / len(sample)
+    return round(per_page * len(pages))
+
+
+def project_page(page: Dict[str, Any]) -> Dict[str, str]:
+    """Reduce a raw Notion page object to the compact entry fields."""
+    record = decode_job_page(page)
+    return {
+        "id": record.id,
+        "company": record.company,
+        "title": record.job_title,
+        "status": record.status,
+        "date": record.applied_on,
+        "app_id": record.app_id,
+    }
+
+
+def parse_fields(fields: Any) -> Tuple[str, ...]:
+    """
+    Validate a requested field projection (list or comma-separated string).
+
+    Returns:
+        tuple: Requested fields in the order given (all fields when empty)
+
+    Raises:
+        ValueError: If a field is not one of COMPACT_FIELDS
+    """
+    if isinstance(fields, str):
+        fields = fields.split(",")
+    requested = tuple(f.strip() for f in fields or () if f.strip())
+    unknown = [f for f in requested if f not in COMPACT_FIELDS]
+    if unknown:
+        raise ValueError(
+            f"unknown fields {', '.join(unknown)} (choose from {', '.join(COMPACT_FIELDS)})"
+        )
+    return requested or COMPACT_FIELDS
+
+
+def format_compact(
+    records: List[Dict[str, str]],
+    fmt: str = "tsv",
+    fields: Tuple[str, ...] = COMPACT_FIELDS,
+) -> str:
+    """
+    Serialize projected records densely.
+
+    Args:
+        records: Output of project_page
+        fmt: "tsv" (header row + one line per entry) or "json" (minified rows)
+        fields: Fields to emit, in output order
+    """
+    if fmt == "json":
+        return json.dumps(
+            {
+                "fields": fields,
+                "rows": [[r.get(f, "") for f in fields] for r in records],
+            },
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+
+    lines = ["\t".join(fields)]
+    for record in records:
+        lines.append(
+            "\t".join(" ".join(str(record.get(f, "")).split()) for f in fields)
+        )
+    return "\n".join(lines)
+
+
+def token_savings(entries: int, raw_tokens: int, text: str) -> Dict[str, int]:
+    """Token estimates of a compact result vs. the raw pages it replaces."""
+    compact_tokens = estimate_tokens(text)
+    saved_pct = (
+        round(100 * (raw_tokens - compact_tokens) / raw_tokens) if raw_tokens else 0
+    )
+    return {
+        "entries": entries,
+        "raw_tokens": raw_tokens,
+        "compact_tokens": compact_tokens,
+        "saved_pct": saved_pct,
+    }
+
+
+def project_pages_for_llm(
+    pages: List[Dict[str, Any]], fmt: str = "tsv"
+) -> Tuple[str, Dict[str, int]]:
+    """
+    Project raw Notion pages into a compact tool result.
+
+    Returns:
+        tuple: (text, stats) where stats holds raw/compact token estimates
+    """
+    text = format_compact([project_page(p) for p in pages], fmt)
+    return text, token_savings(len(pages), estimate_raw_tokens(pages), text)
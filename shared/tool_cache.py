@@ -0,0 +1,208 @@
+"""
+Shared TTL cache for read-only MCP tool results.
+Results are keyed by tool name and normalized arguments, bounded in size
+(least recently used entries are evicted first) and dropped as soon as a
+write tool touches the same data domain, so agents that repeat a read
+within seconds are answered without another Gmail or Notion round trip.
+"""
+
+import functools
+import json
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, NamedTuple, Optional, Tuple
+
+from shared.config import MCP_CACHE_MAX_ENTRIES, MCP_CACHE_TTL
+
+# Tool results that report a failure; never cached
+_ERROR_PREFIXES = ("Error", "Failed", "Unknown tool")
+
+
+class CachePolicy(NamedTuple):
+    """How one read tool is cached."""
+
+    domain: str  # Data the tool reads ("notion", "gmail"); writes invalidate by domain
+    ttl: float = MCP_CACHE_TTL  # Seconds a result stays fresh (0 = never cached)
+    defaults: Dict[str, Any] = {}  # Argument defaults, so omitted == explicit
+
+
+def normalize_arguments(arguments: Dict[str, Any], defaults: Dict[str, Any]) -> str:
+    """
+    Canonical key for tool arguments: defaults filled in, None dropped,
+    strings stripped and numeric strings (as LLMs often send them) as ints.
+    """
+    merged = {**defaults, **(arguments or {})}
+    normalized = {}
+    for key, value in merged.items():
+        if value is None:
+            continue
+        if isinstance(value, str):
+            value = value.strip()
+            if value.lstrip("-").isdigit():
+                value = int(value)
+        normalized[key] = value
+    return json.dumps(normalized, sort_keys=True, separators=(",", ":"), default=str)
+
+
+class ToolResultCache:
+    """Size-bounded LRU of (tool, arguments) -> result with per-entry expiry."""
+
+    def __init__(self, max_entries: int = MCP_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, str, Any]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.by_tool: Dict[str, Dict[str, int]] = {}
+        # Bumped by every invalidation; a read that started under an older
+        # generation may hold pre-write data and is not stored
+        self._generations: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _count(self, tool: str, field: str):
+        counts = self.by_tool.setdefault(tool, {"hits": 0, "misses": 0})
+        counts[field] += 1
+
+    def get(self, tool: str, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get((tool, key))
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[(tool, key)]
+                self.misses += 1
+                self._count(tool, "misses")
+                return None
+            self._entries.move_to_end((tool, key))
+            self.hits += 1
+            self._count(tool, "hits")
+            return entry[2]
+
+    def generation(self, domain: str) -> int:
+        return self._generations.get(domain, 0)
+
+    def put(
+        self,
+        tool: str,
+        key: str,
+        value: Any,
+        ttl: float,
+        domain: str,
+        generation: Optional[int] = None,
+    ):
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+        with self._lock:
+            if generation is not None and generation != self.generation(domain):
+                return
+            self._entries[(tool, key)] = (time.monotonic() + ttl, domain, value)
+            self._entries.move_to_end((tool, key))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, domain: str) -> int:
+        """Drop every cached result read from `domain`; returns how many."""
+        with self._lock:
+            self._generations[domain] = self.generation(domain) + 1
+            stale = [k for k, (_, d, _) in self._entries.items() if d == domain]
+            for k in stale:
+                del self._entries[k]
+            self.invalidations += len(stale)
+            return len(stale)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit rate overall and per tool, plus size, eviction and invalidation counts."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "by_tool": {
+                    tool: {
+                        **counts,
+                        "hit_rate": round(
+                            counts["hits"] / (counts["hits"] + counts["misses"]), 3
+                        ),
+                    }
+                    for tool, counts in self.by_tool.items()
+                },
+            }
+
+
+# Process-wide cache shared by every toolset (one host serves them all)
+tool_cache = ToolResultCache()
+
+
+def _is_error(result: Any) -> bool:
+    first = result[0] if isinstance(result, list) and result else None
+    text = getattr(first, "text", "")
+    return isinstance(text, str) and text.startswith(_ERROR_PREFIXES)
+
+
+def cached_tool(
+    reads: Dict[str, CachePolicy],
+    writes: Dict[str, str],
+    cache: Optional[ToolResultCache] = None,
+):
+    """
+    Wrap a toolset's handle_tool(name, arguments) with the result cache.
+
+    Args:
+        reads: Read-only tool name -> CachePolicy
+        writes: Write tool name -> domain it changes; a call invalidates
+            every cached read of that domain before and after it runs, and
+            reads overlapping the write are not stored
+        cache: Cache to use (default: the process-wide tool_cache)
+    """
+
+    def decorate(handler: Callable[[str, Dict[str, Any]], Awaitable[Any]]):
+        @functools.wraps(handler)
+        async def handle(name: str, arguments: Dict[str, Any]):
+            store = cache or tool_cache
+            if name in writes:
+                domain = writes[name]
+                dropped = store.invalidate(domain)
+                try:
+                    return await handler(name, arguments)
+                finally:
+                    dropped += store.invalidate(domain)
+                    if dropped:
+                        print(
+                            f"[CACHE] {name} invalidated {dropped} {domain} results",
+                            file=sys.stderr,
+                        )
+
+            policy = reads.get(name)
+            if policy is None or policy.ttl <= 0:
+                return await handler(name, arguments)
+
+            key = normalize_arguments(arguments, policy.defaults)
+            result = store.get(name, key)
+            if result is not None:
+                return result
+            generation = store.generation(policy.domain)
+            result = await handler(name, arguments)
+            if not _is_error(result):
+                store.put(name, key, result, policy.ttl, policy.domain, generation)
+            return result
+
+        return handle
+
+    return decorate
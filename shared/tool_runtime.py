@@ -0,0 +1,93 @@
+"""
+Runtime helpers for MCP tool handlers.
+Blocking SDK calls (Gmail, sync Notion, SQLite) run on one bounded thread
+pool so the stdio event loop keeps serving list_tools and concurrent
+requests, and every tool call gets a timeout instead of hanging the client.
+"""
+
+import asyncio
+import functools
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Optional
+
+from shared.config import MCP_BLOCKING_WORKERS, MCP_TOOL_TIMEOUT, MCP_TOOL_TIMEOUTS
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Process-wide pool for blocking calls made from tool handlers."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=MCP_BLOCKING_WORKERS, thread_name_prefix="mcp-blocking"
+        )
+    return _executor
+
+
+def install_executor():
+    """
+    Make the bounded pool the running loop's default executor, so
+    asyncio.to_thread calls in library code share the same limit.
+    """
+    asyncio.get_running_loop().set_default_executor(get_executor())
+
+
+async def run_blocking(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """Run a blocking function on the bounded pool and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_executor(), functools.partial(func, *args, **kwargs)
+    )
+
+
+def mcp_stdio():
+    """
+    stdio_server() that owns the real stdout, with sys.stdout pointed at
+    stderr so print() logging in agent code cannot corrupt the JSON-RPC
+    stream. Use in place of stdio_server() in server run() methods.
+    """
+    from io import TextIOWrapper
+
+    import anyio
+    from mcp.server.stdio import stdio_server
+
+    stdout = anyio.wrap_file(TextIOWrapper(sys.stdout.buffer, encoding="utf-8"))
+    sys.stdout = sys.stderr
+    return stdio_server(stdout=stdout)
+
+
+def tool_timeout(name: str) -> float:
+    """Timeout in seconds for one tool (MCP_TOOL_TIMEOUTS, else MCP_TOOL_TIMEOUT)."""
+    return MCP_TOOL_TIMEOUTS.get(name, MCP_TOOL_TIMEOUT)
+
+
+async def call_with_timeout(
+    name: str, handler: Callable[[], Awaitable[Any]], on_timeout: Callable[[str], Any]
+) -> Any:
+    """
+    Await handler() under the tool's timeout.
+
+    A timed-out call is cancelled and answered with on_timeout(message).
+    Work already running on a pool thread cannot be interrupted; it
+    finishes in the background while the pool bound keeps it contained.
+    Client cancellations propagate unchanged.
+
+    Args:
+        name: Tool name, used to look up the timeout
+        handler: Zero-argument coroutine function producing the tool result
+        on_timeout: Builds the tool result returned after a timeout
+    """
+    timeout = tool_timeout(name)
+    started = time.perf_counter()
+    try:
+        if timeout <= 0:
+            return await handler()
+        return await asyncio.wait_for(handler(), timeout)
+    except asyncio.TimeoutError:
+        elapsed = time.perf_counter() - started
+        # stdout carries the MCP stream, so log on stderr
+        print(f"[MCP] {name} timed out after {elapsed:.1f}s", file=sys.stderr)
+        return on_timeout(f"Tool {name} timed out after {timeout:g}s")
@@ -5,40 +5,68 @@ Consolidates common formatting and helper functions.
 
 import os
 import sys
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 
+from .projection import estimate_tokens
+
 
 def setup_path_imports():
     """Setup path imports for parent directory access."""
     sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 
-def format_entries_for_llm(entries: List[Dict[str, str]]) -> str:
-    """Format entries for LLM processing."""
+def _format_entry(index: int, entry: Dict[str, str]) -> str:
+    """Format a single entry as a numbered Markdown block."""
+    text = f"{index}. **{entry.get('company', 'Unknown')}** - {entry.get('job_title', 'Unknown')}\n"
+    text += f"   Status: {entry.get('status', 'Applied')} | Applied: {entry.get('applied_on', 'Unknown')}\n"
+    if entry.get("notes"):
+        text += f"   Notes: {entry.get('notes', '')[:100]}...\n"
+    return text + "\n"
+
+
+def format_entries_for_llm(
+    entries: List[Dict[str, str]], limit: Optional[int] = 10, start: int = 1
+) -> str:
+    """Format entries for LLM processing (first `limit` entries, None for all)."""
     if not entries:
         return "No recent applications found."
 
-    entries_text = ""
-    for i, entry in enumerate(entries[:10], 1):  # Limit to 10 entries
-        entries_text += f"{i}. **{entry.get('company', 'Unknown')}** - {entry.get('job_title', 'Unknown')}\n"
-        entries_text += f"   Status: {entry.get('status', 'Applied')} | Applied: {entry.get('applied_on', 'Unknown')}\n"
-        if entry.get("notes"):
-            entries_text += f"   Notes: {entry.get('notes', '')[:100]}...\n"
-        entries_text += "\n"
+    selected = entries if limit is None else entries[:limit]
+    return "".join(_format_entry(i, entry) for i, entry in enumerate(selected, start))
+
+
+def chunk_entries_by_tokens(
+    entries: List[Dict[str, str]], max_tokens: int
+) -> List[List[Dict[str, str]]]:
+    """Split entries into consecutive chunks whose formatted text fits max_tokens."""
+    chunks: List[List[Dict[str, str]]] = []
+    current: List[Dict[str, str]] = []
+    current_tokens = 0
+
+    for i, entry in enumerate(entries, 1):
+        tokens = estimate_tokens(_format_entry(i, entry))
+        if current and current_tokens + tokens > max_tokens:
+            chunks.append(current)
+            current, current_tokens = [], 0
+        current.append(entry)
+        current_tokens += tokens
 
-    return entries_text
+    if current:
+        chunks.append(current)
+    return chunks
 
 
 def format_deadlines_for_llm(deadlines: List[Dict[str, str]]) -> str:
-    """Format deadlines for LLM processing."""
+    """Format deadlines for LLM processing (expects them sorted by due date)."""
     if not deadlines:
         return "No upcoming deadlines found."
 
     deadlines_text = ""
     for i, deadline in enumerate(deadlines, 1):
-        deadlines_text += f"{i}. **{deadline.get('company', 'Unknown')}** - {deadline.get('job_title', 'Unknown')}\n"
-        deadlines_text += f"   Note: {deadline.get('note', '')[:200]}...\n\n"
+        due = f" (due {deadline['due']})" if deadline.get("due") else ""
+        deadlines_text += f"{i}. **{deadline.get('company', 'Unknown')}** - {deadline.get('job_title', 'Unknown')}{due}\n"
+        deadlines_text += f"   Note: {deadline.get('note', '')[:200]}\n\n"
 
     return deadlines_text
 
@@ -50,7 +78,7 @@ def generate_week_range(days: int) -> str:
     return f"{start_date.strftime('%b %d')} – {end_date.strftime('%b %d')}"
 
 
-def get_llm_config():
+def get_llm_config(callbacks=None):
     """Get standardized LLM configuration."""
     from langchain_openai import ChatOpenAI
 
@@ -61,10 +89,11 @@ def get_llm_config():
         base_url="https://openrouter.ai/api/v1",
         api_key=os.getenv("OPENROUTER_KEY"),
         temperature=0,
+        callbacks=callbacks,
     )
 
 
-def get_llm_config_creative():
+def get_llm_config_creative(callbacks=None):
     """Get LLM configuration with slightly higher temperature for creative tasks."""
     from langchain_openai import ChatOpenAI
 
@@ -75,4 +104,5 @@ def get_llm_config_creative():
         base_url="https://openrouter.ai/api/v1",
         api_key=os.getenv("OPENROUTER_KEY"),
         temperature=0.3,  # Slightly more creative for summaries
+        callbacks=callbacks,
     )
@@ -0,0 +1,171 @@
+"""
+Vectorized weekly aggregation over job application records.
+Entries are loaded once into columnar NumPy arrays (status codes, applied
+dates) and counted for several look-back windows in a single pass, with
+per-week trend series and a status funnel for the weekly report prompt.
+"""
+
+from datetime import date
+from typing import Any, Dict, Iterable, Sequence
+
+import numpy as np
+
+# Pipeline order; the funnel counts entries that reached at least each stage
+STATUSES = ("Applied", "Assessment", "Interview", "Offer", "Rejected", "Other")
+FUNNEL_STAGES = ("Applied", "Assessment", "Interview", "Offer")
+REJECTED = STATUSES.index("Rejected")
+OTHER = STATUSES.index("Other")
+
+_STATUS_CODES = {
+    "": 0,
+    "applied": 0,
+    "assessment": 1,
+    "online assessment": 1,
+    "oa": 1,
+    "interview": 2,
+    "offer": 3,
+    "rejected": 4,
+}
+
+# Age given to entries without an Applied On date (outside every window)
+_NO_DATE = np.iinfo(np.int64).max
+
+# Look-back windows (in weeks) reported alongside the requested period
+TREND_WINDOWS_WEEKS = (1, 4, 12)
+
+
+def status_code(status: str) -> int:
+    """Map a Notion status name onto its STATUSES index."""
+    return _STATUS_CODES.get((status or "").strip().lower(), OTHER)
+
+
+class ApplicationColumns:
+    """Status codes and applied dates of many entries as parallel arrays."""
+
+    __slots__ = ("status", "applied_on")
+
+    def __init__(self, records: Iterable[Any]):
+        statuses, dates = [], []
+        for record in records:
+            statuses.append(status_code(record.status))
+            dates.append(record.applied_on[:10] or "NaT")
+        self.status = np.array(statuses, dtype=np.int8)
+        self.applied_on = np.array(dates, dtype="datetime64[D]")
+
+    def __len__(self) -> int:
+        return len(self.status)
+
+    def age_days(self, today: date) -> np.ndarray:
+        """
+        Days between each applied date and `today`. Future dates count as
+        today (age 0); unknown dates get an age outside every window.
+        """
+        age = (np.datetime64(today, "D") - self.applied_on).astype(np.int64)
+        return np.where(np.isnat(self.applied_on), _NO_DATE, np.maximum(age, 0))
+
+
+def window_counts(
+    columns: ApplicationColumns, today: date, windows_days: Sequence[int]
+) -> np.ndarray:
+    """
+    Status counts for every window at once.
+
+    Returns:
+        ndarray: shape (len(windows_days), len(STATUSES))
+    """
+    age = columns.age_days(today)
+    # (entries, windows) membership times one-hot statuses -> (windows, statuses)
+    in_window = age[:, None] < np.asarray(windows_days)[None, :]
+    one_hot = np.eye(len(STATUSES), dtype=np.int64)[columns.status]
+    return in_window.T.astype(np.int64) @ one_hot
+
+
+def weekly_series(columns: ApplicationColumns, today: date, weeks: int) -> np.ndarray:
+    """
+    Per-week status counts, most recent week first.
+
+    Returns:
+        ndarray: shape (weeks, len(STATUSES))
+    """
+    age = columns.age_days(today)
+    mask = age < weeks * 7
+    week = age[mask] // 7
+    flat = week * len(STATUSES) + columns.status[mask]
+    counts = np.bincount(flat, minlength=weeks * len(STATUSES))
+    return counts.reshape(weeks, len(STATUSES))
+
+
+def funnel(counts: np.ndarray) -> Dict[str, int]:
+    """
+    Entries that reached at least each pipeline stage, from status counts.
+
+    Only the current status is stored, so a rejected entry counts as
+    having reached "Applied" and nothing further.
+    """
+    stages = counts[: len(FUNNEL_STAGES)]
+    reached = np.cumsum(stages[::-1])[::-1]
+    reached[0] += counts[REJECTED]
+    return {stage: int(n) for stage, n in zip(FUNNEL_STAGES, reached)}
+
+
+def aggregate_trends(records: Sequence[Any], today: date, days: int = 7) -> Dict[str, Any]:
+    """
+    Counts for the requested period and every TREND_WINDOWS_WEEKS window,
+    weekly series over the longest window, and funnels with conversion rates.
+
+    Args:
+        records: Decoded JobRecords covering at least the longest window
+        today: Reference date for the windows
+        days: Length of the report period
+
+    Returns:
+        dict: period, windows, weekly series and funnels keyed by window label
+    """
+    columns = ApplicationColumns(records)
+    labels = [f"{days}d"] + [f"{w}w" for w in TREND_WINDOWS_WEEKS]
+    # Every window of N days is today plus the N - 1 days before it
+    windows_days = [days] + [w * 7 for w in TREND_WINDOWS_WEEKS]
+    counts = window_counts(columns, today, windows_days)
+
+    windows = {}
+    for label, row in zip(labels, counts):
+        stats = {status.lower(): int(n) for status, n in zip(STATUSES, row)}
+        stats["total"] = int(row.sum())
+        reached = funnel(row)
+        applied = reached["Applied"]
+        stats["funnel"] = reached
+        stats["conversion"] = {
+            stage: round(100 * n / applied, 1) if applied else 0.0
+            for stage, n in reached.items()
+        }
+        windows[label] = stats
+
+    longest = max(TREND_WINDOWS_WEEKS)
+    series = weekly_series(columns, today, longest)
+    return {
+        "period": labels[0],
+        "windows": windows,
+        "weekly_totals": series.sum(axis=1).tolist(),
+        "weekly_interviews": series[:, STATUSES.index("Interview")].tolist(),
+    }
+
+
+def format_trends_for_llm(trends: Dict[str, Any]) -> str:
+    """Render aggregate_trends output as a few compact prompt lines."""
+    if not trends or not trends.get("windows"):
+        return "No trend data available."
+
+    lines = []
+    for label, stats in trends["windows"].items():
+        conv = stats["conversion"]
+        lines.append(
+            f"- Last {label}: {stats['total']} applications, "
+            f"{stats['interview']} interviews, {stats['offer']} offers, "
+            f"{stats['rejected']} rejections; reached assessment {conv['Assessment']}%, "
+            f"interview {conv['Interview']}%, offer {conv['Offer']}%"
+        )
+    totals = trends.get("weekly_totals") or []
+    if totals:
+        oldest_first = ", ".join(str(n) for n in reversed(totals))
+        lines.append(f"- Applications per week (oldest to newest): {oldest_first}")
+    return "\n".join(lines)
@@ -13,7 +13,9 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 # Import shared modules
 from shared.models import EmailData, JobApplicationData
 from shared.utils import get_llm_config
+from shared.projection import project_pages_for_llm
 from shared.config import validate_config
+from shared.llm_usage import LLMUsageTracker, UsageCallbackHandler, LLMBudgetExceeded
 
 # Try to import debug tool (optional)
 try:
@@ -29,8 +31,13 @@ validate_config()
 
 class JobSyncWorkflow:
     def __init__(self):
+        # Track token usage and enforce run budgets on every LLM call
+        self.usage = LLMUsageTracker("job_sync")
+
         # Initialize LLM with shared configuration
-        self.llm = get_llm_config()
+        self.llm = get_llm_config(
+            callbacks=[UsageCallbackHandler(self.usage, default_stage="agent")]
+        )
 
         # Create MCP tools for LLM
         self.tools = self._create_mcp_tools()
@@ -139,7 +146,10 @@ class JobSyncWorkflow:
     def _call_notion_search(self, company: str = "", job_title: str = "") -> str:
         """Call Notion MCP to search for similar entries"""
         try:
-            from agent.notion_utils import find_entry_by_company_title
+            from agent.notion_utils import (
+                find_entry_by_company_title,
+                find_possible_duplicates,
+            )
 
             # Search for existing entry
             existing = find_entry_by_company_title(company, job_title)
@@ -147,8 +157,18 @@ class JobSyncWorkflow:
             if existing:
                 props = existing.get("properties", {})
                 return f"Found existing entry: {company} - {job_title} (ID: {existing['id']})"
-            else:
-                return f"No existing entry found for {company} - {job_title}"
+            similar = find_possible_duplicates(company, job_title)
+            if similar:
+                lines = [
+                    f"- {e['company']} - {e['job_title']} (ID: {e['id']}, status: {e['status']})"
+                    for e in similar
+                ]
+                return (
+                    f"No exact entry for {company} - {job_title}. Possible duplicates "
+                    "(update one only if it is the same application):\n"
+                    + "\n".join(lines)
+                )
+            return f"No existing entry found for {company} - {job_title}"
 
         except Exception as e:
             return f"Error searching entries: {str(e)}"
@@ -208,7 +228,7 @@ class JobSyncWorkflow:
         try:
             from agent.notion_utils import update_entry
 
-            result = update_entry(entry_id, status)
+            result = update_entry(entry_id, status, notes)
 
             if result:
                 return f"Updated entry {entry_id} with status: {status}"
@@ -228,9 +248,11 @@ class JobSyncWorkflow:
                 days = int(days)
 
             entries = query_recent_entries(days)
+            text, stats = project_pages_for_llm(entries)
             return (
-                f"Retrieved {len(entries)} recent entries from database:\n"
-                + json.dumps(entries, indent=2)
+                f"Retrieved {len(entries)} recent entries from database "
+                f"(~{stats['compact_tokens']} tokens, {stats['saved_pct']}% smaller than raw):\n"
+                + text
             )
 
         except Exception as e:
@@ -245,6 +267,22 @@ class JobSyncWorkflow:
             print("Starting JobSync with LLM + MCP tools...")
 
         try:
+            # Mirror the job database once so duplicate checks cost no API calls
+            from agent.notion_utils import (
+                load_run_index,
+                replay_outbox,
+                start_write_buffer,
+            )
+
+            load_run_index()
+
+            # Coalesce several emails about one application into one update
+            start_write_buffer()
+
+            # Finish writes a previous run logged but never got through,
+            # without re-running the LLM extraction that produced them
+            replay_outbox()
+
             # Let the LLM agent handle everything
             prompt = "Process recent job application emails and manage duplicates in the Notion database"
             
@@ -264,6 +302,12 @@ class JobSyncWorkflow:
             
             return result
 
+        except LLMBudgetExceeded as e:
+            # No deterministic extractor exists for raw emails, so stop cleanly;
+            # entries already written stay, the rest are picked up next run
+            print(f"[BUDGET] {e}. Stopping agent without further LLM calls.")
+            return None
+
         except Exception as e:
             error_msg = f"Error: {e}"
             if DEBUG_MODE:
@@ -275,6 +319,21 @@ class JobSyncWorkflow:
                 traceback.print_exc()
             return None
 
+        finally:
+            from agent.notion_utils import (
+                clear_run_index,
+                compact_outbox,
+                flush_write_buffer,
+            )
+            from agent.notion_rate_limit import notion_limiter
+
+            flush_write_buffer()
+            compact_outbox()
+            clear_run_index()
+            notion_limiter.print_summary()
+            self.usage.print_summary()
+            self.usage.write_artifact()
+
 
 # Usage
 async def main():
@@ -3,6 +3,7 @@ from langgraph.graph import StateGraph, END
 import os
 import sys
 import json
+import asyncio
 from datetime import datetime, timedelta
 
 # Add parent directory to path for imports
@@ -13,10 +14,18 @@ from shared.models import WeeklyReportData, WeeklyReportState
 from shared.utils import (
     get_llm_config_creative,
     format_entries_for_llm,
+    chunk_entries_by_tokens,
     format_deadlines_for_llm,
     generate_week_range,
 )
-from shared.config import validate_config
+from shared.config import (
+    validate_config,
+    WEEKLY_SUMMARY_MODE,
+    WEEKLY_SUMMARY_CHUNK_TOKENS,
+    WEEKLY_SUMMARY_MAP_CONCURRENCY,
+)
+from shared.weekly_stats import format_trends_for_llm
+from shared.llm_usage import LLMUsageTracker, UsageCallbackHandler, LLMBudgetExceeded
 
 # Validate configuration
 validate_config()
@@ -24,8 +33,13 @@ validate_config()
 
 class WeeklyReportWorkflow:
     def __init__(self):
+        # Track token usage and enforce run budgets on every LLM call
+        self.usage = LLMUsageTracker("weekly_report")
+
         # Initialize LLM with shared configuration
-        self.llm = get_llm_config_creative()
+        self.llm = get_llm_config_creative(
+            callbacks=[UsageCallbackHandler(self.usage, default_stage="summary")]
+        )
 
         # Create the workflow graph
         self.workflow = self._create_workflow()
@@ -73,6 +87,7 @@ class WeeklyReportWorkflow:
                 rejected=data.get("rejected", 0),
                 deadlines=data.get("deadlines", []),
                 entries=data.get("entries", []),
+                trends=data.get("trends", {}),
             )
 
             print(f"[FETCH] Retrieved {report_data.total} total applications")
@@ -105,15 +120,108 @@ class WeeklyReportWorkflow:
 
             print(f"[SUMMARY] Generating AI summary for {days} days...")
 
-            # Format entries for LLM using shared utilities
-            entries_text = format_entries_for_llm(report_data.entries)
+            # Format deadlines for LLM using shared utilities
             deadlines_text = format_deadlines_for_llm(report_data.deadlines)
 
             # Generate week range using shared utility
             week_range = generate_week_range(days)
 
-            # Create prompt
+            # Generate summary with retry logic, degrading to a template when
+            # the LLM budget for this run is already used up
+            budget_reason = self.usage.budget_exhausted()
+            if budget_reason:
+                print(f"[BUDGET] {budget_reason}. Using deterministic summary.")
+                summary = self._deterministic_summary(report_data, days)
+            else:
+                summary = await self._summarize(report_data, days, deadlines_text)
+                if not summary and self.usage.budget_exhausted():
+                    summary = self._deterministic_summary(report_data, days)
+
+            if summary:
+                print("[SUMMARY] Successfully generated AI summary")
+                return {**state, "summary": summary, "week_range": week_range}
+            else:
+                print("[ERROR] Failed to generate summary")
+                return {**state, "errors": ["Failed to generate summary"]}
+
+        except Exception as e:
+            print(f"[ERROR] Summary generation failed: {str(e)}")
+            return {**state, "errors": [f"Summary generation failed: {str(e)}"]}
+
+    async def _summarize(
+        self, report_data: WeeklyReportData, days: int, deadlines_text: str
+    ) -> Optional[str]:
+        """Summarize in one call, or map-reduce when entries exceed one chunk"""
+        chunks = chunk_entries_by_tokens(
+            report_data.entries, WEEKLY_SUMMARY_CHUNK_TOKENS
+        )
+
+        if WEEKLY_SUMMARY_MODE == "single" or (
+            WEEKLY_SUMMARY_MODE == "auto" and len(chunks) <= 1
+        ):
+            limit = 10 if WEEKLY_SUMMARY_MODE == "single" else None
+            entries_text = format_entries_for_llm(report_data.entries, limit=limit)
+            prompt = self._build_summary_prompt(
+                report_data, days, entries_text, deadlines_text
+            )
+            return await self._llm_generate_summary(prompt)
+
+        # MAP: summarize chunks concurrently so latency stays near one call
+        print(
+            f"[SUMMARY] Map-reduce over {len(report_data.entries)} entries "
+            f"in {len(chunks)} chunks..."
+        )
+        semaphore = asyncio.Semaphore(WEEKLY_SUMMARY_MAP_CONCURRENCY)
+
+        async def map_chunk(chunk: List[Dict[str, str]], start: int) -> str:
             prompt = f"""
+            Summarize these job applications as 3-5 terse facts for a weekly report:
+            notable companies and roles, status changes (interviews, offers, rejections),
+            and any deadlines or action items. Plain text, no preamble.
+
+            {format_entries_for_llm(chunk, limit=None, start=start)}
+            """
+            async with semaphore:
+                partial = await self._llm_generate_summary(prompt, stage="map")
+            return partial or self._chunk_digest(chunk)
+
+        starts, offset = [], 1
+        for chunk in chunks:
+            starts.append(offset)
+            offset += len(chunk)
+        partials = await asyncio.gather(
+            *(map_chunk(chunk, start) for chunk, start in zip(chunks, starts))
+        )
+
+        # REDUCE: final 5 bullets from the statistics plus chunk summaries
+        entries_text = "\n".join(
+            f"Batch {i} ({len(chunk)} applications):\n{partial}\n"
+            for i, (chunk, partial) in enumerate(zip(chunks, partials), 1)
+        )
+        prompt = self._build_summary_prompt(
+            report_data, days, entries_text, deadlines_text
+        )
+        return await self._llm_generate_summary(prompt, stage="reduce")
+
+    def _chunk_digest(self, chunk: List[Dict[str, str]]) -> str:
+        """Deterministic stand-in for a chunk whose map call failed"""
+        counts: Dict[str, int] = {}
+        for entry in chunk:
+            status = entry.get("status", "Applied")
+            counts[status] = counts.get(status, 0) + 1
+        companies = ", ".join(sorted({e.get("company", "Unknown") for e in chunk}))
+        statuses = ", ".join(f"{n} {status}" for status, n in counts.items())
+        return f"{statuses}. Companies: {companies}"
+
+    def _build_summary_prompt(
+        self,
+        report_data: WeeklyReportData,
+        days: int,
+        entries_text: str,
+        deadlines_text: str,
+    ) -> str:
+        """Build the final 5-bullet summary prompt"""
+        return f"""
             You are a career coach analyzing job application activity for the past week.
 
             Given the following data from the past {days} days:
@@ -126,6 +234,9 @@ class WeeklyReportWorkflow:
             - Offers: {report_data.offer}
             - Rejections: {report_data.rejected}
 
+            **Trends (1, 4 and 12 weeks, funnel reach rates):**
+            {format_trends_for_llm(report_data.trends)}
+
             **Recent Applications:**
             {entries_text}
 
@@ -137,7 +248,7 @@ class WeeklyReportWorkflow:
 
             **Include:**
             1. Weekly statistics and highlights (e.g., "Applied to X roles, Y interviews scheduled")
-            2. Key updates or notable changes (e.g., "3 rejections but 2 new interviews")
+            2. Key updates or notable changes, compared with the 4 and 12 week trends (e.g., "3 rejections but 2 new interviews")
             3. Upcoming deadlines or action items (if any)
             4. Progress assessment (e.g., "Strong week with X% interview conversion")
             5. Recommendations or sentiment (e.g., "Focus on following up with pending applications")
@@ -147,21 +258,9 @@ class WeeklyReportWorkflow:
             Keep each point to 1-2 sentences maximum.
             """
 
-            # Generate summary with retry logic
-            summary = await self._llm_generate_summary(prompt)
-
-            if summary:
-                print("[SUMMARY] Successfully generated AI summary")
-                return {**state, "summary": summary, "week_range": week_range}
-            else:
-                print("[ERROR] Failed to generate summary")
-                return {**state, "errors": ["Failed to generate summary"]}
-
-        except Exception as e:
-            print(f"[ERROR] Summary generation failed: {str(e)}")
-            return {**state, "errors": [f"Summary generation failed: {str(e)}"]}
-
-    async def _llm_generate_summary(self, prompt: str) -> Optional[str]:
+    async def _llm_generate_summary(
+        self, prompt: str, stage: str = "summary"
+    ) -> Optional[str]:
         """Generate summary with retry logic"""
         max_retries = 3
         retry_delay = 10
@@ -169,19 +268,23 @@ class WeeklyReportWorkflow:
         for attempt in range(max_retries):
             try:
                 print(
-                    f"[LLM] Generating summary (attempt {attempt + 1}/{max_retries})..."
+                    f"[LLM] Generating {stage} (attempt {attempt + 1}/{max_retries})..."
+                )
+                result = await self.llm.ainvoke(
+                    prompt, config={"metadata": {"stage": stage}}
                 )
-                result = self.llm.invoke(prompt)
                 return result.content.strip()
 
+            except LLMBudgetExceeded as e:
+                print(f"[BUDGET] {e}")
+                return None
+
             except Exception as e:
                 if "rate limit" in str(e).lower() or "429" in str(e):
                     if attempt < max_retries - 1:
                         print(
                             f"[RATE LIMIT] Attempt {attempt + 1}/{max_retries} failed. Retrying in {retry_delay}s..."
                         )
-                        import asyncio
-
                         await asyncio.sleep(retry_delay)
                         retry_delay *= 2  # Exponential backoff
                         continue
@@ -194,6 +297,32 @@ class WeeklyReportWorkflow:
 
         return None
 
+    def _deterministic_summary(self, report_data: WeeklyReportData, days: int) -> str:
+        """Build a 5-bullet summary from the statistics alone (no LLM call)"""
+        total = report_data.total
+        responses = report_data.interview + report_data.assessment + report_data.offer
+        response_rate = round(100 * responses / total) if total else 0
+        four_weeks = report_data.trends.get("windows", {}).get("4w")
+        weekly_avg = round(four_weeks["total"] / 4, 1) if four_weeks else 0
+
+        bullets = [
+            f"📊 Tracked {total} applications in the past {days} days "
+            f"({report_data.applied} applied, {report_data.interview} interviews, "
+            f"{report_data.assessment} assessments).",
+            f"🔄 {report_data.offer} offers and {report_data.rejected} rejections this period"
+            + (f" ({weekly_avg:g} applications/week over the last 4 weeks)." if four_weeks else "."),
+            (
+                f"⏰ {len(report_data.deadlines)} upcoming deadlines, next: "
+                f"{report_data.deadlines[0].get('company', 'Unknown')} "
+                f"on {report_data.deadlines[0].get('due', 'an unknown date')}."
+                if report_data.deadlines
+                else "⏰ No upcoming deadlines found in application notes."
+            ),
+            f"📈 {response_rate}% of applications progressed past the initial stage.",
+            "🎯 Follow up on pending applications and prepare for upcoming interviews.",
+        ]
+        return "\n".join(f"- {b}" for b in bullets)
+
     async def _create_report_node(self, state: WeeklyReportState) -> WeeklyReportState:
         """Create weekly report in Notion"""
         from agent.notion_utils import create_weekly_report
@@ -246,7 +375,14 @@ class WeeklyReportWorkflow:
             }
 
         print(f"🚀 Starting Weekly Report workflow for {days} days...")
-        result = await self.workflow.ainvoke(initial_state)
+        try:
+            result = await self.workflow.ainvoke(initial_state)
+        finally:
+            from agent.notion_rate_limit import notion_limiter
+
+            notion_limiter.print_summary()
+            self.usage.print_summary()
+            self.usage.write_artifact()
 
         print(f"\n✅ Weekly Report workflow completed!")
         if result.get("report_data"):